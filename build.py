@@ -13,98 +13,69 @@ from matplotlib.pyplot import figure
 import seaborn as sns
 import itertools
 import pickle
+import argparse
+import os
+from hackasack import aggregates, batch_scoring, dependence, encoders, feature_schema, fronts, pipeline, schema
+from hackasack.manifest import Manifest, file_digest
 warnings.filterwarnings('ignore')
 
-games = pd.read_csv('bdb-datasets/games.csv')
-players = pd.read_csv('bdb-datasets/players.csv')
-pff = pd.read_csv('bdb-datasets/pffScoutingData.csv')
-plays = pd.read_csv('bdb-datasets/plays.csv')
-week1 = pd.read_csv('bdb-datasets/week1.csv')
-week2 = pd.read_csv('bdb-datasets/week2.csv')
-week3 = pd.read_csv('bdb-datasets/week3.csv')
-week4 = pd.read_csv('bdb-datasets/week4.csv')
-week5 = pd.read_csv('bdb-datasets/week5.csv')
-week6 = pd.read_csv('bdb-datasets/week6.csv')
-week7 = pd.read_csv('bdb-datasets/week7.csv')
-week8 = pd.read_csv('bdb-datasets/week8.csv')
-
-df = pd.concat([week1, week2, week3, week4, week5, week6, week7, week8])
-
-ball_snaps = df[(df['event'] == 'ball_snap')]
-
-ball_loc = ball_snaps[(ball_snaps['team'] == 'football')][['gameId', 'playId', 'x', 'y']].rename(columns = {'x': 'ball_x', 'y': 'ball_y'})
-ball_snaps = pd.merge(ball_snaps, ball_loc, on = ['gameId', 'playId'])
-
-ball_snaps_right = ball_snaps[(ball_snaps['playDirection'] == 'right')]
-ball_snaps_right['rel_x'] = ball_snaps_right['x'] - ball_snaps_right['ball_x']
-ball_snaps_right['rel_y'] = (ball_snaps_right['y'] - ball_snaps_right['ball_y'])
-
-ball_snaps_left = ball_snaps[(ball_snaps['playDirection'] == 'left')]
-ball_snaps_left['rel_x'] = (120 - ball_snaps_left['x']) - (120 - ball_snaps_left['ball_x'])
-ball_snaps_left['rel_y'] = (53.33 - ball_snaps_left['y']) - (53.33 - ball_snaps_left['ball_y'])
+parser = argparse.ArgumentParser(description='Build snap-time defender features and train the sack model')
+parser.add_argument('--data-dir', default='bdb-datasets')
+parser.add_argument('--weeks', type=int, nargs='+', default=list(range(1, 9)))
+parser.add_argument('--source', choices=['csv', 'parquet', 'stream', 'memmap'], default='csv',
+                    help='parquet converts the weekly csvs once into --cache-dir and scans that afterwards, '
+                         'stream reads the csvs in --chunksize row chunks and keeps only the snap frames, '
+                         'memmap converts them once into the binary frame store in --store-dir')
+parser.add_argument('--cache-dir', default='bdb-cache/tracking')
+parser.add_argument('--store-dir', default='bdb-cache/frames')
+parser.add_argument('--chunksize', type=int, default=500000)
+parser.add_argument('--incremental', action='store_true',
+                    help='reuse per-week snap and feature artifacts whose input hashes are unchanged')
+parser.add_argument('--manifest', default='bdb-cache/manifest.json')
+parser.add_argument('--workers', type=int, default=1, help='build the per-week features in this many processes')
+parser.add_argument('--save-model', metavar='PATH',
+                    help='save the model to PATH with its feature schema (PATH.schema.json) and feature_importance.csv')
+parser.add_argument('--score', metavar='MODEL',
+                    help='score every row of sacks_df with MODEL (e.g. xgb_sack) and write sacks_preds.parquet/.csv')
+parser.add_argument('--contribs', action='store_true',
+                    help='with --score, also write the TreeSHAP contributions behind every prediction to sacks_contribs.parquet')
+parser.add_argument('--preds-dir', default='datasets')
+parser.add_argument('--pdp', nargs='+', metavar='FEATURE',
+                    help="with --score, partial dependence and ICE curves of these model features ('all' for every "
+                         "numeric one) over a sample of sacks_df, written to dependence.csv and dependence_ice.parquet")
+parser.add_argument('--pdp-rows', type=int, default=dependence.BACKGROUND_ROWS, help='background rows per curve')
+parser.add_argument('--pdp-points', type=int, default=dependence.GRID_POINTS, help='grid values per feature')
+parser.add_argument('--pdp-dir', default='bdb-cache/dependence', help='curves cached per model version')
+parser.add_argument('--score-chunksize', type=int, default=batch_scoring.CHUNK_ROWS)
+parser.add_argument('--score-threads', type=int, default=os.cpu_count(), help='booster threads for --score')
+parser.add_argument('--aggregates-dir', default='bdb-cache/aggregates',
+                    help='where --score keeps the per week, player and team expected vs actual sack partials')
+args = parser.parse_args()
+
+games = schema.read_csv(f'{args.data_dir}/games.csv', 'games')
+players = schema.read_csv(f'{args.data_dir}/players.csv', 'players', 'features', report=True)
+pff = schema.read_csv(f'{args.data_dir}/pffScoutingData.csv', 'pff', 'features', report=True)
+plays = schema.read_csv(f'{args.data_dir}/plays.csv', 'plays', 'features', report=True)
 
 players_select = players[['nflId','officialPosition']]
 
-ball_snaps_rel = pd.merge(pd.concat([ball_snaps_right, ball_snaps_left], axis=0), players_select, on = 'nflId')
-
-oline = ball_snaps_rel[(ball_snaps_rel['officialPosition'].isin(['T', 'G', 'C']))]
-def maxmin(x):
-  mx = x.rel_y.max()
-  mn = x.rel_y.min()
-  return pd.Series({'oline_min': mn, 'oline_max': mx})
-oline_min_max = oline.groupby(['gameId', 'playId']).apply(maxmin).reset_index()
-oline_min_max['oline_width'] = oline_min_max['oline_max'] - oline_min_max['oline_min']
-
-ball_snaps_rel = pd.merge(ball_snaps_rel, oline_min_max, on = ['gameId', 'playId'])
-
-qb_x_y = ball_snaps_rel[(ball_snaps_rel['officialPosition'] == 'QB')].rename(columns = {'rel_x' : 'qb_rel_x', 'rel_y': 'qb_rel_y'})[['gameId', 'playId', 'x', 'y', 'ball_x', 'ball_y', 'team', 'qb_rel_x', 'qb_rel_y']]
-num_qbs = ball_snaps_rel[(ball_snaps_rel['officialPosition'] == 'QB')].groupby(['gameId', 'playId']).count().reset_index().rename(columns = {'officialPosition' : 'num_qbs'})[['gameId', 'playId', 'num_qbs']]
-
-qb_x_y = pd.merge(qb_x_y, num_qbs, on = ['gameId', 'playId'])
-
-qb_x_y_one_qb = qb_x_y[(qb_x_y['num_qbs'] == 1)].drop('num_qbs', axis = 1)
+manifest, players_key = None, ''
+if args.incremental:
+    os.makedirs(os.path.dirname(args.manifest) or '.', exist_ok=True)
+    manifest = Manifest(args.manifest)
+    players_key = manifest.file_hash(f'{args.data_dir}/players.csv')
 
-qb_x_y_two_qbs = qb_x_y[(qb_x_y['num_qbs'] == 2)]
+defense_keep = pipeline.build_weeks(args.weeks, players_select, workers=args.workers, manifest=manifest,
+                                    players_key=players_key, source=args.source,
+                                    data_dir=args.data_dir, cache_dir=args.cache_dir, chunksize=args.chunksize,
+                                    store_dir=args.store_dir)
 
-qb_x_y_two_qbs['y_diff'] = abs(qb_x_y_two_qbs['y'] - qb_x_y_two_qbs['ball_y'])
-
-two_qbs_keep = qb_x_y_two_qbs.loc[qb_x_y_two_qbs.groupby(['gameId', 'playId']).y_diff.idxmin()].drop(['y_diff', 'num_qbs'], axis = 1)
-
-qb_x_y = pd.concat([qb_x_y_one_qb, two_qbs_keep])
-qb_x_y['qb_dist_from_ball'] = np.sqrt(np.square(qb_x_y['x'] - qb_x_y['ball_x'])  + np.square(qb_x_y['y'] - qb_x_y['ball_y']))
-
-qb_x_y = qb_x_y.rename(columns = {'x': 'qb_x', 'y': 'qb_y', 'team': 'qb_team'})[['gameId', 'playId', 'qb_x', 'qb_y', 'qb_dist_from_ball', "qb_team", "qb_rel_x", "qb_rel_y"]]
-
-all_dist_prep = pd.merge(ball_snaps_rel, qb_x_y, on = ['gameId', 'playId'])
-
-defense_x_y = all_dist_prep[(all_dist_prep['team'] != all_dist_prep['qb_team'])]
-defense_x_y['dist_from_qb'] = np.sqrt(np.square(defense_x_y['x'] - defense_x_y['qb_x'])  + np.square(defense_x_y['y'] - defense_x_y['qb_y']))
-
-defense_keep = defense_x_y[['gameId', 'playId', 'nflId', 'rel_x', 'rel_y', 's', 'a', 
-             'dir', 'o', 'ball_x', 'ball_y', 'officialPosition',
-             'oline_min', 'oline_max', 'oline_width', 'qb_dist_from_ball',
-             'qb_rel_x', 'qb_rel_y', 'dist_from_qb']]
-
-def replace_pos(x):
-    pos=x['officialPosition']
-    if pos in ['DB', 'RB', 'G', 'LB']:
-        return 'Other'
-    else:
-      return pos
-
-defense_keep['officialPosition']=defense_keep.apply(replace_pos, axis=1)  
+defense_keep['officialPosition'] = encoders.group_positions(defense_keep['officialPosition'])
 
 plays_select = plays[['gameId', 'playId', 'down', 'yardsToGo', 'absoluteYardlineNumber', 'offenseFormation', 'personnelO', 'defendersInBox', 'personnelD']]
 plays_select = plays_select[(plays['down'] != 0)][['gameId', 'playId', 'down', 'yardsToGo', 'absoluteYardlineNumber', 'offenseFormation', 'personnelO', 'defendersInBox', 'personnelD']]
-plays_select[['num_rb', 'num_te', 'num_wr']] = plays_select['personnelO'].str.split(', ', 2, expand=True)
-plays_select['num_rb'] = (plays_select['num_rb'].str[:1]).fillna(0).astype(int)
-plays_select['num_te'] = (plays_select['num_te'].str[:1]).fillna(0).astype(int)
-plays_select['num_wr'] = (plays_select['num_wr'].str[:1]).fillna(0).astype(int)
-
-plays_select[['num_dl', 'num_lb', 'num_db']] = plays_select['personnelD'].str.split(', ', 2, expand=True)
-plays_select['num_dl'] = (plays_select['num_dl'].str[:1]).fillna(0).astype(int)
-plays_select['num_lb'] = (plays_select['num_lb'].str[:1]).fillna(0).astype(int)
-plays_select['num_db'] = (plays_select['num_db'].str[:1]).fillna(0).astype(int)
+plays_select[['num_rb', 'num_te', 'num_wr']] = encoders.parse_personnel(plays_select['personnelO'], ['num_rb', 'num_te', 'num_wr'])
+plays_select[['num_dl', 'num_lb', 'num_db']] = encoders.parse_personnel(plays_select['personnelD'], ['num_dl', 'num_lb', 'num_db'])
 
 plays_select.drop(columns = ['personnelO', 'personnelD'], inplace = True)
 
@@ -118,7 +89,9 @@ sacks_df = pd.merge(sacks_plays_joined, defense_keep, on = ['gameId', 'playId',
 sacks_df = sacks_df[(sacks_df['officialPosition'] != 'Other')]
 
 sacks_plays_joined_no_ids = sacks_df.drop(columns = ['gameId', 'playId', 'nflId', 'dir', 'o'])
-sacks_plays_joined_no_ids = pd.get_dummies(sacks_plays_joined_no_ids, columns = ['down', 'officialPosition', 'offenseFormation'])
+sacks_plays_joined_no_ids['offenseFormation'] = sacks_plays_joined_no_ids['offenseFormation'].cat.remove_unused_categories()
+categorical = {column: sacks_plays_joined_no_ids[column] for column in ['down', 'officialPosition', 'offenseFormation']}
+sacks_plays_joined_no_ids = pd.get_dummies(sacks_plays_joined_no_ids, columns = list(categorical))
 
 sss = StratifiedShuffleSplit(n_splits=1, test_size=0.25, random_state=42)
 for train_index, test_index in sss.split(sacks_plays_joined_no_ids, sacks_plays_joined_no_ids['pff_sack']):
@@ -176,7 +149,39 @@ print('Brier Score: ', brier_score_loss(Y_test, XGB_pred))
 sorted_idx = XGB.feature_importances_.argsort()
 feature_importance = pd.DataFrame(X_train.columns[sorted_idx], XGB.feature_importances_[sorted_idx])
 
-# XGB.save_model('xgb_sack')
-# feature_importance.to_csv('feature_importance.csv')
-# sacks_preds.to_csv('sacks_preds.csv')
+if args.save_model:
+    XGB.get_booster().save_model(args.save_model)
+    feature_schema.save(feature_schema.infer(X_train, categorical), feature_schema.schema_path(args.save_model))
+    feature_importance.to_csv('feature_importance.csv')
+
+if args.score:
+    booster, booster_schema = feature_schema.load_model(args.score, {'nthread': args.score_threads})
+    preds, weeks = batch_scoring.score_season(sacks_df, booster, booster_schema, games, args.score_chunksize,
+                                              manifest=manifest, model_key=file_digest(args.score))
+    sacks_preds = batch_scoring.sacks_preds(sacks_df, preds, weeks,
+                                            schema.read_csv(f'{args.data_dir}/players.csv', 'players', 'scoring'),
+                                            schema.read_csv(f'{args.data_dir}/plays.csv', 'plays', 'scoring'))
+    batch_scoring.write(sacks_preds, args.preds_dir)
+    if args.contribs:
+        contribs = batch_scoring.explain_season(sacks_df, booster, booster_schema, games, args.score_chunksize,
+                                                manifest=manifest, model_key=file_digest(args.score))
+        batch_scoring.sacks_contribs(sacks_preds, contribs, booster_schema).to_parquet(
+            f'{args.preds_dir}/sacks_contribs.parquet', index=False)
+
+    if args.pdp:
+        # One single-threaded booster per predict, so the sweep's chunks run side by side
+        pdp_booster, _ = feature_schema.load_model(args.score, {'nthread': 1})
+        features = dependence.numeric_features(booster_schema) if args.pdp == ['all'] else args.pdp
+        X = fronts.feature_matrix(batch_scoring.feature_columns(sacks_df), booster_schema)
+        sweeps = dependence.curves(pdp_booster, booster_schema, X, features, file_digest(args.score), args.pdp_dir,
+                                   args.pdp_points, args.pdp_rows, chunk_rows=args.score_chunksize,
+                                   threads=args.score_threads)
+        dependence.summarize(sweeps).to_csv(f'{args.preds_dir}/dependence.csv', index=False)
+        dependence.ice_frame(sweeps).to_parquet(f'{args.preds_dir}/dependence_ice.parquet', index=False)
+
+    season = aggregates.SackAggregates(args.aggregates_dir)
+    print(f'aggregated weeks {season.update(sacks_preds)}')
+    season.save()
+    for level in aggregates.LEVELS:
+        season.totals(level).to_csv(f'{args.preds_dir}/sacks_oe_{level}.csv', index=False)
 
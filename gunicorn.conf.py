@@ -0,0 +1,38 @@
+# Multi-worker serving of the dashboard: gunicorn main:server (picks this file up by default)
+#
+# The app and the booster are loaded once in the master and the workers fork from it, so
+# the model pages are shared copy-on-write. Each worker gets cores // workers booster
+# threads instead of a fixed 8, so the box isn't oversubscribed.
+import os
+
+bind = os.environ.get('HACKASACK_BIND', '0.0.0.0:8050')
+
+
+def cores():
+    try:
+        return len(os.sched_getaffinity(0))
+    except AttributeError:
+        return os.cpu_count() or 1
+
+
+workers = int(os.environ.get('WEB_CONCURRENCY', cores()))
+threads = int(os.environ.get('HACKASACK_WORKER_THREADS', 1))
+preload_app = True
+
+# Read by main.py when the master preloads it
+os.environ.setdefault('HACKASACK_NTHREAD', str(max(1, cores() // (workers * threads))))
+os.environ['HACKASACK_PREFORK'] = '1'
+
+
+def when_ready(server):
+    # Runs in the master after the preload and before the first fork; loading the booster
+    # doesn't start any OpenMP threads, predicting would
+    import main
+    main.get_model()
+    server.log.info('xgb_sack loaded before fork, %s booster thread(s) per worker', main.NTHREAD)
+
+
+def post_fork(server, worker):
+    import main
+    if main.WARMUP:
+        main.start_warm_up()
@@ -0,0 +1,89 @@
+import json
+import os
+
+import pandas as pd
+
+from hackasack.batch_scoring import rows_hash
+
+# Expected vs actual sacks as mergeable partial aggregates: sums of snaps, pff_sack and
+# sack_pred per week, player and defensive team. Partials add up key by key, so the player,
+# team and week totals are rollups of one small table, a new or rescored week only replaces
+# its own partial, and rescoring a subset of rows applies new minus old.
+
+KEYS = ['week', 'nflId', 'displayName', 'officialPosition', 'defensiveTeam']
+SUMS = ['snaps', 'sacks', 'exp_sacks']
+SUM_DTYPES = {'snaps': 'int64', 'sacks': 'float64', 'exp_sacks': 'float64'}
+
+LEVELS = {
+    'players': ['nflId', 'displayName', 'officialPosition'],
+    'teams': ['defensiveTeam'],
+    'weeks': ['week'],
+}
+
+
+def partial(preds, sign=1):
+    # preds is sacks_preds (or any subset of its rows)
+    rows = preds[KEYS].astype({key: object for key in KEYS if key not in ('week', 'nflId')})
+    rows = rows.assign(snaps=sign, sacks=sign * preds['pff_sack'].astype('float64'),
+                       exp_sacks=sign * preds['sack_pred'].astype('float64'))
+    return rows.groupby(KEYS, dropna=False, sort=False)[SUMS].sum().reset_index()
+
+
+def merge(*partials):
+    merged = pd.concat(partials, ignore_index=True).groupby(KEYS, dropna=False)[SUMS].sum().reset_index()
+    merged = merged.astype(SUM_DTYPES)
+    return merged[merged['snaps'] != 0].reset_index(drop=True)
+
+
+def rollup(partials, level):
+    totals = partials.groupby(LEVELS[level], dropna=False)[SUMS].sum().reset_index()
+    totals['sacks_oe'] = totals['sacks'] - totals['exp_sacks']
+    for column in ['sacks', 'exp_sacks', 'sacks_oe']:
+        totals[f'{column}_per_snap'] = totals[column] / totals['snaps']
+    return totals
+
+
+class SackAggregates:
+    # The season's partials plus a hash of the rows each week was aggregated from, kept in
+    # `root` between runs
+
+    def __init__(self, root):
+        self.root = root
+        self.partials = pd.DataFrame({column: pd.Series(dtype=SUM_DTYPES.get(column, object)) for column in KEYS + SUMS})
+        self.weeks = {}
+        if os.path.exists(os.path.join(root, 'partials.parquet')):
+            self.partials = pd.read_parquet(os.path.join(root, 'partials.parquet'))
+            with open(os.path.join(root, 'weeks.json')) as f:
+                self.weeks = json.load(f)
+
+    def update(self, preds):
+        # Re-aggregates only the weeks of preds whose rows changed and drops the weeks preds
+        # no longer has, so the totals always cover exactly its rows; returns the changed weeks
+        weeks = set(preds['week'].astype(int))
+        self.partials = self.partials[self.partials['week'].isin(weeks)].reset_index(drop=True)
+        self.weeks = {week: key for week, key in self.weeks.items() if int(week) in weeks}
+        changed = []
+        for week, rows in preds.groupby('week', sort=True):
+            key = rows_hash(rows[KEYS + ['pff_sack', 'sack_pred']])
+            if self.weeks.get(str(week)) == key:
+                continue
+            self.partials = merge(self.partials[self.partials['week'] != week], partial(rows))
+            self.weeks[str(week)] = key
+            changed.append(int(week))
+        return changed
+
+    def rescore(self, old_rows, new_rows):
+        # Rows scored again (new model, corrected inputs): swap their old contribution for
+        # the new one without touching the rest of the season
+        self.partials = merge(self.partials, partial(old_rows, sign=-1), partial(new_rows))
+        for week in set(old_rows['week']) | set(new_rows['week']):
+            self.weeks.pop(str(week), None)
+
+    def totals(self, level):
+        return rollup(self.partials, level)
+
+    def save(self):
+        os.makedirs(self.root, exist_ok=True)
+        self.partials.to_parquet(os.path.join(self.root, 'partials.parquet'), index=False)
+        with open(os.path.join(self.root, 'weeks.json'), 'w') as f:
+            json.dump(self.weeks, f, indent=1, sort_keys=True)
@@ -0,0 +1,78 @@
+import time
+
+from flask import Blueprint, Response, jsonify, request
+
+# JSON scoring API for play-prep tooling, mounted on the dashboard's Flask server:
+#
+#   POST /api/v1/score {"fronts": [{"yardsToGo": 10, "absoluteYardlineNumber": 75, "defendersInBox": 6,
+#                                   "personnelO": "11", "personnelD": "4-2-5", "hash": "Middle", "down": 1,
+#                                   "offenseFormation": "Shotgun",
+#                                   "defenders": [{"officialPosition": "DT", "rel_x": 1.0, "rel_y": -1.2},
+#                                                 {"officialPosition": "DE", "depth": 1.0, "technique": "5",
+#                                                  "side": "L"}, ...]}, ...]}
+#
+# Every front needs 11 defenders, each with rel_x (or depth) and rel_y or a page 2 technique
+# and side. Values the dashboard doesn't offer (an unknown formation, personnel, position,
+# down or technique, a null or non-numeric number) are a 400 naming the field. All fronts
+# are encoded together and scored with one model call.
+#
+#   POST /api/v1/score.arrow takes the same JSON, or defender rows as an Arrow IPC stream
+#   (Content-Type application/vnd.apache.arrow.stream), and streams back Arrow record batches
+#   of the identifiers, every model feature and sack_prob for bulk pulls. Rows go through the
+#   same checks as JSON fronts, and the stream is read a batch at a time up to 11 rows per
+#   allowed front.
+
+MAX_FRONTS = 10000
+
+
+def create_blueprint(get_model, max_fronts=MAX_FRONTS):
+    api = Blueprint('api_v1', __name__, url_prefix='/api/v1')
+
+    @api.route('/score', methods=['POST'])
+    def score():
+        from hackasack import scoring
+        t = time.perf_counter()
+        body = request.get_json(silent=True)
+        if not isinstance(body, dict) or not isinstance(body.get('fronts'), list):
+            return jsonify({'error': 'expected a JSON object with a "fronts" list'}), 400
+        n = len(body['fronts'])
+        if n > max_fronts:
+            return jsonify({'error': f'at most {max_fronts} fronts per request'}), 413
+        if n == 0:
+            return jsonify({'fronts': []})
+        try:
+            scored = scoring.score_records(body['fronts'], get_model())
+        except (ValueError, TypeError, AttributeError) as e:
+            return jsonify({'error': str(e)}), 400
+        return jsonify({
+            'fronts': [{'sack_prob': p, 'rel_y': y, 'dist_from_qb': d} for p, y, d in zip(
+                scored['sack_prob'].to_numpy().reshape(n, 11).tolist(),
+                scored['rel_y'].to_numpy().reshape(n, 11).tolist(),
+                scored['dist_from_qb'].to_numpy().reshape(n, 11).round(2).tolist())],
+            'elapsed_ms': round(1000 * (time.perf_counter() - t), 2),
+        })
+
+    @api.route('/score.arrow', methods=['POST'])
+    def score_arrow():
+        from hackasack import arrow_export, fronts
+        booster, schema = get_model()
+        try:
+            if request.mimetype == arrow_export.MIME_TYPE:
+                rows = arrow_export.read_rows(request.stream, schema, max_rows=11 * max_fronts)
+            else:
+                body = request.get_json(silent=True)
+                if not isinstance(body, dict) or not isinstance(body.get('fronts'), list):
+                    return jsonify({'error': 'expected an Arrow stream or a JSON object with a "fronts" list'}), 400
+                if len(body['fronts']) > max_fronts:
+                    return jsonify({'error': f'at most {max_fronts} fronts per request'}), 413
+                rows = fronts.from_records(body['fronts'], schema)
+        except arrow_export.TooManyRows as e:
+            return jsonify({'error': str(e)}), 413
+        except (ValueError, TypeError, AttributeError) as e:
+            return jsonify({'error': str(e)}), 400
+        if len(rows) == 0:
+            return jsonify({'error': 'no defender rows to score'}), 400
+        batches = arrow_export.scored_batches(rows, booster, schema)
+        return Response(arrow_export.ipc_stream(batches), mimetype=arrow_export.MIME_TYPE)
+
+    return api
@@ -0,0 +1,71 @@
+import io
+
+import numpy as np
+import pyarrow as pa
+
+from hackasack import encoders, fronts
+
+MIME_TYPE = 'application/vnd.apache.arrow.stream'
+
+# Defender rows are encoded, predicted and written this many at a time, so a response of
+# millions of rows never holds more than one batch of features in memory
+CHUNK_ROWS = 65536
+
+# Input columns that end up in the output as model features rather than as they came
+ENCODED = fronts.SITUATION_COLUMNS + ['rel_x', 'rel_y', 'technique', 'side']
+
+
+class TooManyRows(ValueError):
+    pass
+
+
+def read_rows(source, schema=None, max_rows=None):
+    # Defender rows sent as an Arrow IPC stream, in coordinate or technique form, read a
+    # record batch at a time so an oversized upload stops at max_rows; checked like JSON fronts
+    reader = pa.ipc.open_stream(source)
+    batches, n = [], 0
+    for batch in reader:
+        n += batch.num_rows
+        if max_rows is not None and n > max_rows:
+            raise TooManyRows(f'at most {max_rows} defender rows per request')
+        batches.append(batch)
+    rows = pa.Table.from_batches(batches, reader.schema).to_pandas()
+    missing = [column for column in fronts.SITUATION_COLUMNS + ['slot', 'rel_x', 'officialPosition']
+               if column not in rows and column != 'hash']
+    if missing:
+        raise ValueError(f'arrow rows are missing {missing}')
+    if 'hash' not in rows:
+        rows['hash'] = encoders.HASH_DEFAULT
+    fronts.check_levels(rows, 'slot', list(range(11)))
+    return fronts.resolve_rel_y(fronts.check(rows, schema))
+
+
+def scored_batches(rows, booster, schema, chunk_rows=CHUNK_ROWS):
+    # Record batches of the identifier columns (front, slot, officialPosition and anything
+    # else passed through, e.g. gameId/playId/nflId), every model feature as float32 and
+    # sack_prob
+    id_columns = [column for column in rows.columns if column not in ENCODED]
+    for start in range(0, len(rows), chunk_rows):
+        chunk = rows.iloc[start:start + chunk_rows]
+        X = fronts.feature_matrix(fronts.model_columns(chunk), schema)
+        prob = booster.inplace_predict(X)
+        arrays = [pa.array(chunk[column].to_numpy()) for column in id_columns]
+        arrays += [pa.array(column) for column in np.ascontiguousarray(X.T)]
+        arrays.append(pa.array(np.asarray(prob, dtype='float32')))
+        yield pa.RecordBatch.from_arrays(arrays, id_columns + schema['features'] + ['sack_prob'])
+
+
+def ipc_stream(batches):
+    # Yields the IPC stream a batch at a time instead of building it in memory
+    sink = io.BytesIO()
+    writer = None
+    for batch in batches:
+        if writer is None:
+            writer = pa.ipc.new_stream(sink, batch.schema)
+        writer.write_batch(batch)
+        yield sink.getvalue()
+        sink.seek(0)
+        sink.truncate()
+    if writer is not None:
+        writer.close()
+        yield sink.getvalue()
@@ -0,0 +1,114 @@
+import hashlib
+import os
+
+import numpy as np
+import pandas as pd
+
+from hackasack import explain, fronts
+from hackasack.manifest import digest
+
+# Bump whenever score_rows or the sacks_preds layout changes
+SCORING_VERSION = 1
+
+CHUNK_ROWS = 262144
+
+# What sack-graph-making.R reads from sacks_preds.csv; it joins week and defensiveTeam on
+# itself, so those only go into the parquet
+CSV_COLUMNS = ['gameId', 'playId', 'nflId', 'displayName', 'officialPosition', 'pff_sack', 'sack_pred', 'sacks_oe']
+
+
+def feature_columns(rows):
+    # sacks_df already holds every numeric model input, and down / officialPosition /
+    # offenseFormation in the form the schema's one-hot levels use
+    return {column: rows[column].to_numpy() for column in fronts.NUMERIC + fronts.CATEGORICAL if column in rows}
+
+
+def score_rows(rows, booster, schema, chunk_rows=CHUNK_ROWS, contribs=False):
+    # One preallocated float32 matrix per chunk, reused across chunks; the booster spreads
+    # each predict over its nthread cores. contribs=True returns the TreeSHAP contributions
+    # (one column per feature plus the bias) instead of sack_pred
+    out = np.empty((len(rows), len(explain.columns(schema))) if contribs else len(rows), dtype='float32')
+    X = np.empty((min(chunk_rows, len(rows)), len(schema['features'])), dtype='float32')
+    for start in range(0, len(rows), chunk_rows):
+        chunk = rows.iloc[start:start + chunk_rows]
+        X_chunk = fronts.feature_matrix(feature_columns(chunk), schema, out=X[:len(chunk)])
+        if contribs:
+            out[start:start + len(chunk)] = explain.contributions(booster, X_chunk)
+        else:
+            out[start:start + len(chunk)] = booster.inplace_predict(X_chunk)
+    return out
+
+
+def rows_hash(rows):
+    row_hashes = pd.util.hash_pandas_object(rows, index=False).to_numpy()
+    return hashlib.blake2b(row_hashes.tobytes(), digest_size=16).hexdigest()
+
+
+def season_weeks(sacks_df, games):
+    return sacks_df['gameId'].map(games.set_index('gameId')['week']).to_numpy()
+
+
+def by_week(sacks_df, weeks, stage, columns, score, manifest=None, model_key='', artifact_dir='bdb-cache/weeks'):
+    # score(rows) for every week of sacks_df; with a manifest a week whose rows and model are
+    # unchanged reads the stage's artifact back instead
+    out = np.empty((len(sacks_df), len(columns)), dtype='float32')
+    rescored = []
+    for week in np.unique(weeks):
+        at = np.flatnonzero(weeks == week)
+        rows = sacks_df.iloc[at]
+        if manifest is None:
+            out[at] = score(rows).reshape(len(at), -1)
+            continue
+        key = digest(model_key, rows_hash(rows), SCORING_VERSION)
+        if manifest.fresh(week, stage, key):
+            out[at] = pd.read_parquet(manifest.entry(week, stage)['path'])[columns].to_numpy()
+            continue
+        out[at] = score(rows).reshape(len(at), -1)
+        path = os.path.join(artifact_dir, f'week{week}', f'{stage}.parquet')
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        pd.DataFrame(out[at], columns=columns).to_parquet(path, index=False)
+        manifest.record(week, stage, key, path)
+        rescored.append(int(week))
+    if manifest is not None:
+        manifest.save()
+        print(f'{stage}: rescored weeks {rescored}')
+    return out
+
+
+def score_season(sacks_df, booster, schema, games, chunk_rows=CHUNK_ROWS, manifest=None, model_key='',
+                 artifact_dir='bdb-cache/weeks'):
+    # sack_pred for every row of sacks_df, week by week
+    weeks = season_weeks(sacks_df, games)
+    preds = by_week(sacks_df, weeks, 'predictions', ['sack_pred'],
+                    lambda rows: score_rows(rows, booster, schema, chunk_rows), manifest, model_key, artifact_dir)
+    return preds[:, 0], weeks
+
+
+def explain_season(sacks_df, booster, schema, games, chunk_rows=CHUNK_ROWS, manifest=None, model_key='',
+                   artifact_dir='bdb-cache/weeks'):
+    # The TreeSHAP contributions behind every sack_pred, kept per week next to the predictions
+    weeks = season_weeks(sacks_df, games)
+    return by_week(sacks_df, weeks, 'contributions', explain.columns(schema),
+                   lambda rows: score_rows(rows, booster, schema, chunk_rows, contribs=True),
+                   manifest, model_key, artifact_dir)
+
+
+def sacks_preds(sacks_df, preds, weeks, players, plays):
+    out = sacks_df[['gameId', 'playId', 'nflId', 'officialPosition', 'pff_sack']].reset_index(drop=True)
+    out['week'] = weeks
+    out = out.merge(players[['nflId', 'displayName']], on='nflId', how='left')
+    out = out.merge(plays[['gameId', 'playId', 'defensiveTeam']], on=['gameId', 'playId'], how='left')
+    out['sack_pred'] = preds
+    out['sacks_oe'] = out['pff_sack'] - out['sack_pred']
+    return out
+
+
+def sacks_contribs(sacks_preds, contribs, schema):
+    out = pd.DataFrame(contribs, columns=explain.columns(schema))
+    return pd.concat([sacks_preds[['gameId', 'playId', 'nflId', 'week']].reset_index(drop=True), out], axis=1)
+
+
+def write(preds, out_dir):
+    os.makedirs(out_dir, exist_ok=True)
+    preds.to_parquet(os.path.join(out_dir, 'sacks_preds.parquet'), index=False)
+    preds[CSV_COLUMNS].to_csv(os.path.join(out_dir, 'sacks_preds.csv'), index=False)
@@ -0,0 +1,98 @@
+import multiprocessing as mp
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+from hackasack import aggregates, kernels
+
+# Play-level bootstrap of sacks, expected sacks and sacks over expected per player and team.
+# A resample is a vector of how often every play was drawn; every total is then a weighted
+# np.bincount over the scored snap table, so no frame is ever rebuilt per resample.
+
+METRICS = ['sacks', 'exp_sacks', 'sacks_oe']
+LEVELS = ['players', 'teams']
+
+# Resamples per task handed to the pool
+BLOCK = 250
+
+# The snap table, set once per worker process
+table = {}
+
+
+def snap_table(preds):
+    plays, play = np.unique(kernels.play_key(preds['gameId'], preds['playId']), return_inverse=True)
+    player_keys = preds[aggregates.LEVELS['players']].drop_duplicates('nflId').set_index('nflId')
+    players, player = np.unique(preds['nflId'].to_numpy(), return_inverse=True)
+    teams, team = np.unique(preds['defensiveTeam'].astype(str).to_numpy(), return_inverse=True)
+    sacks = preds['pff_sack'].to_numpy(dtype='float64')
+    exp_sacks = preds['sack_pred'].to_numpy(dtype='float64')
+    # A play has one defense, so team totals only need per-play sums
+    play_team = np.zeros(len(plays), dtype='int64')
+    play_team[play] = team
+    return {
+        'play': play, 'player': player, 'sacks': sacks, 'exp_sacks': exp_sacks, 'play_team': play_team,
+        'play_sacks': np.bincount(play, weights=sacks, minlength=len(plays)),
+        'play_exp_sacks': np.bincount(play, weights=exp_sacks, minlength=len(plays)),
+        'keys': {'players': player_keys.loc[players].reset_index(),
+                 'teams': pd.DataFrame({'defensiveTeam': teams})},
+    }
+
+
+def set_table(snaps):
+    table.update(snaps)
+
+
+def totals(counts, snaps):
+    # (sacks, exp_sacks) per player and per team with every play weighted by its draw count
+    n_players, n_teams = len(snaps['keys']['players']), len(snaps['keys']['teams'])
+    weights = counts[snaps['play']]
+    players = np.stack([np.bincount(snaps['player'], weights=weights * snaps[metric], minlength=n_players)
+                        for metric in ['sacks', 'exp_sacks']])
+    teams = np.stack([np.bincount(snaps['play_team'], weights=counts * snaps[f'play_{metric}'], minlength=n_teams)
+                      for metric in ['sacks', 'exp_sacks']])
+    return players, teams
+
+
+def resample_block(seed, n):
+    rng = np.random.default_rng(seed)
+    n_plays = len(table['play_team'])
+    out = {'players': [], 'teams': []}
+    for _ in range(n):
+        counts = np.bincount(rng.integers(0, n_plays, n_plays), minlength=n_plays).astype('float64')
+        players, teams = totals(counts, table)
+        out['players'].append(players.astype('float32'))
+        out['teams'].append(teams.astype('float32'))
+    return {level: np.stack(blocks) for level, blocks in out.items()}
+
+
+def bootstrap(preds, resamples=10000, workers=1, seed=42, level=0.95):
+    # Point estimates plus percentile intervals for every metric, per player and per team
+    snaps = snap_table(preds)
+    blocks = [min(BLOCK, resamples - start) for start in range(0, resamples, BLOCK)]
+    seeds = np.random.SeedSequence(seed).spawn(len(blocks))
+    if workers > 1:
+        ctx = mp.get_context('fork') if 'fork' in mp.get_all_start_methods() else None
+        with ProcessPoolExecutor(max_workers=workers, mp_context=ctx, initializer=set_table,
+                                 initargs=(snaps,)) as pool:
+            results = list(pool.map(resample_block, seeds, blocks))
+    else:
+        set_table(snaps)
+        results = [resample_block(s, n) for s, n in zip(seeds, blocks)]
+
+    point = dict(zip(LEVELS, totals(np.ones(len(snaps['play_team'])), snaps)))
+    tail = (1 - level) / 2
+    out = {}
+    for name in LEVELS:
+        draws = np.concatenate([result[name] for result in results])
+        draws = np.concatenate([draws, draws[:, :1] - draws[:, 1:2]], axis=1)
+        estimate = np.concatenate([point[name], point[name][:1] - point[name][1:2]])
+        lo, hi = np.quantile(draws, [tail, 1 - tail], axis=0)
+        frame = snaps['keys'][name].copy()
+        for i, metric in enumerate(METRICS):
+            frame[metric] = estimate[i]
+            frame[f'{metric}_lo'] = lo[i]
+            frame[f'{metric}_hi'] = hi[i]
+            frame[f'{metric}_se'] = draws[:, i].std(axis=0)
+        out[name] = frame
+    return out
@@ -0,0 +1,109 @@
+import hashlib
+import math
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+from hackasack import explain
+from hackasack.batch_scoring import CHUNK_ROWS
+from hackasack.manifest import digest
+
+# Partial dependence and ICE curves of the sack model. Every background row is repeated once
+# per grid value with the swept feature overwritten, and that (grid x rows) matrix is
+# predicted in chunks on a thread pool, so a curve is a handful of large predicts instead of
+# one per row and value. Features are swept as the model sees them: dist_from_qb does not
+# follow a swept rel_x.
+
+# Bump whenever the curves for the same model, rows and grid would change
+DEPENDENCE_VERSION = 1
+
+GRID_POINTS = 50
+BACKGROUND_ROWS = 1000
+
+
+def numeric_features(schema):
+    # The features a curve makes sense for: everything but the one-hot columns
+    return [feature for feature, source in zip(schema['features'], explain.sources(schema)) if feature == source]
+
+
+def grid(values, points=GRID_POINTS, percentiles=(0.05, 0.95)):
+    # Every distinct value when there are few (defendersInBox, num_dl), else evenly spaced
+    # between the percentiles
+    values = np.asarray(values, dtype='float64')
+    values = values[~np.isnan(values)]
+    distinct = np.unique(values)
+    if len(distinct) <= points:
+        return distinct.astype('float32')
+    lo, hi = np.quantile(values, percentiles)
+    return np.linspace(lo, hi, points, dtype='float32')
+
+
+def background(X, rows=BACKGROUND_ROWS, seed=42):
+    if len(X) <= rows:
+        return np.asarray(X, dtype='float32')
+    at = np.sort(np.random.default_rng(seed).choice(len(X), rows, replace=False))
+    return np.asarray(X[at], dtype='float32')
+
+
+def ice(booster, X, column, values, chunk_rows=CHUNK_ROWS, threads=1):
+    # (rows x grid) sack_prob with `column` of every row of X set to each of `values`; with
+    # threads > 1 give the booster nthread=1 so the chunks don't fight over cores. The grid
+    # is split in at least one chunk per thread, each no bigger than chunk_rows predict rows
+    n, width = X.shape
+    per_chunk = max(1, min(chunk_rows // max(n, 1), math.ceil(len(values) / threads)))
+    out = np.empty((n, len(values)), dtype='float32')
+
+    def sweep(start):
+        chunk = values[start:start + per_chunk]
+        rows = np.repeat(X[None], len(chunk), axis=0)
+        rows[:, :, column] = chunk[:, None]
+        out[:, start:start + len(chunk)] = booster.inplace_predict(rows.reshape(-1, width)).reshape(len(chunk), n).T
+
+    with ThreadPoolExecutor(max_workers=threads) as pool:
+        list(pool.map(sweep, range(0, len(values), per_chunk)))
+    return out
+
+
+def curves(booster, schema, X, features, model_key, cache_dir='bdb-cache/dependence', points=GRID_POINTS,
+           rows=BACKGROUND_ROWS, seed=42, chunk_rows=CHUNK_ROWS, threads=1):
+    # {feature: (grid, ice)} for a sample of the rows of X (the season's feature matrix).
+    # Curves are kept under cache_dir per model version and recomputed only when the model,
+    # the sampled rows or the grid change
+    X_bg = background(X, rows, seed)
+    rows_key = hashlib.blake2b(X_bg.tobytes(), digest_size=16).hexdigest()
+    out = {}
+    for feature in features:
+        column = schema['features'].index(feature)
+        values = grid(X[:, column], points)
+        key = digest(rows_key, feature, values.tobytes().hex(), DEPENDENCE_VERSION)[:16]
+        path = os.path.join(cache_dir, model_key[:16], f'{feature}-{key}.npz')
+        if os.path.exists(path):
+            with np.load(path) as cached:
+                out[feature] = cached['grid'], cached['ice']
+            continue
+        out[feature] = values, ice(booster, X_bg, column, values, chunk_rows, threads)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        np.savez(path, grid=out[feature][0], ice=out[feature][1])
+    return out
+
+
+def summarize(sweeps):
+    # One row per feature and grid value: the partial dependence (mean of the ICE curves)
+    # and the 10th/90th percentile ICE value
+    frames = []
+    for feature, (values, curve) in sweeps.items():
+        lo, hi = np.quantile(curve, [0.1, 0.9], axis=0)
+        frames.append(pd.DataFrame({'feature': feature, 'value': values, 'pd': curve.mean(axis=0),
+                                    'ice_p10': lo, 'ice_p90': hi}))
+    return pd.concat(frames, ignore_index=True)
+
+
+def ice_frame(sweeps):
+    # Every ICE curve, long: feature, background row, grid value and sack_prob
+    frames = []
+    for feature, (values, curve) in sweeps.items():
+        frames.append(pd.DataFrame({'feature': feature, 'row': np.repeat(np.arange(len(curve)), len(values)),
+                                    'value': np.tile(values, len(curve)), 'sack_prob': curve.reshape(-1)}))
+    return pd.concat(frames, ignore_index=True)
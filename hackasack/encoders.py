@@ -0,0 +1,154 @@
+import numpy as np
+import pandas as pd
+
+# Lookup tables shared by build.py (training) and main.py (the front builder). Every
+# encoder maps a whole column at once through pd.Index.get_indexer into these tables.
+
+OTHER_POSITIONS = ['DB', 'RB', 'G', 'LB']
+
+POSITIONS = ['CB', 'DE', 'DT', 'FS', 'ILB', 'MLB', 'NT', 'OLB', 'SS']
+
+DOWNS = [1, 2, 3, 4]
+
+FORMATIONS = ['EMPTY', 'I_FORM', 'JUMBO', 'PISTOL', 'SHOTGUN', 'SINGLEBACK', 'WILDCAT']
+
+# dashboard dropdown -> (num_rb, num_te, num_wr); anything else is 11 personnel
+O_PERSONNEL = {
+    '12*': (1, 2, 1), '12': (1, 2, 2), '21': (2, 1, 2), '13': (1, 3, 1), '10': (1, 0, 4),
+    '22': (2, 2, 1), '01': (0, 1, 4), '20': (2, 0, 3), '11*': (1, 1, 2), '02': (0, 2, 3),
+    '11': (1, 1, 3),
+}
+O_PERSONNEL_DEFAULT = '11'
+
+# dashboard dropdown -> (num_dl, num_lb, num_db); anything else is 4-2-5
+D_PERSONNEL = {
+    '1-5-5': (1, 5, 5), '2-4-5': (2, 4, 5), '3-3-5': (3, 3, 5), '2-3-6': (2, 3, 6), '4-3-4': (4, 3, 4),
+    '3-4-4': (3, 4, 4), '4-1-6': (4, 1, 6), '3-2-6': (3, 2, 6), '1-4-6': (1, 4, 6), '4-2-5': (4, 2, 5),
+}
+D_PERSONNEL_DEFAULT = '4-2-5'
+
+# ball spot -> ball_y; anything else is the middle of the field
+HASH_BALL_Y = {'Right': 29.7, 'Left': 23.6, 'Middle': 27.0}
+HASH_DEFAULT = 'Middle'
+
+# dashboard formation -> (offenseFormation level, qb_dist_from_ball, qb_rel_x, qb_rel_y, qb depth
+# behind the ball used for dist_from_qb)
+OFFENSE_FORMATIONS = {
+    'Empty': ('EMPTY', 5, -5, 0, 5),
+    'Shotgun': ('SHOTGUN', 5, -5, 0, 5),
+    'I Formation': ('I_FORM', 1.5, -1.5, 0, 1.5),
+    'Jumbo': ('JUMBO', 1.5, -1.5, 0, 1.5),
+    'Pistol': ('PISTOL', 5, 5, 0, 5),
+    'Singleback': ('SINGLEBACK', 1.5, -1.5, 0, 1.5),
+    'Wildcat': ('WILDCAT', 5, 5, 0, 5),
+}
+
+# defensive technique -> distance from the middle of the formation, positive to the
+# defense's left; unknown techniques line up at 26 (outside the numbers)
+TECHNIQUE_REL_Y = {
+    '0': 0, '1': 0.2, '2i': 0.8, '2': 1, '3': 1.2, '4i': 1.8, '4': 2, '5': 2.2, '6i': 2.8, '6': 3,
+    '7/9': 3.2, 'Wide 7/9': 4, 'Slot': 10, 'Wide': 20,
+}
+TECHNIQUE_DEFAULT_REL_Y = 26
+
+
+def lookup(values, keys, default=None):
+    # Position of every value in keys; values missing from keys map to the default key
+    # (or -1 without one)
+    idx = pd.Index(keys).get_indexer(np.asarray(values, dtype=object).ravel())
+    if default is not None:
+        idx[idx < 0] = list(keys).index(default)
+    return idx
+
+
+def table_lookup(values, table, default):
+    keys = list(table)
+    rows = np.array([table[key] for key in keys], dtype='float64')
+    return rows[lookup(values, keys, default)]
+
+
+def one_hot(values, levels):
+    # Values outside the levels get an all-zero row
+    idx = lookup(values, levels)
+    out = np.zeros((len(idx), len(levels)), dtype='float32')
+    hit = idx >= 0
+    out[np.flatnonzero(hit), idx[hit]] = 1
+    return out
+
+
+def group_positions(positions):
+    # Rolls up the positions the model doesn't distinguish into 'Other'
+    positions = pd.Series(positions)
+    return positions.astype(object).where(~positions.isin(OTHER_POSITIONS), 'Other')
+
+
+def personnel_counts(text):
+    # Leading digit of each of the first three ', '-separated groups, e.g. '1 RB, 1 TE, 3 WR'
+    parts = text.split(', ', 2) if isinstance(text, str) else []
+    counts = [int(part[:1]) if part[:1] else 0 for part in parts]
+    return counts + [0] * (3 - len(counts))
+
+
+def parse_personnel(personnel, columns):
+    # Parses each distinct personnel string once and broadcasts the counts by code
+    codes, uniques = pd.factorize(pd.Series(personnel))
+    table = np.array([personnel_counts(text) for text in uniques] + [[0, 0, 0]], dtype='int64')
+    return pd.DataFrame(table[codes], columns=columns, index=getattr(personnel, 'index', None))
+
+
+def o_personnel(values):
+    return table_lookup(values, O_PERSONNEL, O_PERSONNEL_DEFAULT)
+
+
+def d_personnel(values):
+    return table_lookup(values, D_PERSONNEL, D_PERSONNEL_DEFAULT)
+
+
+def ball_y(values):
+    return table_lookup(values, HASH_BALL_Y, HASH_DEFAULT)
+
+
+def down_index(values):
+    # Anything that isn't 2nd, 3rd or 4th down is treated as 1st down
+    downs = np.asarray(values, dtype='float64').ravel()
+    return np.where(np.isin(downs, [2, 3, 4]), downs, 1).astype('int64')
+
+
+def one_hot_downs(values):
+    return one_hot(down_index(values), DOWNS)
+
+
+def one_hot_positions(values):
+    return one_hot(values, POSITIONS)
+
+
+def formation_levels(values):
+    labels = list(OFFENSE_FORMATIONS)
+    idx = lookup(values, labels)
+    levels = np.array([OFFENSE_FORMATIONS[label][0] for label in labels] + [None], dtype=object)
+    return levels[idx]
+
+
+def one_hot_formations(values):
+    return one_hot(formation_levels(values), FORMATIONS)
+
+
+def formation_qb(values):
+    # (qb_dist_from_ball, qb_rel_x, qb_rel_y, qb depth) for every dashboard formation
+    labels = list(OFFENSE_FORMATIONS)
+    table = np.array([OFFENSE_FORMATIONS[label][1:] for label in labels] + [[np.nan] * 4], dtype='float64')
+    return table[lookup(values, labels)]
+
+
+def dist_from_qb(rel_x, rel_y, qb_depth, qb_rel_y):
+    return np.sqrt(np.square(np.asarray(rel_x, dtype='float64') + qb_depth)
+                   + np.square(np.asarray(rel_y, dtype='float64') - qb_rel_y))
+
+
+def technique_rel_y(techniques, sides):
+    keys = list(TECHNIQUE_REL_Y)
+    table = np.array([TECHNIQUE_REL_Y[key] for key in keys] + [np.nan], dtype='float64')
+    rel_y = table[lookup(techniques, keys)]
+    left = np.asarray(sides, dtype=object).ravel() == 'L'
+    rel_y = np.where(left | (rel_y == 0), rel_y, -rel_y)
+    return np.where(np.isnan(rel_y), TECHNIQUE_DEFAULT_REL_Y, rel_y)
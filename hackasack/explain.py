@@ -0,0 +1,51 @@
+import numpy as np
+
+from hackasack.prediction_cache import cached_rows
+
+# TreeSHAP contributions of the sack model: one column per schema feature plus the bias, in
+# log-odds, summing to the margin of sack_prob. The one-hot columns are added back into the
+# input they encode (down, officialPosition, offenseFormation) before they are shown.
+
+BIAS = 'bias'
+TOP_DRIVERS = 3
+
+
+def contributions(booster, X):
+    import xgboost as xgb
+    # Unlike inplace_predict, pred_contribs needs a DMatrix
+    return booster.predict(xgb.DMatrix(X, feature_names=booster.feature_names), pred_contribs=True)
+
+
+def cached_contributions(cache, booster, X):
+    # Kept in the prediction cache next to sack_prob, under their own tag
+    if cache is None:
+        return contributions(booster, X)
+    return cached_rows(cache, X, lambda rows: contributions(booster, rows), width=X.shape[1] + 1,
+                       tag=b'contribs:')
+
+
+def columns(schema):
+    return schema['features'] + [BIAS]
+
+
+def sources(schema):
+    # The input every feature column was encoded from
+    prefixes = [(f'{column}_', column) for column in schema['categories']]
+    return [next((source for prefix, source in prefixes if feature.startswith(prefix)), feature)
+            for feature in schema['features']]
+
+
+def grouped(contribs, schema):
+    # (names, contributions per input) without the bias column
+    names = list(dict.fromkeys(sources(schema)))
+    index = np.array([names.index(source) for source in sources(schema)])
+    out = np.zeros((len(contribs), len(names)), dtype='float32')
+    np.add.at(out.T, index, np.asarray(contribs)[:, :-1].T)
+    return names, out
+
+
+def top_drivers(contribs, schema, n=TOP_DRIVERS):
+    # The n inputs that move each row's log-odds the most, e.g. 'dist_from_qb -0.84, rel_x -0.31'
+    names, values = grouped(contribs, schema)
+    order = np.argsort(-np.abs(values), axis=1)[:, :n]
+    return [', '.join(f'{names[j]} {row[j]:+.2f}' for j in top) for row, top in zip(values, order)]
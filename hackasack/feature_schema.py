@@ -0,0 +1,64 @@
+import json
+
+# The feature schema of a trained model: its input columns in training order with their
+# dtypes, and the levels of every one-hot encoded column. build.py writes it next to the
+# model and serving refuses a model whose schema doesn't line up.
+
+SCHEMA_VERSION = 1
+
+
+def schema_path(model_path):
+    return model_path + '.schema.json'
+
+
+def plain(value):
+    # numpy scalars -> python so the levels survive a json round trip
+    return value.item() if hasattr(value, 'item') else value
+
+
+def infer(X, categorical):
+    # X is the model frame after pd.get_dummies, categorical maps each encoded column to
+    # its values (a Series) before encoding, as the dummy names only keep their string form
+    names = [str(name) for name in X.columns]
+    categories = {}
+    for column, values in categorical.items():
+        by_name = {f'{column}_{value}': plain(value) for value in values.dropna().unique()}
+        categories[column] = [by_name[name] for name in names if name in by_name]
+    return {
+        'version': SCHEMA_VERSION,
+        'features': names,
+        'dtypes': [str(X[name].dtype) for name in X.columns],
+        'categories': categories,
+    }
+
+
+def save(schema, path):
+    with open(path, 'w') as f:
+        json.dump(schema, f, indent=1)
+
+
+def load(path):
+    with open(path) as f:
+        schema = json.load(f)
+    if schema.get('version') != SCHEMA_VERSION:
+        raise ValueError(f'{path}: unsupported feature schema version {schema.get("version")}')
+    return schema
+
+
+def check_booster(booster, schema):
+    names = schema['features']
+    if booster.num_features() != len(names):
+        raise ValueError(f'model expects {booster.num_features()} features but its schema lists {len(names)}')
+    if booster.feature_names is not None and list(booster.feature_names) != names:
+        drift = [(i, a, b) for i, (a, b) in enumerate(zip(booster.feature_names, names)) if a != b]
+        raise ValueError(f'model feature names differ from its schema at {drift[:5]}')
+
+
+def load_model(path, params=None):
+    # Booster plus its schema, checked against each other
+    from xgboost import Booster
+    booster = Booster(params or {})
+    booster.load_model(path)
+    schema = load(schema_path(path))
+    check_booster(booster, schema)
+    return booster, schema
@@ -0,0 +1,83 @@
+import numpy as np
+import pandas as pd
+
+from hackasack import kernels
+
+OLINE_POSITIONS = ['T', 'G', 'C']
+
+DEFENSE_COLUMNS = ['gameId', 'playId', 'nflId', 'rel_x', 'rel_y', 's', 'a',
+                   'dir', 'o', 'ball_x', 'ball_y', 'officialPosition',
+                   'oline_min', 'oline_max', 'oline_width', 'qb_dist_from_ball',
+                   'qb_rel_x', 'qb_rel_y', 'dist_from_qb']
+
+
+def snap_features(ball_snaps, ball_loc, players_select):
+    # Everything here is keyed by (gameId, playId), so it can run on any subset of whole plays.
+    # Each per-play aggregate is one reduction over integer play codes instead of a groupby.
+    snaps = pd.merge(ball_snaps, players_select, on = 'nflId')
+    codes, play_keys = pd.factorize(kernels.play_key(snaps['gameId'], snaps['playId']))
+    codes = codes.astype('int64')
+    n_plays = len(play_keys)
+
+    # ball location at the snap
+    ball_rows = kernels.lookup(kernels.play_key(ball_loc['gameId'], ball_loc['playId']), play_keys)
+    on_play = ball_rows >= 0
+    first_ball = kernels.group_first(ball_rows[on_play], n_plays)
+    has_ball = first_ball >= 0
+    ball_x = np.full(n_plays, np.nan, dtype=snaps['x'].dtype)
+    ball_y = np.full(n_plays, np.nan, dtype=snaps['y'].dtype)
+    ball_x[has_ball] = ball_loc['x'].to_numpy()[on_play][first_ball[has_ball]]
+    ball_y[has_ball] = ball_loc['y'].to_numpy()[on_play][first_ball[has_ball]]
+
+    x, y = snaps['x'].to_numpy(), snaps['y'].to_numpy()
+    bx, by = ball_x[codes], ball_y[codes]
+    left = (snaps['playDirection'] == 'left').to_numpy()
+    right = (snaps['playDirection'] == 'right').to_numpy()
+    rel_x = np.where(left, (120 - x) - (120 - bx), x - bx)
+    rel_y = np.where(left, (53.33 - y) - (53.33 - by), y - by)
+    row_ok = has_ball[codes] & (left | right)
+
+    # oline extents
+    position = snaps['officialPosition']
+    is_ol = position.isin(OLINE_POSITIONS).to_numpy() & row_ok
+    oline_min, oline_max = kernels.group_min_max(codes[is_ol], rel_y[is_ol], n_plays)
+    has_ol = kernels.group_count(codes[is_ol], n_plays) > 0
+
+    # QB: plays with one QB use it, plays with two use the one closest to the ball laterally,
+    # plays with more are dropped
+    is_qb = (position == 'QB').to_numpy() & row_ok & has_ol[codes]
+    qb_rows = np.flatnonzero(is_qb)
+    num_qbs = kernels.group_count(codes[qb_rows], n_plays)
+    y_diff = np.abs(y[qb_rows] - by[qb_rows])
+    best = kernels.group_argmin(codes[qb_rows], y_diff, n_plays)
+    has_qb = (best >= 0) & ((num_qbs == 1) | (num_qbs == 2))
+    qb_row = np.zeros(n_plays, dtype='int64')
+    qb_row[has_qb] = qb_rows[best[has_qb]]
+
+    team_codes, _ = pd.factorize(snaps['team'])
+    qb_team = np.where(has_qb, team_codes[qb_row], -1)
+    qb_x = np.where(has_qb, x[qb_row], np.nan)
+    qb_y = np.where(has_qb, y[qb_row], np.nan)
+    qb_rel_x = np.where(has_qb, rel_x[qb_row], np.nan)
+    qb_rel_y = np.where(has_qb, rel_y[qb_row], np.nan)
+    qb_dist_from_ball = np.sqrt(np.square(qb_x - ball_x)  + np.square(qb_y - ball_y))
+
+    defense = row_ok & has_qb[codes] & (team_codes != qb_team[codes])
+    play = codes[defense]
+    defense_keep = snaps.loc[defense, ['gameId', 'playId', 'nflId']].copy()
+    defense_keep['rel_x'] = rel_x[defense]
+    defense_keep['rel_y'] = rel_y[defense]
+    for col in ['s', 'a', 'dir', 'o']:
+        defense_keep[col] = snaps.loc[defense, col]
+    defense_keep['ball_x'] = ball_x[play]
+    defense_keep['ball_y'] = ball_y[play]
+    defense_keep['officialPosition'] = position[defense]
+    defense_keep['oline_min'] = oline_min[play]
+    defense_keep['oline_max'] = oline_max[play]
+    defense_keep['oline_width'] = oline_max[play] - oline_min[play]
+    defense_keep['qb_dist_from_ball'] = qb_dist_from_ball[play]
+    defense_keep['qb_rel_x'] = qb_rel_x[play]
+    defense_keep['qb_rel_y'] = qb_rel_y[play]
+    defense_keep['dist_from_qb'] = np.sqrt(np.square(x[defense] - qb_x[play])  + np.square(y[defense] - qb_y[play]))
+
+    return defense_keep[DEFENSE_COLUMNS].reset_index(drop=True)
@@ -0,0 +1,148 @@
+import json
+import os
+import shutil
+
+import numpy as np
+import pandas as pd
+
+from hackasack import schema
+from hackasack.manifest import source_stamp
+
+# On-disk layout of one week:
+#   meta.json          row count, per-column dtype, the categories of coded columns and the
+#                      size/mtime of the csv the week was converted from
+#   <column>.bin       one fixed-width array per column, rows sorted by (gameId, playId, frameId)
+#   plays.npy          (gameId, playId, start, stop) row range of every play
+INDEX_DTYPE = np.dtype([('gameId', 'int64'), ('playId', 'int64'), ('start', 'int64'), ('stop', 'int64')])
+
+
+def week_dir(store_dir, week):
+    return os.path.join(store_dir, f'week{week}')
+
+
+def column_codes(values, seen):
+    # int16 codes of a categorical chunk in terms of `seen` (value -> code, in the order the
+    # values first appeared in the week), -1 for missing
+    values = values.astype('category')
+    for category in values.cat.categories:
+        seen.setdefault(str(category), len(seen))
+    lookup = np.array([seen[str(category)] for category in values.cat.categories] + [-1], dtype='int16')
+    return lookup[values.cat.codes.to_numpy()]
+
+
+def write_store(chunks, root, source=None):
+    # chunks is an iterable of DataFrames (read_csv with chunksize), so only one chunk plus
+    # the sort keys is in memory at a time. Every column is appended to its .bin file as it
+    # comes, then each file is put in (gameId, playId, frameId) order one column at a time.
+    tmp_root = root + '.tmp'
+    shutil.rmtree(tmp_root, ignore_errors=True)
+    os.makedirs(tmp_root)
+    meta = {'n_rows': 0, 'dtypes': {}, 'categories': {}, 'source': source}
+    seen = {}
+    keys = {'gameId': [], 'playId': [], 'frameId': []}
+    for df in chunks:
+        for col in keys:
+            keys[col].append(df[col].to_numpy(dtype='int32'))
+        for col in df.columns:
+            values = df[col]
+            if col in seen or isinstance(values.dtype, pd.CategoricalDtype):
+                arr = column_codes(values, seen.setdefault(col, {}))
+            elif values.dtype.kind in 'iu' or col in ('nflId',):
+                # the football has no nflId; store it as -1 instead of widening to float
+                arr = values.fillna(-1).to_numpy(dtype='int32')
+            elif values.dtype.kind == 'f':
+                arr = values.to_numpy(dtype='float32')
+            else:
+                continue
+            with open(os.path.join(tmp_root, f'{col}.bin'), 'ab') as f:
+                arr.tofile(f)
+            meta['dtypes'][col] = arr.dtype.str
+        meta['n_rows'] += len(df)
+
+    game, play, frame = (np.concatenate(keys[col]) if keys[col] else np.empty(0, dtype='int32') for col in keys)
+    order = np.lexsort((frame, play, game))
+    for col, dtype in meta['dtypes'].items():
+        path = os.path.join(tmp_root, f'{col}.bin')
+        arr = np.fromfile(path, dtype=np.dtype(dtype))[order]
+        if col in seen:
+            # Sorted categories, as read_csv would have given for the whole week
+            categories = sorted(seen[col])
+            remap = np.full(len(categories) + 1, -1, dtype='int16')
+            remap[[seen[col][category] for category in categories]] = np.arange(len(categories))
+            arr = remap[arr]
+            meta['categories'][col] = categories
+        arr.tofile(path)
+
+    game, play = game[order], play[order]
+    starts = np.flatnonzero(np.r_[True, (game[1:] != game[:-1]) | (play[1:] != play[:-1])])[:len(game)]
+    index = np.empty(len(starts), dtype=INDEX_DTYPE)
+    index['gameId'], index['playId'] = game[starts], play[starts]
+    index['start'], index['stop'] = starts, np.r_[starts[1:], len(game)]
+    np.save(os.path.join(tmp_root, 'plays.npy'), index)
+    with open(os.path.join(tmp_root, 'meta.json'), 'w') as f:
+        json.dump(meta, f)
+    shutil.rmtree(root, ignore_errors=True)
+    os.replace(tmp_root, root)
+
+
+def is_converted(root, csv_path):
+    # Converted from the csv as it is now; a changed (or pre-stamp) store is converted again
+    try:
+        with open(os.path.join(root, 'meta.json')) as f:
+            return json.load(f).get('source') == source_stamp(csv_path)
+    except FileNotFoundError:
+        return False
+
+
+def convert_week(csv_path, store_dir, week, chunksize=500000):
+    root = week_dir(store_dir, week)
+    if not is_converted(root, csv_path):
+        write_store(pd.read_csv(csv_path, chunksize=chunksize, **schema.csv_kwargs('tracking')), root,
+                    source_stamp(csv_path))
+    return root
+
+
+class FrameStore:
+    # Opens every column read-only with np.memmap; slicing a play returns views into the
+    # mapped files, and processes that open the same store share the OS page cache
+
+    def __init__(self, root):
+        self.root = root
+        with open(os.path.join(root, 'meta.json')) as f:
+            meta = json.load(f)
+        self.n_rows = meta['n_rows']
+        self.categories = meta['categories']
+        self.columns = {col: np.memmap(os.path.join(root, f'{col}.bin'), dtype=np.dtype(dtype), mode='r',
+                                       shape=(self.n_rows,))
+                        for col, dtype in meta['dtypes'].items()}
+        self.index = np.load(os.path.join(root, 'plays.npy'))
+        self._rows = {(int(g), int(p)): (int(start), int(stop))
+                      for g, p, start, stop in self.index.tolist()}
+
+    def __reduce__(self):
+        # Reopen by path in the receiving process instead of pickling the mapped arrays
+        return (FrameStore, (self.root,))
+
+    def __len__(self):
+        return self.n_rows
+
+    def code(self, col, value):
+        return self.categories[col].index(value)
+
+    def play(self, gameId, playId):
+        start, stop = self._rows[(gameId, playId)]
+        return {col: arr[start:stop] for col, arr in self.columns.items()}
+
+    def rows_where(self, col, value):
+        return np.flatnonzero(self.columns[col] == self.code(col, value))
+
+    def to_frame(self, rows=None, columns=None):
+        data = {}
+        for col in columns or list(self.columns):
+            values = self.columns[col] if rows is None else self.columns[col][rows]
+            if col in self.categories:
+                values = pd.Categorical.from_codes(values, self.categories[col])
+            elif col == 'nflId':
+                values = pd.array(np.where(values < 0, None, values), dtype='Int32')
+            data[col] = values
+        return pd.DataFrame(data)
@@ -0,0 +1,196 @@
+import numbers
+
+import numpy as np
+import pandas as pd
+
+from hackasack import encoders
+
+# A front is one row per defender: the play situation the dashboard asks for, repeated on
+# every row, plus the defender's slot, spot and position. Any number of fronts can be
+# stacked and turned into one float32 model matrix laid out by the model's feature schema.
+
+SITUATION_COLUMNS = ['yardsToGo', 'absoluteYardlineNumber', 'defendersInBox', 'personnelO', 'personnelD', 'hash',
+                     'down', 'offenseFormation']
+FRONT_COLUMNS = SITUATION_COLUMNS + ['slot', 'rel_x', 'rel_y', 'officialPosition']
+
+# Speed and acceleration the model sees for each of the 11 defender slots
+SLOT_MOTION = np.array([(0.96, 0.90), (0.37, 2.44), (0.39, 0.24), (0.17, 0.14), (2.54, 1.46), (0.56, 2.42),
+                        (1.17, 1.21), (1.25, 1.05), (0.90, 0.18), (0.36, 2.85), (0.03, 0.18)])
+
+# OL extents (oline_min, oline_max, oline_width) used for every front
+OLINE_EXTENTS = (-2.61, 3.0, 5.61)
+
+# Model columns fed as is; everything else in a schema has to be a one-hot level of CATEGORICAL
+NUMERIC = ['yardsToGo', 'absoluteYardlineNumber', 'defendersInBox', 'num_rb', 'num_te', 'num_wr', 'num_dl',
+           'num_lb', 'num_db', 'rel_x', 'rel_y', 's', 'a', 'ball_x', 'ball_y', 'oline_min', 'oline_max',
+           'oline_width', 'qb_dist_from_ball', 'qb_rel_x', 'qb_rel_y', 'dist_from_qb']
+CATEGORICAL = ['down', 'officialPosition', 'offenseFormation']
+
+# Ball spots a front may name; the dashboard's 'Left Hash' and 'Right Hash' have always been
+# scored as the middle of the field
+HASHES = list(encoders.HASH_BALL_Y) + ['Left Hash', 'Right Hash']
+
+
+def front(yardsToGo, absoluteYardlineNumber, defendersInBox, personnelO, personnelD, the_hash, down,
+          offenseFormation, rel_x, rel_y, positions):
+    # The 11 defender rows of one dashboard front
+    return pd.DataFrame({
+        'yardsToGo': yardsToGo, 'absoluteYardlineNumber': absoluteYardlineNumber,
+        'defendersInBox': defendersInBox, 'personnelO': personnelO, 'personnelD': personnelD,
+        'hash': the_hash, 'down': down, 'offenseFormation': offenseFormation, 'slot': np.arange(11),
+        'rel_x': rel_x, 'rel_y': rel_y, 'officialPosition': positions,
+    }, columns=FRONT_COLUMNS)
+
+
+def from_records(records, schema=None):
+    # JSON fronts ({situation fields, 'defenders': [11 x {officialPosition, rel_x or depth,
+    # rel_y or technique + side}]}) -> defender rows with a 'front' number, checked by check()
+    for i, record in enumerate(records):
+        n_defenders = len(record.get('defenders') or [])
+        if n_defenders != 11:
+            raise ValueError(f'front {i} has {n_defenders} defenders, expected 11')
+        missing = [column for column in SITUATION_COLUMNS if column != 'hash' and column not in record]
+        if missing:
+            raise ValueError(f'front {i} is missing {missing}')
+    defenders = [defender for record in records for defender in record['defenders']]
+    columns = {'front': np.repeat(np.arange(len(records)), 11)}
+    for column in SITUATION_COLUMNS:
+        values = [record.get(column, encoders.HASH_DEFAULT) for record in records]
+        columns[column] = np.repeat(np.array(values, dtype=object), 11)
+    columns['slot'] = np.tile(np.arange(11), len(records))
+    columns['rel_x'] = [defender.get('rel_x', defender.get('depth')) for defender in defenders]
+    for column in ['rel_y', 'officialPosition', 'technique', 'side']:
+        columns[column] = [defender.get(column) for defender in defenders]
+    return resolve_rel_y(check(pd.DataFrame(columns), schema))
+
+
+def check(rows, schema=None):
+    # Rejects defender rows the model would quietly score as something else (a NaN feature,
+    # an all-zero one-hot, an unknown technique at 26 or a technique without a side on the
+    # right); the ValueError names the column. Down and position levels come from the
+    # schema when there is one.
+    levels = schema['categories'] if schema is not None else {'down': encoders.DOWNS,
+                                                              'officialPosition': encoders.POSITIONS}
+    for column in ['yardsToGo', 'absoluteYardlineNumber', 'defendersInBox', 'down', 'rel_x']:
+        check_numbers(rows, column)
+    for column, known in [('personnelO', encoders.O_PERSONNEL), ('personnelD', encoders.D_PERSONNEL),
+                          ('hash', HASHES), ('down', levels['down']),
+                          ('offenseFormation', encoders.OFFENSE_FORMATIONS),
+                          ('officialPosition', levels['officialPosition'])]:
+        check_levels(rows, column, list(known))
+    technique = rows['technique'].notna().to_numpy() if 'technique' in rows else np.zeros(len(rows), dtype=bool)
+    if technique.any():
+        check_levels(rows[technique], 'technique', list(encoders.TECHNIQUE_REL_Y))
+        check_levels(rows[technique], 'side', ['L', 'R'])
+    if not technique.all():
+        check_numbers(rows[~technique], 'rel_y', ' or a technique')
+    return rows
+
+
+# What pandas infers for an object column holding only ints and floats
+REAL_TYPES = ['integer', 'floating', 'mixed-integer-float']
+
+
+def check_numbers(rows, column, alternative=''):
+    if column not in rows:
+        raise ValueError(f'every defender needs {column}{alternative}')
+    values = rows[column]
+    if values.dtype == object:
+        if pd.api.types.infer_dtype(values, skipna=False) not in REAL_TYPES:
+            real = values.map(lambda value: isinstance(value, numbers.Real) and not isinstance(value, bool))
+            if not real.all():
+                raise ValueError(f'{column} must be a number, got {values[~real.to_numpy()].iloc[0]!r}')
+    elif not pd.api.types.is_numeric_dtype(values) or pd.api.types.is_bool_dtype(values):
+        raise ValueError(f'{column} must be a number, got {values.dtype}')
+    finite = np.isfinite(values.to_numpy(dtype='float64'))
+    if not finite.all():
+        raise ValueError(f'{column} must be a number, got {values[~finite].iloc[0]!r}')
+
+
+def check_levels(rows, column, known):
+    if column not in rows:
+        raise ValueError(f'every defender needs {column}')
+    unknown = encoders.lookup(rows[column], known) < 0
+    if unknown.any():
+        raise ValueError(f'unknown {column} {rows[column][unknown].iloc[0]!r}, expected one of {known}')
+
+
+def resolve_rel_y(fronts):
+    # Technique-form defenders (technique plus side 'L' or 'R', as on page 2) get their rel_y
+    # from the technique chart; coordinate-form ones keep theirs
+    fronts = fronts.copy()
+    if 'technique' in fronts:
+        technique = fronts['technique'].notna().to_numpy()
+        rel_y = number(fronts['rel_y'] if 'rel_y' in fronts else np.full(len(fronts), np.nan))
+        if technique.any():
+            rel_y[technique] = encoders.technique_rel_y(fronts['technique'].to_numpy()[technique],
+                                                        fronts['side'].to_numpy()[technique])
+        fronts['rel_y'] = rel_y
+    for column in ['rel_x', 'rel_y', 'officialPosition']:
+        if column not in fronts or fronts[column].isna().any():
+            raise ValueError(f'every defender needs {column}' + (' or a technique' if column == 'rel_y' else ''))
+    return fronts
+
+
+def number(values):
+    return np.asarray(values, dtype='float64')
+
+
+def model_columns(fronts):
+    # Every model input column of a stack of fronts, before one-hot encoding
+    n = len(fronts)
+    rel_x, rel_y = number(fronts['rel_x']), number(fronts['rel_y'])
+    o_counts = encoders.o_personnel(fronts['personnelO'])
+    d_counts = encoders.d_personnel(fronts['personnelD'])
+    qb = encoders.formation_qb(fronts['offenseFormation'])
+    motion = SLOT_MOTION[np.asarray(fronts['slot'], dtype='int64')]
+    columns = {
+        'yardsToGo': number(fronts['yardsToGo']),
+        'absoluteYardlineNumber': number(fronts['absoluteYardlineNumber']),
+        'defendersInBox': number(fronts['defendersInBox']),
+        'rel_x': rel_x, 'rel_y': rel_y, 's': motion[:, 0], 'a': motion[:, 1],
+        'ball_x': number(fronts['absoluteYardlineNumber']), 'ball_y': encoders.ball_y(fronts['hash']),
+        'qb_dist_from_ball': qb[:, 0], 'qb_rel_x': qb[:, 1], 'qb_rel_y': qb[:, 2],
+        'dist_from_qb': encoders.dist_from_qb(rel_x, rel_y, qb[:, 3], qb[:, 2]),
+        'down': encoders.down_index(fronts['down']),
+        'officialPosition': np.asarray(fronts['officialPosition'], dtype=object),
+        'offenseFormation': encoders.formation_levels(fronts['offenseFormation']),
+    }
+    for i, name in enumerate(['num_rb', 'num_te', 'num_wr']):
+        columns[name] = o_counts[:, i]
+    for i, name in enumerate(['num_dl', 'num_lb', 'num_db']):
+        columns[name] = d_counts[:, i]
+    for name, value in zip(['oline_min', 'oline_max', 'oline_width'], OLINE_EXTENTS):
+        columns[name] = np.full(n, value)
+    return columns
+
+
+def layout(schema):
+    # Where every source column goes in the model matrix; a schema feature we can't
+    # produce means the model and this builder have drifted apart
+    names = schema['features']
+    position = {name: i for i, name in enumerate(names)}
+    categorical, covered = [], set()
+    for column, levels in schema['categories'].items():
+        if column not in CATEGORICAL:
+            raise ValueError(f'no encoder for categorical model column {column}')
+        dummies = [f'{column}_{level}' for level in levels]
+        categorical.append((column, levels, [position[name] for name in dummies]))
+        covered.update(dummies)
+    numeric = [(position[name], name) for name in names if name not in covered]
+    unknown = [name for _, name in numeric if name not in NUMERIC]
+    if unknown:
+        raise ValueError(f'model features {unknown} have no source column')
+    return numeric, categorical
+
+
+def feature_matrix(columns, schema, out=None):
+    numeric, categorical = layout(schema)
+    n = len(columns['rel_x'])
+    if out is None:
+        out = np.empty((n, len(schema['features'])), dtype='float32')
+    for i, name in numeric:
+        out[:, i] = columns[name]
+    for column, levels, positions in categorical:
+        out[:, positions] = encoders.one_hot(columns[column], levels)
+    return out
@@ -0,0 +1,55 @@
+import numpy as np
+import pandas as pd
+
+# playIds stay well below this within a game, so gameId * PLAY_SPAN + playId is unique
+PLAY_SPAN = 100000
+
+
+def play_key(game_ids, play_ids):
+    return np.asarray(game_ids, dtype='int64') * PLAY_SPAN + np.asarray(play_ids, dtype='int64')
+
+
+def group_bounds(codes):
+    # Stable sort by group, plus the start of every group's run in that order
+    order = np.argsort(codes, kind='stable')
+    sorted_codes = codes[order]
+    starts = np.flatnonzero(np.r_[True, sorted_codes[1:] != sorted_codes[:-1]])
+    return order, sorted_codes[starts], starts
+
+
+def group_min_max(codes, values, n_groups):
+    mn = np.full(n_groups, np.nan, dtype=values.dtype)
+    mx = np.full(n_groups, np.nan, dtype=values.dtype)
+    if len(codes):
+        order, groups, starts = group_bounds(codes)
+        mn[groups] = np.minimum.reduceat(values[order], starts)
+        mx[groups] = np.maximum.reduceat(values[order], starts)
+    return mn, mx
+
+
+def group_count(codes, n_groups):
+    return np.bincount(codes, minlength=n_groups)
+
+
+def group_first(codes, n_groups):
+    # Row index of the first row of every group, -1 for empty groups
+    first = np.full(n_groups, -1, dtype='int64')
+    groups, idx = np.unique(codes, return_index=True)
+    first[groups] = idx
+    return first
+
+
+def group_argmin(codes, values, n_groups):
+    # Row index of each group's smallest value; ties go to the earliest row like idxmin
+    best = np.full(n_groups, -1, dtype='int64')
+    if len(codes):
+        order = np.lexsort((values, codes))
+        sorted_codes = codes[order]
+        starts = np.flatnonzero(np.r_[True, sorted_codes[1:] != sorted_codes[:-1]])
+        best[sorted_codes[starts]] = order[starts]
+    return best
+
+
+def lookup(keys, index_keys):
+    # Position of every key in index_keys (-1 if absent)
+    return pd.Index(index_keys).get_indexer(keys)
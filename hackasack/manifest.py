@@ -0,0 +1,76 @@
+import hashlib
+import json
+import os
+
+
+def digest(*parts):
+    h = hashlib.blake2b(digest_size=16)
+    for part in parts:
+        h.update(str(part).encode())
+        h.update(b'\0')
+    return h.hexdigest()
+
+
+def file_digest(path):
+    h = hashlib.blake2b(digest_size=16)
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(1 << 24), b''):
+            h.update(block)
+    return h.hexdigest()
+
+
+def source_stamp(path):
+    # Size and mtime a derived artifact records of the file it was built from
+    stat = os.stat(path)
+    return {'size': stat.st_size, 'mtime': stat.st_mtime}
+
+
+def file_stamp(paths):
+    # (path, mtime, size) of every file, None for missing ones; cheap enough to check per call
+    stamp = []
+    for path in paths:
+        try:
+            stat = os.stat(path)
+            stamp.append((path, stat.st_mtime_ns, stat.st_size))
+        except FileNotFoundError:
+            stamp.append((path, None, None))
+    return stamp
+
+
+class Manifest:
+    # Records the content hash of every input file and, per week and stage, the key the
+    # stage's artifact was built from. A stage is reused only while its key still matches,
+    # so a new or corrected week csv invalidates that week alone.
+
+    def __init__(self, path):
+        self.path = path
+        self.data = {'inputs': {}, 'weeks': {}}
+        if os.path.exists(path):
+            with open(path) as f:
+                self.data = json.load(f)
+
+    def file_hash(self, path):
+        # Hashing several GB of csv is the slow part, so reuse the hash while size and mtime match
+        stat = os.stat(path)
+        entry = self.data['inputs'].get(path)
+        if entry and entry['size'] == stat.st_size and entry['mtime'] == stat.st_mtime:
+            return entry['hash']
+        file_hash = file_digest(path)
+        self.data['inputs'][path] = {'hash': file_hash, 'size': stat.st_size, 'mtime': stat.st_mtime}
+        return file_hash
+
+    def entry(self, week, stage):
+        return self.data['weeks'].get(str(week), {}).get(stage)
+
+    def fresh(self, week, stage, key):
+        entry = self.entry(week, stage)
+        return entry is not None and entry['key'] == key and os.path.exists(entry['path'])
+
+    def record(self, week, stage, key, path):
+        self.data['weeks'].setdefault(str(week), {})[stage] = {'key': key, 'path': path}
+
+    def save(self):
+        tmp_path = self.path + '.tmp'
+        with open(tmp_path, 'w') as f:
+            json.dump(self.data, f, indent=1, sort_keys=True)
+        os.replace(tmp_path, self.path)
@@ -0,0 +1,71 @@
+import functools
+import threading
+import time
+from collections import OrderedDict
+
+from hackasack.manifest import digest, file_stamp
+
+
+class CallbackMemo:
+    # Memoizes whole callback responses keyed on a digest of every argument. Entries expire
+    # after `ttl` seconds, the least recently used go first past `max_entries`, and all of
+    # them are dropped when any watched file (the model) changes on disk.
+    # What is kept is the returned object (components, figures), not Dash's JSON of it:
+    # a hit skips the scoring and figure building, but Dash still serializes the response.
+
+    def __init__(self, max_entries=256, ttl=600, watch=()):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.watch = list(watch)
+        self.entries = OrderedDict()
+        self.stamp = self.version()
+        self.hits = self.misses = self.evictions = self.invalidations = 0
+        self.lock = threading.Lock()
+
+    def version(self):
+        return file_stamp(self.watch)
+
+    def get(self, key):
+        now = time.monotonic()
+        with self.lock:
+            stamp = self.version()
+            if stamp != self.stamp:
+                self.entries.clear()
+                self.stamp = stamp
+                self.invalidations += 1
+            entry = self.entries.get(key)
+            if entry is not None and entry[0] > now:
+                self.entries.move_to_end(key)
+                self.hits += 1
+                return entry[1]
+            if entry is not None:
+                del self.entries[key]
+            self.misses += 1
+            return None
+
+    def put(self, key, value):
+        with self.lock:
+            self.entries[key] = (time.monotonic() + self.ttl, value)
+            self.entries.move_to_end(key)
+            while len(self.entries) > self.max_entries:
+                self.entries.popitem(last=False)
+                self.evictions += 1
+
+    def __call__(self, fn):
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            key = digest(fn.__name__, *args, *sorted(kwargs.items()))
+            value = self.get(key)
+            if value is None:
+                value = fn(*args, **kwargs)
+                self.put(key, value)
+            return value
+        return wrapper
+
+    def stats(self):
+        with self.lock:
+            return {
+                'entries': len(self.entries), 'max_entries': self.max_entries, 'ttl': self.ttl,
+                'hits': self.hits, 'misses': self.misses, 'evictions': self.evictions,
+                'invalidations': self.invalidations,
+            }
@@ -0,0 +1,102 @@
+import multiprocessing as mp
+import os
+import shutil
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+
+import pandas as pd
+
+from hackasack import frame_store, schema, snap_stream, tracking_cache
+from hackasack.features import snap_features
+from hackasack.manifest import digest
+
+# Bump whenever snap_features (or the dtypes it reads) changes what it produces
+FEATURES_VERSION = 1
+
+TRACKING_COLUMNS = [col for col in schema.columns('tracking', 'snap') if col != 'event']
+
+
+def load_week_snaps(week, source='csv', data_dir='bdb-datasets', cache_dir='bdb-cache/tracking', chunksize=500000,
+                    store_dir='bdb-cache/frames'):
+    if source == 'parquet':
+        tracking_cache.convert_weeks(data_dir, cache_dir, [week])
+        ball_snaps = tracking_cache.scan(cache_dir, columns=TRACKING_COLUMNS, weeks=[week],
+                                         event='ball_snap', exclude_team='football')
+        ball_loc = tracking_cache.scan(cache_dir, columns=['gameId', 'playId', 'x', 'y'], weeks=[week],
+                                       event='ball_snap', team='football')
+        ball_snaps, ball_loc = schema.apply_dtypes(ball_snaps, 'tracking'), schema.apply_dtypes(ball_loc, 'tracking')
+    elif source == 'memmap':
+        root = frame_store.convert_week(f'{data_dir}/week{week}.csv', store_dir, week, chunksize)
+        store = frame_store.FrameStore(root)
+        snaps = store.to_frame(store.rows_where('event', 'ball_snap'), TRACKING_COLUMNS)
+        is_ball = (snaps['team'] == 'football')
+        ball_snaps, ball_loc = snaps[~is_ball], snaps.loc[is_ball, ['gameId', 'playId', 'x', 'y']]
+    elif source == 'stream':
+        ball_snaps, ball_loc = snap_stream.stream_ball_snaps([f'{data_dir}/week{week}.csv'], chunksize, TRACKING_COLUMNS)
+    else:
+        df = schema.read_csv(f'{data_dir}/week{week}.csv', 'tracking', 'snap', report=True)
+        snaps = df[(df['event'] == 'ball_snap')]
+        is_ball = (snaps['team'] == 'football')
+        ball_snaps, ball_loc = snaps.loc[~is_ball, TRACKING_COLUMNS], snaps.loc[is_ball, ['gameId', 'playId', 'x', 'y']]
+    return ball_snaps, ball_loc
+
+
+def build_week(week, snaps_dir=None, reuse_snaps=False, *, players_select, **source_args):
+    if reuse_snaps:
+        ball_snaps = pd.read_parquet(os.path.join(snaps_dir, 'snaps.parquet'))
+        ball_loc = pd.read_parquet(os.path.join(snaps_dir, 'ball.parquet'))
+    else:
+        ball_snaps, ball_loc = load_week_snaps(week, **source_args)
+        if snaps_dir is not None:
+            os.makedirs(snaps_dir, exist_ok=True)
+            ball_snaps.to_parquet(os.path.join(snaps_dir, 'snaps.parquet'), index=False)
+            ball_loc.to_parquet(os.path.join(snaps_dir, 'ball.parquet'), index=False)
+    return snap_features(ball_snaps, ball_loc, players_select)
+
+
+def map_weeks(build, weeks, workers, *args):
+    if workers > 1 and len(weeks) > 1:
+        # build.py is a plain top-level script, so prefer fork over spawn to keep the
+        # workers from re-running it when they import __main__
+        ctx = mp.get_context('fork') if 'fork' in mp.get_all_start_methods() else None
+        with ProcessPoolExecutor(max_workers=min(workers, len(weeks)), mp_context=ctx) as pool:
+            return list(pool.map(build, weeks, *args))
+    return list(map(build, weeks, *args))
+
+
+def drop_derived_week(week, source_args):
+    # The week's csv changed, so its parquet partition / frame store are stale too
+    shutil.rmtree(tracking_cache.week_dir(source_args.get('cache_dir', 'bdb-cache/tracking'), week), ignore_errors=True)
+    shutil.rmtree(frame_store.week_dir(source_args.get('store_dir', 'bdb-cache/frames'), week), ignore_errors=True)
+
+
+def build_weeks(weeks, players_select, workers=1, manifest=None, artifact_dir='bdb-cache/weeks', players_key='',
+                **source_args):
+    # Plays never cross weeks, so each week goes through snap_features on its own
+    # and the per-week defense_keep frames are simply stacked
+    build = partial(build_week, players_select=players_select, **source_args)
+    if manifest is None:
+        return pd.concat(map_weeks(build, weeks, workers), ignore_index=True)
+
+    data_dir = source_args.get('data_dir', 'bdb-datasets')
+    snaps_keys = {week: manifest.file_hash(f'{data_dir}/week{week}.csv') for week in weeks}
+    feature_keys = {week: digest(snaps_keys[week], players_key, FEATURES_VERSION) for week in weeks}
+    stale = [week for week in weeks if not manifest.fresh(week, 'features', feature_keys[week])]
+    reuse = [manifest.fresh(week, 'snaps', snaps_keys[week]) for week in stale]
+    snaps_dirs = [os.path.join(artifact_dir, f'week{week}') for week in stale]
+    for week, reused in zip(stale, reuse):
+        entry = manifest.entry(week, 'snaps')
+        if not reused and entry is not None and entry['key'] != snaps_keys[week]:
+            drop_derived_week(week, source_args)
+
+    print(f'rebuilding weeks {stale}, reusing {[week for week in weeks if week not in stale]}')
+    built = dict(zip(stale, map_weeks(build, stale, workers, snaps_dirs, reuse)))
+    for week, snaps_dir in zip(stale, snaps_dirs):
+        features_path = os.path.join(snaps_dir, 'features.parquet')
+        built[week].to_parquet(features_path, index=False)
+        manifest.record(week, 'snaps', snaps_keys[week], snaps_dir)
+        manifest.record(week, 'features', feature_keys[week], features_path)
+    manifest.save()
+
+    return pd.concat([built[week] if week in built else pd.read_parquet(manifest.entry(week, 'features')['path'])
+                      for week in weeks], ignore_index=True)
@@ -0,0 +1,197 @@
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+
+import numpy as np
+
+# Rough per-entry cost on top of the key bytes: the dict slot, the bytes object header and
+# the float holding the prediction
+ENTRY_OVERHEAD = 150
+
+
+def row_keys(X, resolution, tag=b''):
+    # A defender's feature row rounded to `resolution` (the dashboard inputs are entered to 0.01)
+    q = np.rint(np.asarray(X, dtype='float64') / resolution).astype('int64')
+    return [tag + row.tobytes() for row in q]
+
+
+def cached_rows(cache, X, compute, width=None, tag=b''):
+    # Looks every row up in the cache in one go and computes only the misses, in one batch.
+    # width is the length of a per-row vector output (None for one value per row), and tag
+    # keeps different outputs of the same row apart
+    keys = cache.keys(X, tag)
+    values = cache.get_many(keys)
+    out = np.empty(len(keys) if width is None else (len(keys), width), dtype='float32')
+    missing = [i for i, value in enumerate(values) if value is None]
+    for i, value in enumerate(values):
+        if value is not None:
+            out[i] = value
+    if missing:
+        out[missing] = compute(X[missing])
+        cache.set_many([keys[i] for i in missing], out[missing])
+    return out
+
+
+def cached_predict(cache, booster, X):
+    return cached_rows(cache, X, booster.inplace_predict)
+
+
+def value_bytes(value):
+    return getattr(value, 'nbytes', 0)
+
+
+class PredictionCache:
+    # In-process LRU of model outputs keyed by quantized feature row, bounded by an
+    # estimate of its memory use
+
+    def __init__(self, max_bytes, resolution=0.01):
+        self.max_bytes = max_bytes
+        self.resolution = resolution
+        self.entries = OrderedDict()
+        self.nbytes = 0
+        self.hits = self.misses = self.evictions = 0
+        self.lock = threading.Lock()
+
+    def keys(self, X, tag=b''):
+        return row_keys(X, self.resolution, tag)
+
+    def get_many(self, keys):
+        values = []
+        with self.lock:
+            for key in keys:
+                value = self.entries.get(key)
+                if value is not None:
+                    self.entries.move_to_end(key)
+                values.append(value)
+            misses = sum(value is None for value in values)
+            self.hits += len(keys) - misses
+            self.misses += misses
+        return values
+
+    def set_many(self, keys, values):
+        with self.lock:
+            for key, value in zip(keys, values):
+                self.put(key, value)
+
+    def put(self, key, value):
+        if key in self.entries:
+            self.entries.move_to_end(key)
+            return
+        value = float(value) if np.ndim(value) == 0 else np.array(value, dtype='float32')
+        self.entries[key] = value
+        self.nbytes += len(key) + ENTRY_OVERHEAD + value_bytes(value)
+        while self.nbytes > self.max_bytes and self.entries:
+            old_key, old_value = self.entries.popitem(last=False)
+            self.nbytes -= len(old_key) + ENTRY_OVERHEAD + value_bytes(old_value)
+            self.evictions += 1
+
+    def predict(self, booster, X):
+        return cached_predict(self, booster, X)
+
+    def clear(self):
+        with self.lock:
+            self.entries.clear()
+            self.nbytes = 0
+
+    def stats(self):
+        with self.lock:
+            lookups = self.hits + self.misses
+            return {
+                'backend': 'memory', 'entries': len(self.entries), 'bytes': self.nbytes,
+                'max_bytes': self.max_bytes, 'hits': self.hits, 'misses': self.misses,
+                'evictions': self.evictions, 'hit_rate': self.hits / lookups if lookups else 0.0,
+            }
+
+
+def decode(raw):
+    value = np.frombuffer(raw, dtype='float32')
+    return float(value[0]) if len(value) == 1 else value
+
+
+class RedisPredictionCache:
+    # Prediction cache shared by every worker through a Redis-compatible store. Keys are a
+    # 16-byte digest of the quantized row under a per-model namespace, values the float32
+    # bytes (a vector of them for contributions); the 11 rows of a front are read with one
+    # MGET and written in one pipeline.
+    # While the store is unreachable the in-process `fallback` cache is used instead and
+    # the store is retried every `retry_after` seconds.
+
+    def __init__(self, url=None, fallback=None, namespace=b'', ttl=86400, resolution=0.01, retry_after=5,
+                 client=None):
+        import redis
+        if client is None:
+            client = redis.Redis.from_url(url, socket_timeout=0.05, socket_connect_timeout=0.05)
+        self.store_errors = (redis.RedisError, OSError)
+        self.client = client
+        self.fallback = fallback
+        self.prefix = b'hackasack:' + namespace + b':'
+        self.ttl = ttl
+        self.resolution = resolution
+        self.retry_after = retry_after
+        self.down_until = 0.0
+        self.hits = self.misses = self.errors = 0
+        self.lock = threading.Lock()
+
+    def set_namespace(self, namespace):
+        # Entries of another model are neither read nor overwritten; the fallback holds
+        # nothing worth keeping either
+        self.prefix = b'hackasack:' + namespace + b':'
+        if self.fallback is not None:
+            self.fallback.clear()
+
+    def keys(self, X, tag=b''):
+        return [self.prefix + tag + hashlib.blake2b(key, digest_size=16).digest()
+                for key in row_keys(X, self.resolution)]
+
+    def available(self):
+        return time.monotonic() >= self.down_until
+
+    def failed(self):
+        with self.lock:
+            self.errors += 1
+            self.down_until = time.monotonic() + self.retry_after
+
+    def get_many(self, keys):
+        if self.available():
+            try:
+                raw = self.client.mget(keys)
+            except self.store_errors:
+                self.failed()
+            else:
+                values = [None if value is None else decode(value) for value in raw]
+                with self.lock:
+                    misses = sum(value is None for value in values)
+                    self.hits += len(keys) - misses
+                    self.misses += misses
+                return values
+        if self.fallback is None:
+            return [None] * len(keys)
+        return self.fallback.get_many(keys)
+
+    def set_many(self, keys, values):
+        if self.available():
+            try:
+                pipe = self.client.pipeline(transaction=False)
+                for key, value in zip(keys, values):
+                    pipe.set(key, np.asarray(value, dtype='float32').tobytes(), ex=self.ttl)
+                pipe.execute()
+                return
+            except self.store_errors:
+                self.failed()
+        if self.fallback is not None:
+            self.fallback.set_many(keys, values)
+
+    def predict(self, booster, X):
+        return cached_predict(self, booster, X)
+
+    def stats(self):
+        with self.lock:
+            lookups = self.hits + self.misses
+            stats = {
+                'backend': 'redis', 'available': self.available(), 'hits': self.hits, 'misses': self.misses,
+                'errors': self.errors, 'hit_rate': self.hits / lookups if lookups else 0.0,
+            }
+        if self.fallback is not None:
+            stats['fallback'] = self.fallback.stats()
+        return stats
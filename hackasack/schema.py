@@ -0,0 +1,96 @@
+import sys
+
+import numpy as np
+import pandas as pd
+
+# Compact dtypes for every BDB input we read; ids are int32, coordinates float32 and
+# repeated strings categorical. Nullable columns keep a float / nullable int type.
+DTYPES = {
+    'tracking': {
+        'gameId': 'int32', 'playId': 'int32', 'nflId': 'Int32', 'frameId': 'int32',
+        'jerseyNumber': 'float32', 'team': 'category', 'playDirection': 'category',
+        'x': 'float32', 'y': 'float32', 's': 'float32', 'a': 'float32', 'dis': 'float32',
+        'o': 'float32', 'dir': 'float32', 'event': 'category',
+    },
+    'plays': {
+        'gameId': 'int32', 'playId': 'int32', 'quarter': 'int8', 'down': 'int8', 'yardsToGo': 'int8',
+        'possessionTeam': 'category', 'defensiveTeam': 'category', 'absoluteYardlineNumber': 'float32',
+        'offenseFormation': 'category', 'personnelO': 'category', 'defendersInBox': 'float32',
+        'personnelD': 'category',
+    },
+    'players': {
+        'nflId': 'int32', 'officialPosition': 'category', 'displayName': 'category',
+    },
+    'pff': {
+        'gameId': 'int32', 'playId': 'int32', 'nflId': 'int32', 'pff_hit': 'float32',
+        'pff_hurry': 'float32', 'pff_sack': 'float32',
+    },
+    'games': {
+        'gameId': 'int32', 'season': 'int16', 'week': 'int8',
+    },
+}
+
+# Columns each build stage actually touches
+STAGES = {
+    'tracking': {
+        'snap': ['gameId', 'playId', 'nflId', 'team', 'playDirection', 'x', 'y', 's', 'a', 'dir', 'o', 'event'],
+    },
+    'plays': {
+        'features': ['gameId', 'playId', 'down', 'yardsToGo', 'absoluteYardlineNumber', 'offenseFormation',
+                     'personnelO', 'defendersInBox', 'personnelD'],
+        'scoring': ['gameId', 'playId', 'defensiveTeam'],
+    },
+    'players': {
+        'features': ['nflId', 'officialPosition'],
+        'scoring': ['nflId', 'displayName'],
+    },
+    'pff': {
+        'features': ['gameId', 'playId', 'nflId', 'pff_sack'],
+    },
+}
+
+
+def columns(table, stage=None):
+    if stage is None:
+        return None
+    return STAGES[table][stage]
+
+
+def csv_kwargs(table, stage=None):
+    usecols = columns(table, stage)
+    dtypes = DTYPES[table]
+    if usecols is not None:
+        dtypes = {col: dtypes[col] for col in usecols if col in dtypes}
+    return {'usecols': usecols, 'dtype': dtypes}
+
+
+def apply_dtypes(df, table):
+    # For frames that didn't come straight from read_csv (parquet scans, concatenated
+    # chunks whose categories disagree)
+    dtypes = {col: dtype for col, dtype in DTYPES[table].items() if col in df.columns and df[col].dtype != dtype}
+    return df.astype(dtypes) if dtypes else df
+
+
+def default_nbytes(series):
+    # What the column would take with read_csv's defaults: 8 bytes per value for
+    # numbers, a pointer plus a python str per value for strings
+    if isinstance(series.dtype, pd.CategoricalDtype):
+        sizes = np.array([sys.getsizeof(c) for c in series.cat.categories] + [sys.getsizeof(np.nan)])
+        return 8 * len(series) + int(sizes[series.cat.codes.values].sum())
+    return 8 * len(series)
+
+
+def memory_report(name, df, total_columns=None):
+    compact = int(df.memory_usage(index=False, deep=True).sum())
+    default = sum(default_nbytes(df[col]) for col in df.columns)
+    projected = f'{df.shape[1]} of {total_columns} columns' if total_columns else f'{df.shape[1]} columns'
+    return (f'{name}: {compact / 1e6:.1f} MB vs {default / 1e6:.1f} MB with default dtypes '
+            f'({1 - compact / max(default, 1):.0%} saved, {projected})')
+
+
+def read_csv(path, table, stage=None, report=False):
+    df = pd.read_csv(path, **csv_kwargs(table, stage))
+    if report:
+        total = len(pd.read_csv(path, nrows=0).columns)
+        print(memory_report(path, df, total))
+    return df
@@ -0,0 +1,107 @@
+import os
+import threading
+
+import numpy as np
+import pandas as pd
+
+from hackasack import encoders, explain, feature_schema, fronts
+from hackasack.manifest import file_stamp
+
+# Scoring API for notebooks, batch jobs and the dashboard:
+#
+#   from hackasack.scoring import score_fronts
+#   scored = score_fronts(df)    # one row per defender -> the same rows plus rel_y, dist_from_qb, sack_prob
+#
+# df holds the situation columns (yardsToGo, absoluteYardlineNumber, defendersInBox, personnelO,
+# personnelD, hash, down, offenseFormation), officialPosition, rel_x (or depth) and either rel_y
+# or page 2's technique and side. slot (0-10) is taken from the row's place in its front when
+# missing. The whole frame is encoded at once and scored with one predict.
+#
+#   contribs = explain_fronts(df)   # the TreeSHAP contribution of every model feature, same rows
+#   probs = sweep_defender(df, 6, rel_x_grid, rel_y_grid)   # player 7 moved over a field grid
+
+DEFAULT_MODEL = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'xgb_sack')
+
+models = {}
+models_lock = threading.Lock()
+
+
+def load_model(path=DEFAULT_MODEL, nthread=None):
+    # (booster, schema), loaded and checked once per path and thread count and loaded again
+    # when the model or its schema file changes on disk. While a swap is half written (the
+    # pair doesn't load or doesn't agree) the previous model keeps serving.
+    key = (os.path.abspath(path), nthread)
+    stamp = file_stamp([path, feature_schema.schema_path(path)])
+    if key not in models or models[key][0] != stamp:
+        with models_lock:
+            if key not in models or models[key][0] != stamp:
+                try:
+                    booster, schema = feature_schema.load_model(path, {} if nthread is None else {'nthread': nthread})
+                    fronts.layout(schema)
+                except Exception:
+                    if key not in models:
+                        raise
+                    return models[key][1]
+                models[key] = stamp, (booster, schema)
+    return models[key][1]
+
+
+def prepare(df):
+    rows = df.rename(columns={'depth': 'rel_x'}) if 'rel_x' not in df else df
+    if 'slot' not in rows:
+        rows = rows.copy()
+        if 'front' in rows:
+            rows['slot'] = rows.groupby('front').cumcount()
+        else:
+            rows['slot'] = [i % 11 for i in range(len(rows))]
+    if 'hash' not in rows:
+        rows = rows.assign(hash=encoders.HASH_DEFAULT)
+    return fronts.resolve_rel_y(rows)
+
+
+def score_fronts(df, model=None, cache=None):
+    # model is a path or a (booster, schema) pair from load_model, xgb_sack by default; a
+    # prediction cache only sends the rows it hasn't seen to the booster
+    if model is None or isinstance(model, str):
+        model = load_model(model or DEFAULT_MODEL)
+    booster, schema = model
+    rows = prepare(df)
+    if len(rows) == 0:
+        return rows.assign(dist_from_qb=pd.Series(dtype='float64'), sack_prob=pd.Series(dtype='float32'))
+    columns = fronts.model_columns(rows)
+    X = fronts.feature_matrix(columns, schema)
+    prob = cache.predict(booster, X) if cache is not None else booster.inplace_predict(X)
+    return rows.assign(rel_y=columns['rel_y'], dist_from_qb=columns['dist_from_qb'], sack_prob=prob)
+
+
+def explain_fronts(df, model=None, cache=None):
+    # Log-odds contributions of every feature (and the bias) to each row's sack_prob, all rows
+    # in one pred_contribs call
+    if model is None or isinstance(model, str):
+        model = load_model(model or DEFAULT_MODEL)
+    booster, schema = model
+    rows = prepare(df)
+    X = fronts.feature_matrix(fronts.model_columns(rows), schema) if len(rows) else np.empty((0, len(schema['features'])))
+    return pd.DataFrame(explain.cached_contributions(cache, booster, X), columns=explain.columns(schema),
+                        index=rows.index)
+
+
+def sweep_defender(df, slot, rel_x, rel_y, model=None):
+    # sack_prob of defender `slot` of one front placed at every (rel_x, rel_y) pair of the two
+    # grids, shape (len(rel_x), len(rel_y)), from one predict. A defender's features don't
+    # depend on where the other ten stand, so only that row is repeated.
+    if model is None or isinstance(model, str):
+        model = load_model(model or DEFAULT_MODEL)
+    booster, schema = model
+    rows = prepare(df)
+    xx, yy = np.meshgrid(np.asarray(rel_x, dtype='float64'), np.asarray(rel_y, dtype='float64'), indexing='ij')
+    cells = rows.iloc[np.full(xx.size, slot)].assign(rel_x=xx.ravel(), rel_y=yy.ravel())
+    X = fronts.feature_matrix(fronts.model_columns(cells), schema)
+    return booster.inplace_predict(X).reshape(xx.shape)
+
+
+def score_records(records, model=None, cache=None):
+    # The JSON form of /api/v1/score; values the model doesn't know raise ValueError
+    if model is None or isinstance(model, str):
+        model = load_model(model or DEFAULT_MODEL)
+    return score_fronts(fronts.from_records(records, model[1]), model, cache)
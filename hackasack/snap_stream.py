@@ -0,0 +1,33 @@
+import pandas as pd
+
+from hackasack import schema
+
+
+def iter_chunks(paths, chunksize):
+    for path in paths:
+        yield from pd.read_csv(path, chunksize=chunksize, **schema.csv_kwargs('tracking', 'snap'))
+
+
+def iter_snap_frames(chunks):
+    # Drops every non-snap frame as soon as its chunk is parsed, so only one
+    # chunk of raw tracking is ever alive at a time
+    for chunk in chunks:
+        snaps = chunk[(chunk['event'] == 'ball_snap')]
+        if len(snaps):
+            yield snaps
+
+
+def iter_split_football(snap_frames, columns):
+    for snaps in snap_frames:
+        is_ball = (snaps['team'] == 'football')
+        yield snaps.loc[~is_ball, columns], snaps.loc[is_ball, ['gameId', 'playId', 'x', 'y']]
+
+
+def stream_ball_snaps(paths, chunksize, columns):
+    player_parts, ball_parts = [], []
+    for players, ball in iter_split_football(iter_snap_frames(iter_chunks(paths, chunksize)), columns):
+        player_parts.append(players)
+        ball_parts.append(ball)
+    # Chunks infer their own categories, so re-apply the compact dtypes after stacking
+    return (schema.apply_dtypes(pd.concat(player_parts, ignore_index=True), 'tracking'),
+            schema.apply_dtypes(pd.concat(ball_parts, ignore_index=True), 'tracking'))
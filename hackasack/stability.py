@@ -0,0 +1,103 @@
+import multiprocessing as mp
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+# Split-half reliability of the per-player sack metrics over random partitions of the weeks
+# (or games). Snaps, sacks and expected sacks are summed per unit and player once; a batch of
+# splits is then a 0/1 unit mask times those matrices, and each split's correlation between
+# its two halves a masked row reduction. Metrics follow sack-graph-making.R: sacks and
+# exp_sacks per snap, sacks_oe summed.
+
+METRICS = ['sacks', 'exp_sacks', 'sacks_oe']
+
+# Splits per task handed to the pool
+BLOCK = 500
+
+# The unit x player sums, set once per worker process
+table = {}
+
+
+def unit_table(preds, by='week', min_snaps=200):
+    unit_column = 'gameId' if by == 'game' else by
+    units, unit = np.unique(preds[unit_column].to_numpy(), return_inverse=True)
+    players, player = np.unique(preds['nflId'].to_numpy(), return_inverse=True)
+    cell = unit * len(players) + player
+    size = len(units) * len(players)
+    sums = {
+        'snaps': np.bincount(cell, minlength=size),
+        'sacks': np.bincount(cell, weights=preds['pff_sack'].to_numpy(dtype='float64'), minlength=size),
+        'exp_sacks': np.bincount(cell, weights=preds['sack_pred'].to_numpy(dtype='float64'), minlength=size),
+    }
+    sums = {name: values.reshape(len(units), len(players)).astype('float64') for name, values in sums.items()}
+    # Same cut as the R script: enough snaps over the whole season, so the player set is
+    # fixed and only the halves move
+    keep = sums['snaps'].sum(axis=0) >= min_snaps
+    return {'units': units, 'players': players[keep], **{name: values[:, keep] for name, values in sums.items()}}
+
+
+def set_table(units):
+    table.update(units)
+
+
+def half_metrics(snaps, sacks, exp_sacks):
+    with np.errstate(invalid='ignore', divide='ignore'):
+        return {'sacks': sacks / snaps, 'exp_sacks': exp_sacks / snaps, 'sacks_oe': sacks - exp_sacks}
+
+
+def masked_corr(x, y, valid):
+    # Pearson r of every row of x against the same row of y over its valid columns; NaN for
+    # a row with fewer than two
+    n = valid.sum(axis=1)
+    x, y = np.where(valid, x, 0.0), np.where(valid, y, 0.0)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        mx, my = x.sum(axis=1) / n, y.sum(axis=1) / n
+        dx, dy = np.where(valid, x - mx[:, None], 0.0), np.where(valid, y - my[:, None], 0.0)
+        return (dx * dy).sum(axis=1) / np.sqrt((dx * dx).sum(axis=1) * (dy * dy).sum(axis=1))
+
+
+def split_masks(rng, n, n_units):
+    # n random halves, each picking n_units // 2 of the units
+    ranks = np.argsort(rng.random((n, n_units)), axis=1)
+    return (ranks < n_units // 2).astype('float64')
+
+
+def split_block(seed, n):
+    rng = np.random.default_rng(seed)
+    masks = split_masks(rng, n, len(table['units']))
+    first = {name: masks @ table[name] for name in ['snaps', 'sacks', 'exp_sacks']}
+    second = {name: table[name].sum(axis=0) - first[name] for name in first}
+    valid = (first['snaps'] > 0) & (second['snaps'] > 0)
+    a, b = half_metrics(**first), half_metrics(**second)
+    return np.stack([masked_corr(a[metric], b[metric], valid) for metric in METRICS], axis=1)
+
+
+def split_half(preds, by='week', splits=1000, workers=1, seed=42, min_snaps=200):
+    # One row per random split with the half-vs-half correlation of every metric
+    units = unit_table(preds, by, min_snaps)
+    blocks = [min(BLOCK, splits - start) for start in range(0, splits, BLOCK)]
+    seeds = np.random.SeedSequence(seed).spawn(len(blocks))
+    if workers > 1:
+        ctx = mp.get_context('fork') if 'fork' in mp.get_all_start_methods() else None
+        with ProcessPoolExecutor(max_workers=workers, mp_context=ctx, initializer=set_table,
+                                 initargs=(units,)) as pool:
+            results = list(pool.map(split_block, seeds, blocks))
+    else:
+        set_table(units)
+        results = [split_block(s, n) for s, n in zip(seeds, blocks)]
+    return pd.DataFrame(np.concatenate(results), columns=METRICS)
+
+
+def summarize(correlations):
+    # Distribution of r per metric, with r squared (what the R script reports) and the
+    # Spearman-Brown full-sample reliability 2r / (1 + r)
+    rows = []
+    for metric in METRICS:
+        r = correlations[metric].dropna()
+        rows.append({
+            'metric': metric, 'splits': len(r), 'r_mean': r.mean(), 'r_median': r.median(),
+            'r_p05': r.quantile(0.05), 'r_p95': r.quantile(0.95), 'r2_mean': (r ** 2).mean(),
+            'spearman_brown': (2 * r / (1 + r)).mean(),
+        })
+    return pd.DataFrame(rows)
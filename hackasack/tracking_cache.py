@@ -0,0 +1,78 @@
+import json
+import os
+import shutil
+
+import pyarrow as pa
+import pyarrow.csv as pv
+import pyarrow.dataset as ds
+
+from hackasack.manifest import source_stamp
+
+# Types for the BDB tracking csvs so every streamed block of a week parses the same way
+TRACKING_TYPES = {
+    'gameId': pa.int64(), 'playId': pa.int64(), 'nflId': pa.float64(), 'frameId': pa.int64(),
+    'time': pa.string(), 'jerseyNumber': pa.float64(), 'team': pa.string(), 'playDirection': pa.string(),
+    'x': pa.float64(), 'y': pa.float64(), 's': pa.float64(), 'a': pa.float64(), 'dis': pa.float64(),
+    'o': pa.float64(), 'dir': pa.float64(), 'event': pa.string(),
+}
+
+
+# Size and mtime of the csv a partition was converted from; dataset discovery skips files
+# starting with '_'
+SOURCE_FILE = '_source.json'
+
+
+def week_dir(cache_dir, week):
+    return os.path.join(cache_dir, f'week={week}')
+
+
+def is_converted(cache_dir, week, csv_path):
+    # Converted from the csv as it is now; a changed (or pre-stamp) partition is converted again
+    try:
+        with open(os.path.join(week_dir(cache_dir, week), SOURCE_FILE)) as f:
+            return json.load(f) == source_stamp(csv_path)
+    except FileNotFoundError:
+        return False
+
+
+def convert_week(csv_path, cache_dir, week):
+    # Stream the csv in blocks into week=N/gameId=M/*.parquet; written to a dot-prefixed
+    # temp dir first (which dataset discovery skips) so an interrupted or still running
+    # conversion never looks like a finished partition
+    tmp_dir = os.path.join(cache_dir, f'.week={week}.tmp')
+    shutil.rmtree(tmp_dir, ignore_errors=True)
+    reader = pv.open_csv(csv_path, convert_options=pv.ConvertOptions(column_types=TRACKING_TYPES))
+    ds.write_dataset(reader, tmp_dir, format='parquet',
+                     partitioning=ds.partitioning(pa.schema([('gameId', pa.int64())]), flavor='hive'),
+                     existing_data_behavior='overwrite_or_ignore')
+    with open(os.path.join(tmp_dir, SOURCE_FILE), 'w') as f:
+        json.dump(source_stamp(csv_path), f)
+    shutil.rmtree(week_dir(cache_dir, week), ignore_errors=True)
+    os.replace(tmp_dir, week_dir(cache_dir, week))
+
+
+def convert_weeks(data_dir, cache_dir, weeks):
+    os.makedirs(cache_dir, exist_ok=True)
+    for week in weeks:
+        csv_path = os.path.join(data_dir, f'week{week}.csv')
+        if not is_converted(cache_dir, week, csv_path):
+            convert_week(csv_path, cache_dir, week)
+
+
+def scan(cache_dir, columns=None, weeks=None, event=None, team=None, exclude_team=None):
+    # Only the projected columns are decoded and the filters are evaluated inside the
+    # scan, so row groups / partitions that can't match are never materialized
+    dataset = ds.dataset(cache_dir, format='parquet', partitioning='hive')
+    conditions = []
+    if weeks is not None:
+        conditions.append(ds.field('week').isin(list(weeks)))
+    if event is not None:
+        conditions.append(ds.field('event') == event)
+    if team is not None:
+        conditions.append(ds.field('team') == team)
+    if exclude_team is not None:
+        conditions.append(ds.field('team') != exclude_team)
+    filt = None
+    for condition in conditions:
+        filt = condition if filt is None else filt & condition
+    return dataset.to_table(columns=columns, filter=filt).to_pandas()
@@ -0,0 +1,134 @@
+# Load test for the front builder callbacks: posts submits to /_dash-update-component from
+# --concurrency threads for --duration seconds and reports throughput and latency.
+#
+#   python loadtest.py --url http://127.0.0.1:8050            against a running server
+#   python loadtest.py --workers 1 2 4 8                      starts gunicorn per worker count
+import argparse
+import json
+import os
+import random
+import subprocess
+import sys
+import threading
+import time
+import urllib.request
+
+import main
+
+PAGES = {
+    1: ('..prediction output-1.children...play-diagram-1.figure..', main.page_1_layout),
+    2: ('..prediction output.children...play-diagram.figure..', main.page_2_layout),
+}
+
+
+def default_values(layout):
+    return {component.id: component.value for component in layout._traverse()
+            if getattr(component, 'id', None) is not None and hasattr(component, 'value')}
+
+
+def payload(page, vary):
+    output, layout = PAGES[page]
+    callback = main.app.callback_map[output]
+    values = default_values(layout)
+    state = []
+    for item in callback['state']:
+        value = values.get(item['id'])
+        # Nudging every spot keeps the prediction cache and callback memo from answering
+        if vary and item['id'].startswith('rel_x'):
+            value = round(value + random.uniform(-1, 1), 2)
+        state.append(dict(item, value=value))
+    return {
+        'output': output,
+        'outputs': [{'id': o.component_id, 'property': o.component_property} for o in callback['output']],
+        'inputs': [dict(item, value=1) for item in callback['inputs']],
+        'changedPropIds': [f"{item['id']}.{item['property']}" for item in callback['inputs']],
+        'state': state,
+    }
+
+
+def run(url, page, concurrency, duration, vary):
+    latencies, errors = [], []
+    lock = threading.Lock()
+    deadline = time.perf_counter() + duration
+
+    def client():
+        while time.perf_counter() < deadline:
+            body = json.dumps(payload(page, vary)).encode()
+            request = urllib.request.Request(url + '/_dash-update-component', body,
+                                             {'Content-Type': 'application/json'})
+            t = time.perf_counter()
+            try:
+                with urllib.request.urlopen(request, timeout=30) as response:
+                    response.read()
+            except Exception as e:
+                with lock:
+                    errors.append(e)
+                continue
+            with lock:
+                latencies.append(time.perf_counter() - t)
+
+    pool = [threading.Thread(target=client) for _ in range(concurrency)]
+    for thread in pool:
+        thread.start()
+    for thread in pool:
+        thread.join()
+    latencies.sort()
+    n = len(latencies)
+    return {
+        'requests': n, 'errors': len(errors), 'rps': n / duration,
+        'p50_ms': 1000 * latencies[n // 2] if n else None,
+        'p95_ms': 1000 * latencies[int(n * 0.95)] if n else None,
+    }
+
+
+def wait_healthy(url, timeout=60):
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        try:
+            with urllib.request.urlopen(url + '/healthz', timeout=1) as response:
+                if response.status == 200:
+                    return
+        except Exception:
+            pass
+        time.sleep(0.2)
+    raise RuntimeError(f'{url} did not become healthy')
+
+
+def run_gunicorn(workers, args):
+    port = args.port
+    env = dict(os.environ, WEB_CONCURRENCY=str(workers), HACKASACK_BIND=f'127.0.0.1:{port}',
+               HACKASACK_WARMUP='1')
+    if not args.cache:
+        env.update(HACKASACK_PREDICTION_CACHE_MB='0', HACKASACK_CALLBACK_MEMO='0')
+    proc = subprocess.Popen([sys.executable, '-m', 'gunicorn', 'main:server'], env=env,
+                            cwd=os.path.dirname(os.path.abspath(__file__)),
+                            stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    try:
+        url = f'http://127.0.0.1:{port}'
+        wait_healthy(url)
+        return run(url, args.page, args.concurrency or 2 * workers, args.duration, not args.no_vary)
+    finally:
+        proc.terminate()
+        proc.wait()
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Load test the front builder callbacks')
+    parser.add_argument('--url', help='server to test; without it gunicorn is started for every --workers count')
+    parser.add_argument('--workers', type=int, nargs='+', default=[1, 2, 4])
+    parser.add_argument('--port', type=int, default=8051)
+    parser.add_argument('--page', type=int, choices=[1, 2], default=1)
+    parser.add_argument('--concurrency', type=int, help='client threads (default 2 per worker, 8 with --url)')
+    parser.add_argument('--duration', type=float, default=10)
+    parser.add_argument('--no-vary', action='store_true', help='resubmit the default front every time')
+    parser.add_argument('--cache', action='store_true', help='keep the prediction cache on in the gunicorn runs')
+    args = parser.parse_args()
+
+    if args.url:
+        print(run(args.url, args.page, args.concurrency or 8, args.duration, not args.no_vary))
+    else:
+        print('workers  requests  errors     req/s   p50 ms   p95 ms')
+        for workers in args.workers:
+            result = run_gunicorn(workers, args)
+            print(f"{workers:7d}  {result['requests']:8d}  {result['errors']:6d}  {result['rps']:8.1f}  "
+                  f"{result['p50_ms'] or 0:7.1f}  {result['p95_ms'] or 0:7.1f}")
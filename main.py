@@ -1,15 +1,34 @@
+import hashlib
+import os
+import sys
+import threading
+import time
+startup_t0 = time.perf_counter()
 import dash
 from dash import dcc
 from dash import html
 from dash.dependencies import Input, Output, State
 import dash_bootstrap_components as dbc
-import numpy as np
-from xgboost import Booster, DMatrix
-import plotly.graph_objs as go
-import matplotlib as plt
-import pandas as pd
-import dash_table as dt
-import plotly.express as px
+from flask import jsonify
+from hackasack import api, feature_schema
+from hackasack.memo import CallbackMemo
+from hackasack.prediction_cache import PredictionCache, RedisPredictionCache
+
+# pandas, plotly.express, dash_table and xgboost are only imported on first use (or by the
+# warm-up thread) so a worker can answer requests before they are loaded;
+# HACKASACK_PROFILE_STARTUP=1 prints how long each startup stage took and what got imported
+PROFILE_STARTUP = os.environ.get('HACKASACK_PROFILE_STARTUP', '0') == '1'
+HEAVY_MODULES = ['pandas', 'plotly.express', 'dash.dash_table', 'xgboost', 'matplotlib']
+
+
+def startup_mark(stage):
+    if PROFILE_STARTUP:
+        loaded = [name for name in HEAVY_MODULES if name in sys.modules]
+        print(f'startup: {stage} after {time.perf_counter() - startup_t0:.3f}s (loaded: {", ".join(loaded) or "none"})',
+              flush=True)
+
+
+startup_mark('imports')
 
 external_stylesheets = ['https://codepen.io/chriddyp/pen/bWLwgP.css']
 
@@ -17,8 +36,97 @@ app = dash.Dash(__name__, external_stylesheets=external_stylesheets, suppress_ca
 app.title = 'Front Builder'
 server = app.server
 
-mod = Booster({'nthread': 8})
-mod.load_model('xgb_sack')
+# Booster threads per process; gunicorn.conf.py sets it to cores // workers
+NTHREAD = int(os.environ.get('HACKASACK_NTHREAD', 8))
+
+# Per-defender prediction cache; HACKASACK_PREDICTION_CACHE_MB=0 turns it off. With
+# HACKASACK_PREDICTION_CACHE_URL (redis://...) the workers share one store, namespaced by
+# the loaded model (see get_model) so a retrained xgb_sack never reads old entries, and fall
+# back to the in-process cache while it is down.
+cache_mb = float(os.environ.get('HACKASACK_PREDICTION_CACHE_MB', 64))
+prediction_cache = PredictionCache(int(cache_mb * 2**20)) if cache_mb > 0 else None
+if os.environ.get('HACKASACK_PREDICTION_CACHE_URL'):
+    prediction_cache = RedisPredictionCache(os.environ['HACKASACK_PREDICTION_CACHE_URL'], prediction_cache)
+
+
+model = None
+model_ready = threading.Event()
+
+
+def get_model():
+    # xgb_sack and its schema, loaded on first use; fails there, not at predict time, if the
+    # two disagree. Replacing either file on disk swaps the model in on the next call.
+    global model
+    from hackasack import scoring
+    loaded = scoring.load_model('xgb_sack', NTHREAD)
+    if loaded is not model:
+        model_changed(loaded[0])
+        model = loaded
+    return model
+
+
+def model_changed(booster):
+    # Cached predictions are those of the previous model: the shared store moves to the new
+    # booster's namespace, the in-process cache starts over
+    if isinstance(prediction_cache, RedisPredictionCache):
+        model_hash = hashlib.blake2b(booster.save_raw(), digest_size=8).hexdigest()
+        prediction_cache.set_namespace(model_hash.encode())
+    elif prediction_cache is not None:
+        prediction_cache.clear()
+
+
+def warm_up():
+    # Loads the booster, runs one dummy predict and imports the plotting and table modules
+    # so the first submit doesn't pay for them
+    import numpy as np
+    import pandas
+    import plotly.express
+    from dash import dash_table
+    mod, mod_schema = get_model()
+    mod.inplace_predict(np.zeros((11, len(mod_schema['features'])), dtype='float32'))
+    model_ready.set()
+    startup_mark('warm-up')
+
+
+def start_warm_up():
+    threading.Thread(target=warm_up, name='warm-up', daemon=True).start()
+
+
+# HACKASACK_WARMUP=1 warms up in the background and /healthz reports 503 until it is done.
+# Under gunicorn (HACKASACK_PREFORK=1) the master only loads the model and every worker
+# warms up after the fork, since predicting before it would start OpenMP in the master.
+WARMUP = os.environ.get('HACKASACK_WARMUP', '0') == '1'
+if WARMUP and os.environ.get('HACKASACK_PREFORK', '0') != '1':
+    start_warm_up()
+
+
+server.register_blueprint(api.create_blueprint(get_model))
+
+
+@server.route('/healthz')
+def healthz():
+    if WARMUP and not model_ready.is_set():
+        return jsonify({'ready': False}), 503
+    return jsonify({'ready': True, 'model_loaded': model is not None})
+
+
+@server.route('/stats/prediction-cache')
+def prediction_cache_stats():
+    return jsonify(prediction_cache.stats() if prediction_cache else {'enabled': False})
+
+
+# Opt-in memo of whole page responses (HACKASACK_CALLBACK_MEMO=1), dropped whenever xgb_sack changes
+callback_memo = None
+if os.environ.get('HACKASACK_CALLBACK_MEMO', '0') == '1':
+    callback_memo = CallbackMemo(int(os.environ.get('HACKASACK_CALLBACK_MEMO_SIZE', 256)),
+                                 float(os.environ.get('HACKASACK_CALLBACK_MEMO_TTL', 600)),
+                                 watch=['xgb_sack', feature_schema.schema_path('xgb_sack')])
+
+
+@server.route('/stats/callback-memo')
+def callback_memo_stats():
+    return jsonify(callback_memo.stats() if callback_memo else {'enabled': False})
+
 
 app.layout = html.Div([
     # represents the browser address bar and doesn't render anything
@@ -85,13 +193,21 @@ page_1_layout = html.Div([
     ], style={'columnCount': 2}),
     dbc.Row([
         html.Br(),
-        dbc.Row([dbc.Button('Submit', id='submit-val', n_clicks=0, color="primary")])
+        dbc.Row([dbc.Button('Submit', id='submit-val', n_clicks=0, color="primary")]),
+        dbc.Row([dcc.Checklist([{'label': ' Show what drives each prediction', 'value': 'drivers'}], [], id='explain')])
     ]),
     dbc.Row([
         html.Br(),
         dbc.Row([html.Div(id='prediction output-1')])
     ]),
     dcc.Graph(id = 'play-diagram-1', style={'width': '150vh', 'height': '80vh'}),
+    dbc.Row([
+        dbc.Col(html.Label(children='Sack Heatmap for Player'), width={"order": "first"}),
+        dcc.Dropdown([str(i) for i in range(1, 12)], None, id='heatmap_player', placeholder='Off', style={"width": "65%", 'display': 'inline-block'}),
+        dbc.Col(html.Label(children='Heatmap Resolution (yards)'), width={"order": "first"}),
+        dcc.Input(id='heatmap_step', value=0.5, type='number', min=0.25, max=5, step=0.25)
+    ], style={'columnCount': 2}),
+    dcc.Graph(id='heatmap-1', style={'display': 'none'}),
     dbc.Row([
         dbc.Col(html.Label(children="Player 1's Distance from MoF (-26.66 to 26.66)"), width={"order": "first"}),    
         dcc.Input(id='rel_y_1', value=-5.03, type='number', min = -26.66, max = 26.66),
@@ -187,6 +303,146 @@ page_1_layout = html.Div([
 ], style = {'padding': '0px 0px 0px 25px', 'width': '90%'})
 
 
+# Offensive players drawn on the play diagram: (label, rel x, rel y)
+offense_line = [('C', 0, 0), ('LG', 0, -1), ('LT', 0, -2), ('RG', 0, 1), ('RT', 0, 2)]
+offense_diagram = {
+    'Empty': offense_line + [('TE-R', -0.75, 3), ('QB', -5, 0), ('SLiWR', -1, -7), ('OR-WR', 0, 20),
+                             ('OL-WR', 0, -20), ('SL-WR', -1, -10)],
+    'Shotgun': offense_line + [('TE-R', -0.75, 3), ('QB', -5, 0), ('RB-L', -5, -1), ('OR-WR', 0, 20),
+                               ('OL-WR', 0, -20), ('SL-WR', -1, -10)],
+    'I Formation': offense_line + [('TE-R', -0.75, 3), ('QB', -1, 0), ('RB', -7, 0), ('OR-WR', 0, 20),
+                                   ('OL-WR', 0, -20), ('FB', -3, 0)],
+    'Jumbo': offense_line + [('TE-iR', 0, 3), ('QB', -1, 0), ('RB-L', -6, 0), ('OL-WR', -0.75, -20),
+                             ('TE-L', 0, -3), ('TE-oR', -0.75, 4)],
+    'Pistol': offense_line + [('TE-R', -0.75, 3), ('QB', -4, 0), ('RB', -7, 0), ('OR-WR', 0, 20),
+                              ('OL-WR', 0, -20), ('SL-WR', -1, -10)],
+    'Singleback': offense_line + [('TE-R', -0.75, 3), ('QB', -1, 0), ('RB-L', -6, 0), ('OR-WR', 0, 20),
+                                  ('OL-WR', 0, -20), ('SL-WR', -1, -10)],
+    'Wildcat': offense_line + [('TE-R', -0.75, 7), ('QB', -5, 0), ('RB-L', -5, -1), ('OR-WR', 0, 20),
+                               ('OL-WR', 0, -20), ('SL-WR', -1, -10)],
+}
+
+
+def front_outputs(submitted, yardsToGo, absoluteYardlineNumber, defendersInBox, o_dropdown, d_dropdown,
+                  the_hash, down, offenseFormation, rel_x, rel_y, positions, size_max, drivers=False):
+    import pandas as pd
+    import plotly.express as px
+    from dash import dash_table as dt
+    from hackasack import fronts, scoring
+
+    # One predict for all 11 defenders (only the uncached ones when the cache is on)
+    front = fronts.front(yardsToGo, absoluteYardlineNumber, defendersInBox, o_dropdown, d_dropdown, the_hash,
+                         down, offenseFormation, rel_x, rel_y, positions)
+    scored = scoring.score_fronts(front, get_model(), cache=prediction_cache)
+    dist_from_qb = scored['dist_from_qb'].to_numpy()
+    predictions = [round(100*p, 3) for p in scored['sack_prob'].to_numpy()]
+
+    data = [[str(i + 1), positions[i], rel_x[i], rel_y[i], round(dist_from_qb[i], 1), predictions[i]] for i in range(11)]
+
+    df = pd.DataFrame(data,columns=['Player','Position', 'Rel. x', 'Rel. y', 'Dist. From QB', 'Chance of a Sack (%)'])
+    if submitted and drivers:
+        # TreeSHAP for the same 11 rows in one call, cached next to their predictions
+        from hackasack import explain
+        contribs = scoring.explain_fronts(front, get_model(), cache=prediction_cache)
+        df['Top Drivers (log-odds)'] = explain.top_drivers(contribs.to_numpy(), get_model()[1])
+    df['Off_Def'] = 'D'
+
+    off_data = [["O", label, x, y, 0, 0.4, 'O'] for label, x, y in offense_diagram[offenseFormation]]
+    off_df = pd.DataFrame(off_data,columns=['Player','Position', 'Rel. x', 'Rel. y', 'Dist. From QB', 'Chance of a Sack (%)', 'Off_Def'])
+
+    df_graph = pd.concat([df, off_df])
+    diagram = px.scatter(df_graph, x='Rel. y', y='Rel. x', size = 'Chance of a Sack (%)', color = 'Off_Def', text='Player',
+    size_max=size_max)
+    diagram.update_xaxes(range=[-26.65, 26.65])
+    diagram.update_yaxes(range=[-10,20])
+
+    if submitted:
+        data = df.to_dict('records')
+        columns =  [{"name": i, "id": i,} for i in (df.columns)]
+        return (dt.DataTable(data=data, columns=columns, sort_action='native', sort_mode='multi', sort_as_null=['', 'No'],
+         sort_by=[{'column_id': 'Chance of a Sack (%)', 'direction': 'desc'}], style_cell={'textAlign': 'center',
+        # all three widths are needed
+        'minWidth': '150px', 'width': '150px', 'maxWidth': '150px',
+        'overflow': 'hidden',
+        'textOverflow': 'ellipsis',
+    }, style_cell_conditional=[{'if': {'column_id': 'Top Drivers (log-odds)'},
+                                'minWidth': '400px', 'width': '400px', 'maxWidth': '400px'}],
+        style_header = {'fontWeight': 'bold'}, editable=True), diagram)
+    else :
+        return('Press submit to view results', diagram)
+
+
+# n_clicks only decides whether the table is shown, so the memo key takes it as a bool
+if callback_memo:
+    front_outputs = callback_memo(front_outputs)
+
+
+# Sensitivity heatmap: one defender's sack chance at every cell of the diagram's field grid,
+# the whole grid scored in one predict
+HEATMAP_REL_X = (-10, 20)
+HEATMAP_REL_Y = (-26.65, 26.65)
+HEATMAP_MIN_STEP = 0.25
+
+
+def heatmap_outputs(player, step, yardsToGo, absoluteYardlineNumber, defendersInBox, o_dropdown, d_dropdown,
+                    the_hash, down, offenseFormation, rel_x, rel_y, positions):
+    import numpy as np
+    import plotly.express as px
+    from hackasack import fronts, scoring
+
+    step = max(float(step or 0.5), HEATMAP_MIN_STEP)
+    grid_x = np.arange(HEATMAP_REL_X[0], HEATMAP_REL_X[1] + 1e-6, step)
+    grid_y = np.arange(HEATMAP_REL_Y[0], HEATMAP_REL_Y[1] + 1e-6, step)
+    slot = int(player) - 1
+    front = fronts.front(yardsToGo, absoluteYardlineNumber, defendersInBox, o_dropdown, d_dropdown, the_hash,
+                         down, offenseFormation, rel_x, rel_y, positions)
+    probs = scoring.sweep_defender(front, slot, grid_x, grid_y, get_model())
+
+    heatmap = px.imshow(100 * probs, x=grid_y, y=grid_x, origin='lower', aspect='auto', color_continuous_scale='Reds',
+                        labels={'x': 'Rel. y', 'y': 'Rel. x', 'color': 'Chance of a Sack (%)'},
+                        title=f'Player {player} ({positions[slot]}) placed at every spot')
+    others = [i for i in range(11) if i != slot]
+    heatmap.add_scatter(x=[rel_y[i] for i in others], y=[rel_x[i] for i in others], mode='markers+text',
+                        text=[str(i + 1) for i in others], name='D', marker={'color': 'black'})
+    heatmap.add_scatter(x=[y for _, _, y in offense_diagram[offenseFormation]],
+                        y=[x for _, x, _ in offense_diagram[offenseFormation]], mode='markers+text',
+                        text=[label for label, _, _ in offense_diagram[offenseFormation]], name='O',
+                        marker={'color': 'blue'})
+    heatmap.update_xaxes(range=list(HEATMAP_REL_Y))
+    heatmap.update_yaxes(range=list(HEATMAP_REL_X))
+    return heatmap, {'width': '150vh', 'height': '80vh'}
+
+
+if callback_memo:
+    heatmap_outputs = callback_memo(heatmap_outputs)
+
+
+@app.callback(
+    Output('heatmap-1', 'figure'),
+    Output('heatmap-1', 'style'),
+    Input('submit-val', 'n_clicks'),
+    Input('heatmap_player', 'value'),
+    Input('heatmap_step', 'value'),
+    State('yardsToGo', 'value'),
+    State('absoluteYardlineNumber', 'value'),
+    State('defendersInBox', 'value'),
+    State('o_dropdown', 'value'),
+    State('d_dropdown', 'value'),
+    State('the_hash', 'value'),
+    State('down', 'value'),
+    State('offenseFormation', 'value'),
+    *[State(f'rel_x_{i}', 'value') for i in range(1, 12)],
+    *[State(f'rel_y_{i}', 'value') for i in range(1, 12)],
+    *[State(f'official_position_{i}', 'value') for i in range(1, 12)])
+def update_heatmap(n_clicks, player, step, yardsToGo, absoluteYardlineNumber, defendersInBox, o_dropdown, d_dropdown,
+                   the_hash, down, offenseFormation, *defenders):
+    if not player:
+        return {}, {'display': 'none'}
+    rel_x, rel_y, positions = list(defenders[:11]), list(defenders[11:22]), list(defenders[22:])
+    return heatmap_outputs(player, step, yardsToGo, absoluteYardlineNumber, defendersInBox, o_dropdown, d_dropdown,
+                           the_hash, down, offenseFormation, rel_x, rel_y, positions)
+
+
 @app.callback(
     Output('prediction output-1', 'children'),
     Output('play-diagram-1', component_property= 'figure'),
@@ -231,7 +487,8 @@ page_1_layout = html.Div([
     State('official_position_9', 'value'),
     State('official_position_10', 'value'),
     State('official_position_11', 'value'),
-    State('offenseFormation', 'value'))
+    State('offenseFormation', 'value'),
+    State('explain', 'value'))
     
  
 def update_output(n_clicks, yardsToGo, absoluteYardlineNumber, defendersInBox, o_dropdown, 
@@ -242,1536 +499,15 @@ def update_output(n_clicks, yardsToGo, absoluteYardlineNumber, defendersInBox, o
                   official_position_2, official_position_3, official_position_4, 
                   official_position_5, official_position_6, official_position_7, 
                   official_position_8, official_position_9, official_position_10,
-                  official_position_11, offenseFormation):
-    
-    if o_dropdown == '12*':
-        num_rb = float(1)
-        num_te = float(2)
-        num_wr = float(1)
-    elif o_dropdown == '12':
-        num_rb = float(1)
-        num_te = float(2)
-        num_wr = float(2)
-    elif o_dropdown == '21':
-        num_rb = float(2)
-        num_te = float(1)
-        num_wr = float(2)
-    elif o_dropdown == '13':
-        num_rb = float(1)
-        num_te = float(3)
-        num_wr = float(1)        
-    elif o_dropdown == '10':
-        num_rb = float(1)
-        num_te = float(0)
-        num_wr = float(4)       
-    elif o_dropdown == '22':
-        num_rb = float(2)
-        num_te = float(2)
-        num_wr = float(1)
-    elif o_dropdown == '01':
-        num_rb = float(0)
-        num_te = float(1)
-        num_wr = float(4)
-    elif o_dropdown == '20':
-        num_rb = float(2)
-        num_te = float(0)
-        num_wr = float(3)
-    elif o_dropdown == '11*':
-        num_rb = float(1)
-        num_te = float(1)
-        num_wr = float(2)
-    elif o_dropdown == '02':
-        num_rb = float(0)
-        num_te = float(2)
-        num_wr = float(3)
-    else:
-        num_rb = float(1)
-        num_te = float(1)
-        num_wr = float(3)
-        
-    if d_dropdown == '1-5-5':
-        num_dl = float(1)
-        num_lb = float(5)
-        num_db = float(5)
-    elif d_dropdown == '2-4-5':
-        num_dl = float(2)
-        num_lb = float(4)
-        num_db = float(5)
-    elif d_dropdown == '3-3-5':
-        num_dl = float(3)
-        num_lb = float(3)
-        num_db = float(5)
-    elif d_dropdown == '2-3-6':
-        num_dl = float(2)
-        num_lb = float(3)
-        num_db = float(6)
-    elif d_dropdown == '4-3-4':
-        num_dl = float(4)
-        num_lb = float(3)
-        num_db = float(4)
-    elif d_dropdown == '3-4-4':
-        num_dl = float(3)
-        num_lb = float(4)
-        num_db = float(4)
-    elif d_dropdown == '4-1-6':
-        num_dl = float(4)
-        num_lb = float(1)
-        num_db = float(6)
-    elif d_dropdown == '3-2-6':
-        num_dl = float(3)
-        num_lb = float(2)
-        num_db = float(6)
-    elif d_dropdown == '1-4-6':
-        num_dl = float(1)
-        num_lb = float(4)
-        num_db = float(6)
-    else:
-        num_dl = float(4)
-        num_lb = float(2)
-        num_db = float(5)
-        
-    
-    if the_hash == 'Right':
-        ball_y_array = 29.7
-    elif the_hash == 'Left':
-        ball_y_array = 23.6
-    else:
-        ball_y_array = 27.0
-    
-    
-    if float(down) == 4:
-        down_1 = 0
-        down_2 = 0
-        down_3 = 0
-        down_4 = 1
-    elif float(down) == 3:
-        down_1 = 0
-        down_2 = 0
-        down_3 = 1
-        down_4 = 0      
-    elif float(down) == 2:
-        down_1 = 0
-        down_2 = 1
-        down_3 = 0
-        down_4 = 0    
-    else:
-        down_1 = 1
-        down_2 = 0
-        down_3 = 0
-        down_4 = 0    
-    
-    if official_position_1 == 'CB':
-        cb_pos_1 = 1
-        de_pos_1 = 0
-        dt_pos_1 = 0
-        fs_pos_1 = 0
-        ilb_pos_1 = 0
-        mlb_pos_1 = 0
-        nt_pos_1 = 0
-        olb_pos_1 = 0
-        ss_pos_1 = 0
-    elif official_position_1 == 'DE':
-        cb_pos_1 = 0
-        de_pos_1 = 1
-        dt_pos_1 = 0
-        fs_pos_1 = 0
-        ilb_pos_1 = 0
-        mlb_pos_1 = 0
-        nt_pos_1 = 0
-        olb_pos_1 = 0
-        ss_pos_1 = 0
-    elif official_position_1 == 'DT':
-        cb_pos_1 = 0
-        de_pos_1 = 0
-        dt_pos_1 = 1
-        fs_pos_1 = 0
-        ilb_pos_1 = 0
-        mlb_pos_1 = 0
-        nt_pos_1 = 0
-        olb_pos_1 = 0
-        ss_pos_1 = 0
-    elif official_position_1 == 'FS':
-        cb_pos_1 = 0
-        de_pos_1 = 0
-        dt_pos_1 = 0
-        fs_pos_1 = 1
-        ilb_pos_1 = 0
-        mlb_pos_1 = 0
-        nt_pos_1 = 0
-        olb_pos_1 = 0
-        ss_pos_1 = 0
-    elif official_position_1 == 'ILB':
-        cb_pos_1 = 0
-        de_pos_1 = 0
-        dt_pos_1 = 0
-        fs_pos_1 = 0
-        ilb_pos_1 = 1
-        mlb_pos_1 = 0
-        nt_pos_1 = 0
-        olb_pos_1 = 0
-        ss_pos_1 = 0
-    elif official_position_1 == 'MLB':
-        cb_pos_1 = 0
-        de_pos_1 = 0
-        dt_pos_1 = 0
-        fs_pos_1 = 0
-        ilb_pos_1 = 0
-        mlb_pos_1 = 1
-        nt_pos_1 = 0
-        olb_pos_1 = 0
-        ss_pos_1 = 0
-    elif official_position_1 == 'NT':
-        cb_pos_1 = 0
-        de_pos_1 = 0
-        dt_pos_1 = 0
-        fs_pos_1 = 0
-        ilb_pos_1 = 0
-        mlb_pos_1 = 0
-        nt_pos_1 = 1
-        olb_pos_1 = 0
-        ss_pos_1 = 0
-    elif official_position_1 == 'OLB':
-        cb_pos_1 = 0
-        de_pos_1 = 0
-        dt_pos_1 = 0
-        fs_pos_1 = 0
-        ilb_pos_1 = 0
-        mlb_pos_1 = 0
-        nt_pos_1 = 0
-        olb_pos_1 = 1
-        ss_pos_1 = 0
-    elif official_position_1 == 'SS':
-        cb_pos_1 = 0
-        de_pos_1 = 0
-        dt_pos_1 = 0
-        fs_pos_1 = 0
-        ilb_pos_1 = 0
-        mlb_pos_1 = 0
-        nt_pos_1 = 0
-        olb_pos_1 = 0
-        ss_pos_1 = 1
-
-    if official_position_2 == 'CB':
-        cb_pos_2 = 1
-        de_pos_2 = 0
-        dt_pos_2 = 0
-        fs_pos_2 = 0
-        ilb_pos_2 = 0
-        mlb_pos_2 = 0
-        nt_pos_2 = 0
-        olb_pos_2 = 0
-        ss_pos_2 = 0
-    elif official_position_2 == 'DE':
-        cb_pos_2 = 0
-        de_pos_2 = 1
-        dt_pos_2 = 0
-        fs_pos_2 = 0
-        ilb_pos_2 = 0
-        mlb_pos_2 = 0
-        nt_pos_2 = 0
-        olb_pos_2 = 0
-        ss_pos_2 = 0
-    elif official_position_2 == 'DT':
-        cb_pos_2 = 0
-        de_pos_2 = 0
-        dt_pos_2 = 1
-        fs_pos_2 = 0
-        ilb_pos_2 = 0
-        mlb_pos_2 = 0
-        nt_pos_2 = 0
-        olb_pos_2 = 0
-        ss_pos_2 = 0
-    elif official_position_2 == 'FS':
-        cb_pos_2 = 0
-        de_pos_2 = 0
-        dt_pos_2 = 0
-        fs_pos_2 = 1
-        ilb_pos_2 = 0
-        mlb_pos_2 = 0
-        nt_pos_2 = 0
-        olb_pos_2 = 0
-        ss_pos_2 = 0
-    elif official_position_2 == 'ILB':
-        cb_pos_2 = 0
-        de_pos_2 = 0
-        dt_pos_2 = 0
-        fs_pos_2 = 0
-        ilb_pos_2 = 1
-        mlb_pos_2 = 0
-        nt_pos_2 = 0
-        olb_pos_2 = 0
-        ss_pos_2 = 0
-    elif official_position_2 == 'MLB':
-        cb_pos_2 = 0
-        de_pos_2 = 0
-        dt_pos_2 = 0
-        fs_pos_2 = 0
-        ilb_pos_2 = 0
-        mlb_pos_2 = 1
-        nt_pos_2 = 0
-        olb_pos_2 = 0
-        ss_pos_2 = 0
-    elif official_position_2 == 'NT':
-        cb_pos_2 = 0
-        de_pos_2 = 0
-        dt_pos_2 = 0
-        fs_pos_2 = 0
-        ilb_pos_2 = 0
-        mlb_pos_2 = 0
-        nt_pos_2 = 1
-        olb_pos_2 = 0
-        ss_pos_2 = 0
-    elif official_position_2 == 'OLB':
-        cb_pos_2 = 0
-        de_pos_2 = 0
-        dt_pos_2 = 0
-        fs_pos_2 = 0
-        ilb_pos_2 = 0
-        mlb_pos_2 = 0
-        nt_pos_2 = 0
-        olb_pos_2 = 1
-        ss_pos_2 = 0
-    elif official_position_2 == 'SS':
-        cb_pos_2 = 0
-        de_pos_2 = 0
-        dt_pos_2 = 0
-        fs_pos_2 = 0
-        ilb_pos_2 = 0
-        mlb_pos_2 = 0
-        nt_pos_2 = 0
-        olb_pos_2 = 0
-        ss_pos_2 = 1
-        
-    if official_position_3 == 'CB':
-        cb_pos_3 = 1
-        de_pos_3 = 0
-        dt_pos_3 = 0
-        fs_pos_3 = 0
-        ilb_pos_3 = 0
-        mlb_pos_3 = 0
-        nt_pos_3 = 0
-        olb_pos_3 = 0
-        ss_pos_3 = 0
-    elif official_position_3 == 'DE':
-        cb_pos_3 = 0
-        de_pos_3 = 1
-        dt_pos_3 = 0
-        fs_pos_3 = 0
-        ilb_pos_3 = 0
-        mlb_pos_3 = 0
-        nt_pos_3 = 0
-        olb_pos_3 = 0
-        ss_pos_3 = 0
-    elif official_position_3 == 'DT':
-        cb_pos_3 = 0
-        de_pos_3 = 0
-        dt_pos_3 = 1
-        fs_pos_3 = 0
-        ilb_pos_3 = 0
-        mlb_pos_3 = 0
-        nt_pos_3 = 0
-        olb_pos_3 = 0
-        ss_pos_3 = 0
-    elif official_position_3 == 'FS':
-        cb_pos_3 = 0
-        de_pos_3 = 0
-        dt_pos_3 = 0
-        fs_pos_3 = 1
-        ilb_pos_3 = 0
-        mlb_pos_3 = 0
-        nt_pos_3 = 0
-        olb_pos_3 = 0
-        ss_pos_3 = 0
-    elif official_position_3 == 'ILB':
-        cb_pos_3 = 0
-        de_pos_3 = 0
-        dt_pos_3 = 0
-        fs_pos_3 = 0
-        ilb_pos_3 = 1
-        mlb_pos_3 = 0
-        nt_pos_3 = 0
-        olb_pos_3 = 0
-        ss_pos_3 = 0
-    elif official_position_3 == 'MLB':
-        cb_pos_3 = 0
-        de_pos_3 = 0
-        dt_pos_3 = 0
-        fs_pos_3 = 0
-        ilb_pos_3 = 0
-        mlb_pos_3 = 1
-        nt_pos_3 = 0
-        olb_pos_3 = 0
-        ss_pos_3 = 0
-    elif official_position_3 == 'NT':
-        cb_pos_3 = 0
-        de_pos_3 = 0
-        dt_pos_3 = 0
-        fs_pos_3 = 0
-        ilb_pos_3 = 0
-        mlb_pos_3 = 0
-        nt_pos_3 = 1
-        olb_pos_3 = 0
-        ss_pos_3 = 0
-    elif official_position_3 == 'OLB':
-        cb_pos_3 = 0
-        de_pos_3 = 0
-        dt_pos_3 = 0
-        fs_pos_3 = 0
-        ilb_pos_3 = 0
-        mlb_pos_3 = 0
-        nt_pos_3 = 0
-        olb_pos_3 = 1
-        ss_pos_3 = 0
-    elif official_position_3 == 'SS':
-        cb_pos_3 = 0
-        de_pos_3 = 0
-        dt_pos_3 = 0
-        fs_pos_3 = 0
-        ilb_pos_3 = 0
-        mlb_pos_3 = 0
-        nt_pos_3 = 0
-        olb_pos_3 = 0
-        ss_pos_3 = 1
-    
-    if official_position_4 == 'CB':
-        cb_pos_4 = 1
-        de_pos_4 = 0
-        dt_pos_4 = 0
-        fs_pos_4 = 0
-        ilb_pos_4 = 0
-        mlb_pos_4 = 0
-        nt_pos_4 = 0
-        olb_pos_4 = 0
-        ss_pos_4 = 0
-    elif official_position_4 == 'DE':
-        cb_pos_4 = 0
-        de_pos_4 = 1
-        dt_pos_4 = 0
-        fs_pos_4 = 0
-        ilb_pos_4 = 0
-        mlb_pos_4 = 0
-        nt_pos_4 = 0
-        olb_pos_4 = 0
-        ss_pos_4 = 0
-    elif official_position_4 == 'DT':
-        cb_pos_4 = 0
-        de_pos_4 = 0
-        dt_pos_4 = 1
-        fs_pos_4 = 0
-        ilb_pos_4 = 0
-        mlb_pos_4 = 0
-        nt_pos_4 = 0
-        olb_pos_4 = 0
-        ss_pos_4 = 0
-    elif official_position_4 == 'FS':
-        cb_pos_4 = 0
-        de_pos_4 = 0
-        dt_pos_4 = 0
-        fs_pos_4 = 1
-        ilb_pos_4 = 0
-        mlb_pos_4 = 0
-        nt_pos_4 = 0
-        olb_pos_4 = 0
-        ss_pos_4 = 0
-    elif official_position_4 == 'ILB':
-        cb_pos_4 = 0
-        de_pos_4 = 0
-        dt_pos_4 = 0
-        fs_pos_4 = 0
-        ilb_pos_4 = 1
-        mlb_pos_4 = 0
-        nt_pos_4 = 0
-        olb_pos_4 = 0
-        ss_pos_4 = 0
-    elif official_position_4 == 'MLB':
-        cb_pos_4 = 0
-        de_pos_4 = 0
-        dt_pos_4 = 0
-        fs_pos_4 = 0
-        ilb_pos_4 = 0
-        mlb_pos_4 = 1
-        nt_pos_4 = 0
-        olb_pos_4 = 0
-        ss_pos_4 = 0
-    elif official_position_4 == 'NT':
-        cb_pos_4 = 0
-        de_pos_4 = 0
-        dt_pos_4 = 0
-        fs_pos_4 = 0
-        ilb_pos_4 = 0
-        mlb_pos_4 = 0
-        nt_pos_4 = 1
-        olb_pos_4 = 0
-        ss_pos_4 = 0
-    elif official_position_4 == 'OLB':
-        cb_pos_4 = 0
-        de_pos_4 = 0
-        dt_pos_4 = 0
-        fs_pos_4 = 0
-        ilb_pos_4 = 0
-        mlb_pos_4 = 0
-        nt_pos_4 = 0
-        olb_pos_4 = 1
-        ss_pos_4 = 0
-    elif official_position_4 == 'SS':
-        cb_pos_4 = 0
-        de_pos_4 = 0
-        dt_pos_4 = 0
-        fs_pos_4 = 0
-        ilb_pos_4 = 0
-        mlb_pos_4 = 0
-        nt_pos_4 = 0
-        olb_pos_4 = 0
-        ss_pos_4 = 1
-    
-    if official_position_5 == 'CB':
-        cb_pos_5 = 1
-        de_pos_5 = 0
-        dt_pos_5 = 0
-        fs_pos_5 = 0
-        ilb_pos_5 = 0
-        mlb_pos_5 = 0
-        nt_pos_5 = 0
-        olb_pos_5 = 0
-        ss_pos_5 = 0
-    elif official_position_5 == 'DE':
-        cb_pos_5 = 0
-        de_pos_5 = 1
-        dt_pos_5 = 0
-        fs_pos_5 = 0
-        ilb_pos_5 = 0
-        mlb_pos_5 = 0
-        nt_pos_5 = 0
-        olb_pos_5 = 0
-        ss_pos_5 = 0
-    elif official_position_5 == 'DT':
-        cb_pos_5 = 0
-        de_pos_5 = 0
-        dt_pos_5 = 1
-        fs_pos_5 = 0
-        ilb_pos_5 = 0
-        mlb_pos_5 = 0
-        nt_pos_5 = 0
-        olb_pos_5 = 0
-        ss_pos_5 = 0
-    elif official_position_5 == 'FS':
-        cb_pos_5 = 0
-        de_pos_5 = 0
-        dt_pos_5 = 0
-        fs_pos_5 = 1
-        ilb_pos_5 = 0
-        mlb_pos_5 = 0
-        nt_pos_5 = 0
-        olb_pos_5 = 0
-        ss_pos_5 = 0
-    elif official_position_5 == 'ILB':
-        cb_pos_5 = 0
-        de_pos_5 = 0
-        dt_pos_5 = 0
-        fs_pos_5 = 0
-        ilb_pos_5 = 1
-        mlb_pos_5 = 0
-        nt_pos_5 = 0
-        olb_pos_5 = 0
-        ss_pos_5 = 0
-    elif official_position_5 == 'MLB':
-        cb_pos_5 = 0
-        de_pos_5 = 0
-        dt_pos_5 = 0
-        fs_pos_5 = 0
-        ilb_pos_5 = 0
-        mlb_pos_5 = 1
-        nt_pos_5 = 0
-        olb_pos_5 = 0
-        ss_pos_5 = 0
-    elif official_position_5 == 'NT':
-        cb_pos_5 = 0
-        de_pos_5 = 0
-        dt_pos_5 = 0
-        fs_pos_5 = 0
-        ilb_pos_5 = 0
-        mlb_pos_5 = 0
-        nt_pos_5 = 1
-        olb_pos_5 = 0
-        ss_pos_5 = 0
-    elif official_position_5 == 'OLB':
-        cb_pos_5 = 0
-        de_pos_5 = 0
-        dt_pos_5 = 0
-        fs_pos_5 = 0
-        ilb_pos_5 = 0
-        mlb_pos_5 = 0
-        nt_pos_5 = 0
-        olb_pos_5 = 1
-        ss_pos_5 = 0
-    elif official_position_5 == 'SS':
-        cb_pos_5 = 0
-        de_pos_5 = 0
-        dt_pos_5 = 0
-        fs_pos_5 = 0
-        ilb_pos_5 = 0
-        mlb_pos_5 = 0
-        nt_pos_5 = 0
-        olb_pos_5 = 0
-        ss_pos_5 = 1
-
-    if official_position_6 == 'CB':
-        cb_pos_6 = 1
-        de_pos_6 = 0
-        dt_pos_6 = 0
-        fs_pos_6 = 0
-        ilb_pos_6 = 0
-        mlb_pos_6 = 0
-        nt_pos_6 = 0
-        olb_pos_6 = 0
-        ss_pos_6 = 0
-    elif official_position_6 == 'DE':
-        cb_pos_6 = 0
-        de_pos_6 = 1
-        dt_pos_6 = 0
-        fs_pos_6 = 0
-        ilb_pos_6 = 0
-        mlb_pos_6 = 0
-        nt_pos_6 = 0
-        olb_pos_6 = 0
-        ss_pos_6 = 0
-    elif official_position_6 == 'DT':
-        cb_pos_6 = 0
-        de_pos_6 = 0
-        dt_pos_6 = 1
-        fs_pos_6 = 0
-        ilb_pos_6 = 0
-        mlb_pos_6 = 0
-        nt_pos_6 = 0
-        olb_pos_6 = 0
-        ss_pos_6 = 0
-    elif official_position_6 == 'FS':
-        cb_pos_6 = 0
-        de_pos_6 = 0
-        dt_pos_6 = 0
-        fs_pos_6 = 1
-        ilb_pos_6 = 0
-        mlb_pos_6 = 0
-        nt_pos_6 = 0
-        olb_pos_6 = 0
-        ss_pos_6 = 0
-    elif official_position_6 == 'ILB':
-        cb_pos_6 = 0
-        de_pos_6 = 0
-        dt_pos_6 = 0
-        fs_pos_6 = 0
-        ilb_pos_6 = 1
-        mlb_pos_6 = 0
-        nt_pos_6 = 0
-        olb_pos_6 = 0
-        ss_pos_6 = 0
-    elif official_position_6 == 'MLB':
-        cb_pos_6 = 0
-        de_pos_6 = 0
-        dt_pos_6 = 0
-        fs_pos_6 = 0
-        ilb_pos_6 = 0
-        mlb_pos_6 = 1
-        nt_pos_6 = 0
-        olb_pos_6 = 0
-        ss_pos_6 = 0
-    elif official_position_6 == 'NT':
-        cb_pos_6 = 0
-        de_pos_6 = 0
-        dt_pos_6 = 0
-        fs_pos_6 = 0
-        ilb_pos_6 = 0
-        mlb_pos_6 = 0
-        nt_pos_6 = 1
-        olb_pos_6 = 0
-        ss_pos_6 = 0
-    elif official_position_6 == 'OLB':
-        cb_pos_6 = 0
-        de_pos_6 = 0
-        dt_pos_6 = 0
-        fs_pos_6 = 0
-        ilb_pos_6 = 0
-        mlb_pos_6 = 0
-        nt_pos_6 = 0
-        olb_pos_6 = 1
-        ss_pos_6 = 0
-    elif official_position_6 == 'SS':
-        cb_pos_6 = 0
-        de_pos_6 = 0
-        dt_pos_6 = 0
-        fs_pos_6 = 0
-        ilb_pos_6 = 0
-        mlb_pos_6 = 0
-        nt_pos_6 = 0
-        olb_pos_6 = 0
-        ss_pos_6 = 1
-
-    if official_position_7 == 'CB':
-        cb_pos_7 = 1
-        de_pos_7 = 0
-        dt_pos_7 = 0
-        fs_pos_7 = 0
-        ilb_pos_7 = 0
-        mlb_pos_7 = 0
-        nt_pos_7 = 0
-        olb_pos_7 = 0
-        ss_pos_7 = 0
-    elif official_position_7 == 'DE':
-        cb_pos_7 = 0
-        de_pos_7 = 1
-        dt_pos_7 = 0
-        fs_pos_7 = 0
-        ilb_pos_7 = 0
-        mlb_pos_7 = 0
-        nt_pos_7 = 0
-        olb_pos_7 = 0
-        ss_pos_7 = 0
-    elif official_position_7 == 'DT':
-        cb_pos_7 = 0
-        de_pos_7 = 0
-        dt_pos_7 = 1
-        fs_pos_7 = 0
-        ilb_pos_7 = 0
-        mlb_pos_7 = 0
-        nt_pos_7 = 0
-        olb_pos_7 = 0
-        ss_pos_7 = 0
-    elif official_position_7 == 'FS':
-        cb_pos_7 = 0
-        de_pos_7 = 0
-        dt_pos_7 = 0
-        fs_pos_7 = 1
-        ilb_pos_7 = 0
-        mlb_pos_7 = 0
-        nt_pos_7 = 0
-        olb_pos_7 = 0
-        ss_pos_7 = 0
-    elif official_position_7 == 'ILB':
-        cb_pos_7 = 0
-        de_pos_7 = 0
-        dt_pos_7 = 0
-        fs_pos_7 = 0
-        ilb_pos_7 = 1
-        mlb_pos_7 = 0
-        nt_pos_7 = 0
-        olb_pos_7 = 0
-        ss_pos_7 = 0
-    elif official_position_7 == 'MLB':
-        cb_pos_7 = 0
-        de_pos_7 = 0
-        dt_pos_7 = 0
-        fs_pos_7 = 0
-        ilb_pos_7 = 0
-        mlb_pos_7 = 1
-        nt_pos_7 = 0
-        olb_pos_7 = 0
-        ss_pos_7 = 0
-    elif official_position_7 == 'NT':
-        cb_pos_7 = 0
-        de_pos_7 = 0
-        dt_pos_7 = 0
-        fs_pos_7 = 0
-        ilb_pos_7 = 0
-        mlb_pos_7 = 0
-        nt_pos_7 = 1
-        olb_pos_7 = 0
-        ss_pos_7 = 0
-    elif official_position_7 == 'OLB':
-        cb_pos_7 = 0
-        de_pos_7 = 0
-        dt_pos_7 = 0
-        fs_pos_7 = 0
-        ilb_pos_7 = 0
-        mlb_pos_7 = 0
-        nt_pos_7 = 0
-        olb_pos_7 = 1
-        ss_pos_7 = 0
-    elif official_position_7 == 'SS':
-        cb_pos_7 = 0
-        de_pos_7 = 0
-        dt_pos_7 = 0
-        fs_pos_7 = 0
-        ilb_pos_7 = 0
-        mlb_pos_7 = 0
-        nt_pos_7 = 0
-        olb_pos_7 = 0
-        ss_pos_7 = 1
-
-    if official_position_8 == 'CB':
-        cb_pos_8 = 1
-        de_pos_8 = 0
-        dt_pos_8 = 0
-        fs_pos_8 = 0
-        ilb_pos_8 = 0
-        mlb_pos_8 = 0
-        nt_pos_8 = 0
-        olb_pos_8 = 0
-        ss_pos_8 = 0
-    elif official_position_8 == 'DE':
-        cb_pos_8 = 0
-        de_pos_8 = 1
-        dt_pos_8 = 0
-        fs_pos_8 = 0
-        ilb_pos_8 = 0
-        mlb_pos_8 = 0
-        nt_pos_8 = 0
-        olb_pos_8 = 0
-        ss_pos_8 = 0
-    elif official_position_8 == 'DT':
-        cb_pos_8 = 0
-        de_pos_8 = 0
-        dt_pos_8 = 1
-        fs_pos_8 = 0
-        ilb_pos_8 = 0
-        mlb_pos_8 = 0
-        nt_pos_8 = 0
-        olb_pos_8 = 0
-        ss_pos_8 = 0
-    elif official_position_8 == 'FS':
-        cb_pos_8 = 0
-        de_pos_8 = 0
-        dt_pos_8 = 0
-        fs_pos_8 = 1
-        ilb_pos_8 = 0
-        mlb_pos_8 = 0
-        nt_pos_8 = 0
-        olb_pos_8 = 0
-        ss_pos_8 = 0
-    elif official_position_8 == 'ILB':
-        cb_pos_8 = 0
-        de_pos_8 = 0
-        dt_pos_8 = 0
-        fs_pos_8 = 0
-        ilb_pos_8 = 1
-        mlb_pos_8 = 0
-        nt_pos_8 = 0
-        olb_pos_8 = 0
-        ss_pos_8 = 0
-    elif official_position_8 == 'MLB':
-        cb_pos_8 = 0
-        de_pos_8 = 0
-        dt_pos_8 = 0
-        fs_pos_8 = 0
-        ilb_pos_8 = 0
-        mlb_pos_8 = 1
-        nt_pos_8 = 0
-        olb_pos_8 = 0
-        ss_pos_8 = 0
-    elif official_position_8 == 'NT':
-        cb_pos_8 = 0
-        de_pos_8 = 0
-        dt_pos_8 = 0
-        fs_pos_8 = 0
-        ilb_pos_8 = 0
-        mlb_pos_8 = 0
-        nt_pos_8 = 1
-        olb_pos_8 = 0
-        ss_pos_8 = 0
-    elif official_position_8 == 'OLB':
-        cb_pos_8 = 0
-        de_pos_8 = 0
-        dt_pos_8 = 0
-        fs_pos_8 = 0
-        ilb_pos_8 = 0
-        mlb_pos_8 = 0
-        nt_pos_8 = 0
-        olb_pos_8 = 1
-        ss_pos_8 = 0
-    elif official_position_8 == 'SS':
-        cb_pos_8 = 0
-        de_pos_8 = 0
-        dt_pos_8 = 0
-        fs_pos_8 = 0
-        ilb_pos_8 = 0
-        mlb_pos_8 = 0
-        nt_pos_8 = 0
-        olb_pos_8 = 0
-        ss_pos_8 = 1
-
-    if official_position_9 == 'CB':
-        cb_pos_9 = 1
-        de_pos_9 = 0
-        dt_pos_9 = 0
-        fs_pos_9 = 0
-        ilb_pos_9 = 0
-        mlb_pos_9 = 0
-        nt_pos_9 = 0
-        olb_pos_9 = 0
-        ss_pos_9 = 0
-    elif official_position_9 == 'DE':
-        cb_pos_9 = 0
-        de_pos_9 = 1
-        dt_pos_9 = 0
-        fs_pos_9 = 0
-        ilb_pos_9 = 0
-        mlb_pos_9 = 0
-        nt_pos_9 = 0
-        olb_pos_9 = 0
-        ss_pos_9 = 0
-    elif official_position_9 == 'DT':
-        cb_pos_9 = 0
-        de_pos_9 = 0
-        dt_pos_9 = 1
-        fs_pos_9 = 0
-        ilb_pos_9 = 0
-        mlb_pos_9 = 0
-        nt_pos_9 = 0
-        olb_pos_9 = 0
-        ss_pos_9 = 0
-    elif official_position_9 == 'FS':
-        cb_pos_9 = 0
-        de_pos_9 = 0
-        dt_pos_9 = 0
-        fs_pos_9 = 1
-        ilb_pos_9 = 0
-        mlb_pos_9 = 0
-        nt_pos_9 = 0
-        olb_pos_9 = 0
-        ss_pos_9 = 0
-    elif official_position_9 == 'ILB':
-        cb_pos_9 = 0
-        de_pos_9 = 0
-        dt_pos_9 = 0
-        fs_pos_9 = 0
-        ilb_pos_9 = 1
-        mlb_pos_9 = 0
-        nt_pos_9 = 0
-        olb_pos_9 = 0
-        ss_pos_9 = 0
-    elif official_position_9 == 'MLB':
-        cb_pos_9 = 0
-        de_pos_9 = 0
-        dt_pos_9 = 0
-        fs_pos_9 = 0
-        ilb_pos_9 = 0
-        mlb_pos_9 = 1
-        nt_pos_9 = 0
-        olb_pos_9 = 0
-        ss_pos_9 = 0
-    elif official_position_9 == 'NT':
-        cb_pos_9 = 0
-        de_pos_9 = 0
-        dt_pos_9 = 0
-        fs_pos_9 = 0
-        ilb_pos_9 = 0
-        mlb_pos_9 = 0
-        nt_pos_9 = 1
-        olb_pos_9 = 0
-        ss_pos_9 = 0
-    elif official_position_9 == 'OLB':
-        cb_pos_9 = 0
-        de_pos_9 = 0
-        dt_pos_9 = 0
-        fs_pos_9 = 0
-        ilb_pos_9 = 0
-        mlb_pos_9 = 0
-        nt_pos_9 = 0
-        olb_pos_9 = 1
-        ss_pos_9 = 0
-    elif official_position_9 == 'SS':
-        cb_pos_9 = 0
-        de_pos_9 = 0
-        dt_pos_9 = 0
-        fs_pos_9 = 0
-        ilb_pos_9 = 0
-        mlb_pos_9 = 0
-        nt_pos_9 = 0
-        olb_pos_9 = 0
-        ss_pos_9 = 1
-
-    if official_position_10 == 'CB':
-        cb_pos_10 = 1
-        de_pos_10 = 0
-        dt_pos_10 = 0
-        fs_pos_10 = 0
-        ilb_pos_10 = 0
-        mlb_pos_10 = 0
-        nt_pos_10 = 0
-        olb_pos_10 = 0
-        ss_pos_10 = 0
-    elif official_position_10 == 'DE':
-        cb_pos_10 = 0
-        de_pos_10 = 1
-        dt_pos_10 = 0
-        fs_pos_10 = 0
-        ilb_pos_10 = 0
-        mlb_pos_10 = 0
-        nt_pos_10 = 0
-        olb_pos_10 = 0
-        ss_pos_10 = 0
-    elif official_position_10 == 'DT':
-        cb_pos_10 = 0
-        de_pos_10 = 0
-        dt_pos_10 = 1
-        fs_pos_10 = 0
-        ilb_pos_10 = 0
-        mlb_pos_10 = 0
-        nt_pos_10 = 0
-        olb_pos_10 = 0
-        ss_pos_10 = 0
-    elif official_position_10 == 'FS':
-        cb_pos_10 = 0
-        de_pos_10 = 0
-        dt_pos_10 = 0
-        fs_pos_10 = 1
-        ilb_pos_10 = 0
-        mlb_pos_10 = 0
-        nt_pos_10 = 0
-        olb_pos_10 = 0
-        ss_pos_10 = 0
-    elif official_position_10 == 'ILB':
-        cb_pos_10 = 0
-        de_pos_10 = 0
-        dt_pos_10 = 0
-        fs_pos_10 = 0
-        ilb_pos_10 = 1
-        mlb_pos_10 = 0
-        nt_pos_10 = 0
-        olb_pos_10 = 0
-        ss_pos_10 = 0
-    elif official_position_10 == 'MLB':
-        cb_pos_10 = 0
-        de_pos_10 = 0
-        dt_pos_10 = 0
-        fs_pos_10 = 0
-        ilb_pos_10 = 0
-        mlb_pos_10 = 1
-        nt_pos_10 = 0
-        olb_pos_10 = 0
-        ss_pos_10 = 0
-    elif official_position_10 == 'NT':
-        cb_pos_10 = 0
-        de_pos_10 = 0
-        dt_pos_10 = 0
-        fs_pos_10 = 0
-        ilb_pos_10 = 0
-        mlb_pos_10 = 0
-        nt_pos_10 = 1
-        olb_pos_10 = 0
-        ss_pos_10 = 0
-    elif official_position_10 == 'OLB':
-        cb_pos_10 = 0
-        de_pos_10 = 0
-        dt_pos_10 = 0
-        fs_pos_10 = 0
-        ilb_pos_10 = 0
-        mlb_pos_10 = 0
-        nt_pos_10 = 0
-        olb_pos_10 = 1
-        ss_pos_10 = 0
-    elif official_position_10 == 'SS':
-        cb_pos_10 = 0
-        de_pos_10 = 0
-        dt_pos_10 = 0
-        fs_pos_10 = 0
-        ilb_pos_10 = 0
-        mlb_pos_10 = 0
-        nt_pos_10 = 0
-        olb_pos_10 = 0
-        ss_pos_10 = 1
-
-    if official_position_11 == 'CB':
-        cb_pos_11 = 1
-        de_pos_11 = 0
-        dt_pos_11 = 0
-        fs_pos_11 = 0
-        ilb_pos_11 = 0
-        mlb_pos_11 = 0
-        nt_pos_11 = 0
-        olb_pos_11 = 0
-        ss_pos_11 = 0
-    elif official_position_11 == 'DE':
-        cb_pos_11 = 0
-        de_pos_11 = 1
-        dt_pos_11 = 0
-        fs_pos_11 = 0
-        ilb_pos_11 = 0
-        mlb_pos_11 = 0
-        nt_pos_11 = 0
-        olb_pos_11 = 0
-        ss_pos_11 = 0
-    elif official_position_11 == 'DT':
-        cb_pos_11 = 0
-        de_pos_11 = 0
-        dt_pos_11 = 1
-        fs_pos_11 = 0
-        ilb_pos_11 = 0
-        mlb_pos_11 = 0
-        nt_pos_11 = 0
-        olb_pos_11 = 0
-        ss_pos_11 = 0
-    elif official_position_11 == 'FS':
-        cb_pos_11 = 0
-        de_pos_11 = 0
-        dt_pos_11 = 0
-        fs_pos_11 = 1
-        ilb_pos_11 = 0
-        mlb_pos_11 = 0
-        nt_pos_11 = 0
-        olb_pos_11 = 0
-        ss_pos_11 = 0
-    elif official_position_11 == 'ILB':
-        cb_pos_11 = 0
-        de_pos_11 = 0
-        dt_pos_11 = 0
-        fs_pos_11 = 0
-        ilb_pos_11 = 1
-        mlb_pos_11 = 0
-        nt_pos_11 = 0
-        olb_pos_11 = 0
-        ss_pos_11 = 0
-    elif official_position_11 == 'MLB':
-        cb_pos_11 = 0
-        de_pos_11 = 0
-        dt_pos_11 = 0
-        fs_pos_11 = 0
-        ilb_pos_11 = 0
-        mlb_pos_11 = 1
-        nt_pos_11 = 0
-        olb_pos_11 = 0
-        ss_pos_11 = 0
-    elif official_position_11 == 'NT':
-        cb_pos_11 = 0
-        de_pos_11 = 0
-        dt_pos_11 = 0
-        fs_pos_11 = 0
-        ilb_pos_11 = 0
-        mlb_pos_11 = 0
-        nt_pos_11 = 1
-        olb_pos_11 = 0
-        ss_pos_11 = 0
-    elif official_position_11 == 'OLB':
-        cb_pos_11 = 0
-        de_pos_11 = 0
-        dt_pos_11 = 0
-        fs_pos_11 = 0
-        ilb_pos_11 = 0
-        mlb_pos_11 = 0
-        nt_pos_11 = 0
-        olb_pos_11 = 1
-        ss_pos_11 = 0
-    elif official_position_11 == 'SS':
-        cb_pos_11 = 0
-        de_pos_11 = 0
-        dt_pos_11 = 0
-        fs_pos_11 = 0
-        ilb_pos_11 = 0
-        mlb_pos_11 = 0
-        nt_pos_11 = 0
-        olb_pos_11 = 0
-        ss_pos_11 = 1
-    
-    if offenseFormation == "Empty":
-        empty_form = 1
-        shotgun_form = 0
-        iform_form = 0
-        jumbo_form = 0
-        pistol_form = 0
-        singleback_form = 0
-        other_form = 0
-        qb_dist_from_ball = 5
-        qb_rel_x = -5
-        qb_rel_y = 0
-        dist_from_qb_1 = np.sqrt(np.square(rel_x_1 + 5)  + np.square(rel_y_1 - 0))
-        dist_from_qb_2 = np.sqrt(np.square(rel_x_2 + 5)  + np.square(rel_y_2 - 0))
-        dist_from_qb_3 = np.sqrt(np.square(rel_x_3 + 5)  + np.square(rel_y_3 - 0))
-        dist_from_qb_4 = np.sqrt(np.square(rel_x_4 + 5)  + np.square(rel_y_4 - 0))
-        dist_from_qb_5 = np.sqrt(np.square(rel_x_5 + 5)  + np.square(rel_y_5 - 0))
-        dist_from_qb_6 = np.sqrt(np.square(rel_x_6 + 5)  + np.square(rel_y_6 - 0))
-        dist_from_qb_7 = np.sqrt(np.square(rel_x_7 + 5)  + np.square(rel_y_7 - 0))
-        dist_from_qb_8 = np.sqrt(np.square(rel_x_8 + 5)  + np.square(rel_y_8 - 0))
-        dist_from_qb_9 = np.sqrt(np.square(rel_x_9 + 5)  + np.square(rel_y_9 - 0))
-        dist_from_qb_10 = np.sqrt(np.square(rel_x_10 + 5)  + np.square(rel_y_10 - 0))
-        dist_from_qb_11 = np.sqrt(np.square(rel_x_11 + 5)  + np.square(rel_y_11 - 0))
-        off_data = [["O", official_position_1, 0, 0, 0, 0.4, 'O'], # C 
-            ["O", official_position_2, 0, -1, 0, 0.4, 'O'], # LG
-            ["O", official_position_3, 0, -2, 0, 0.4, 'O'], # LT
-            ["O", official_position_4, 0, 1, 0, 0.4, 'O'], # RG
-            ["O", official_position_4, 0, 2, 0, 0.4, 'O'], # RT
-            ["O", official_position_4, -0.75, 3, 0, 0.4, 'O'], #TE-R
-            ["O", official_position_4, -5, 0, 0, 0.4, 'O'], # QB
-            ["O", official_position_4, -1, -7, 0, 0.4, 'O'], # RB-L / SLiWR
-            ["O", official_position_4, 0, 20, 0, 0.4, 'O'], # OR-WR
-            ["O", official_position_4, 0, -20, 0, 0.4, 'O'], # OL_WR
-            ["O", official_position_4, -1, -10, 0, 0.4, 'O'] # SL-WR
-        ]
-    elif offenseFormation == 'Shotgun':
-        empty_form = 0
-        shotgun_form = 1
-        iform_form = 0
-        jumbo_form = 0
-        pistol_form = 0
-        singleback_form = 0
-        other_form = 0
-        qb_dist_from_ball = 5 
-        qb_rel_x = -5
-        qb_rel_y = 0
-        dist_from_qb_1 = np.sqrt(np.square(rel_x_1 + 5)  + np.square(rel_y_1 - 0))
-        dist_from_qb_2 = np.sqrt(np.square(rel_x_2 + 5)  + np.square(rel_y_2 - 0))
-        dist_from_qb_3 = np.sqrt(np.square(rel_x_3 + 5)  + np.square(rel_y_3 - 0))
-        dist_from_qb_4 = np.sqrt(np.square(rel_x_4 + 5)  + np.square(rel_y_4 - 0))
-        dist_from_qb_5 = np.sqrt(np.square(rel_x_5 + 5)  + np.square(rel_y_5 - 0))
-        dist_from_qb_6 = np.sqrt(np.square(rel_x_6 + 5)  + np.square(rel_y_6 - 0))
-        dist_from_qb_7 = np.sqrt(np.square(rel_x_7 + 5)  + np.square(rel_y_7 - 0))
-        dist_from_qb_8 = np.sqrt(np.square(rel_x_8 + 5)  + np.square(rel_y_8 - 0))
-        dist_from_qb_9 = np.sqrt(np.square(rel_x_9 + 5)  + np.square(rel_y_9 - 0))
-        dist_from_qb_10 = np.sqrt(np.square(rel_x_10 + 5)  + np.square(rel_y_10 - 0))
-        dist_from_qb_11 = np.sqrt(np.square(rel_x_11 + 5)  + np.square(rel_y_11 - 0))
-        off_data = [["O", official_position_1, 0, 0, 0, 0.4, 'O'], # C 
-            ["O", official_position_2, 0, -1, 0, 0.4, 'O'], # LG
-            ["O", official_position_3, 0, -2, 0, 0.4, 'O'], # LT
-            ["O", official_position_4, 0, 1, 0, 0.4, 'O'], # RG
-            ["O", official_position_4, 0, 2, 0, 0.4, 'O'], # RT
-            ["O", official_position_4, -0.75, 3, 0, 0.4, 'O'], #TE-R
-            ["O", official_position_4, -5, 0, 0, 0.4, 'O'], # QB
-            ["O", official_position_4, -5, -1, 0, 0.4, 'O'], # RB-L
-            ["O", official_position_4, 0, 20, 0, 0.4, 'O'], # OR-WR
-            ["O", official_position_4, 0, -20, 0, 0.4, 'O'], # OL_WR
-            ["O", official_position_4, -1, -10, 0, 0.4, 'O'] # SL-WR
-        ]
-    elif offenseFormation == 'I Formation':
-        empty_form = 0
-        shotgun_form = 0
-        iform_form = 1
-        jumbo_form = 0
-        pistol_form = 0
-        singleback_form = 0
-        other_form = 0
-        qb_dist_from_ball = 1.5
-        qb_rel_x = -1.5
-        qb_rel_y = 0
-        dist_from_qb_1 = np.sqrt(np.square(rel_x_1 + 1.5)  + np.square(rel_y_1 - 0))
-        dist_from_qb_2 = np.sqrt(np.square(rel_x_2 + 1.5)  + np.square(rel_y_2 - 0))
-        dist_from_qb_3 = np.sqrt(np.square(rel_x_3 + 1.5)  + np.square(rel_y_3 - 0))
-        dist_from_qb_4 = np.sqrt(np.square(rel_x_4 + 1.5)  + np.square(rel_y_4 - 0))
-        dist_from_qb_5 = np.sqrt(np.square(rel_x_5 + 1.5)  + np.square(rel_y_5 - 0))
-        dist_from_qb_6 = np.sqrt(np.square(rel_x_6 + 1.5)  + np.square(rel_y_6 - 0))
-        dist_from_qb_7 = np.sqrt(np.square(rel_x_7 + 1.5)  + np.square(rel_y_7 - 0))
-        dist_from_qb_8 = np.sqrt(np.square(rel_x_8 + 1.5)  + np.square(rel_y_8 - 0))
-        dist_from_qb_9 = np.sqrt(np.square(rel_x_9 + 1.5)  + np.square(rel_y_9 - 0))
-        dist_from_qb_10 = np.sqrt(np.square(rel_x_10 + 1.5)  + np.square(rel_y_10 - 0))
-        dist_from_qb_11 = np.sqrt(np.square(rel_x_11 + 1.5)  + np.square(rel_y_11 - 0))
-        off_data = [["O", official_position_1, 0, 0, 0, 0.4, 'O'], # C 
-            ["O", official_position_2, 0, -1, 0, 0.4, 'O'], # LG
-            ["O", official_position_3, 0, -2, 0, 0.4, 'O'], # LT
-            ["O", official_position_4, 0, 1, 0, 0.4, 'O'], # RG
-            ["O", official_position_4, 0, 2, 0, 0.4, 'O'], # RT
-            ["O", official_position_4, -0.75, 3, 0, 0.4, 'O'], #TE-R
-            ["O", official_position_4, -1, 0, 0, 0.4, 'O'], # QB
-            ["O", official_position_4, -7, 0, 0, 0.4, 'O'], # RB
-            ["O", official_position_4, 0, 20, 0, 0.4, 'O'], # OR-WR
-            ["O", official_position_4, 0, -20, 0, 0.4, 'O'], # OL_WR
-            ["O", official_position_4, -3, 0, 0, 0.4, 'O'] # FB
-        ]
-    elif offenseFormation == 'Jumbo':
-        empty_form = 0
-        shotgun_form = 0
-        iform_form = 0
-        jumbo_form = 1
-        pistol_form = 0
-        singleback_form = 0
-        other_form = 0
-        qb_dist_from_ball = 1.5
-        qb_rel_x = -1.5
-        qb_rel_y = 0
-        dist_from_qb_1 = np.sqrt(np.square(rel_x_1 + 1.5)  + np.square(rel_y_1 - 0))
-        dist_from_qb_2 = np.sqrt(np.square(rel_x_2 + 1.5)  + np.square(rel_y_2 - 0))
-        dist_from_qb_3 = np.sqrt(np.square(rel_x_3 + 1.5)  + np.square(rel_y_3 - 0))
-        dist_from_qb_4 = np.sqrt(np.square(rel_x_4 + 1.5)  + np.square(rel_y_4 - 0))
-        dist_from_qb_5 = np.sqrt(np.square(rel_x_5 + 1.5)  + np.square(rel_y_5 - 0))
-        dist_from_qb_6 = np.sqrt(np.square(rel_x_6 + 1.5)  + np.square(rel_y_6 - 0))
-        dist_from_qb_7 = np.sqrt(np.square(rel_x_7 + 1.5)  + np.square(rel_y_7 - 0))
-        dist_from_qb_8 = np.sqrt(np.square(rel_x_8 + 1.5)  + np.square(rel_y_8 - 0))
-        dist_from_qb_9 = np.sqrt(np.square(rel_x_9 + 1.5)  + np.square(rel_y_9 - 0))
-        dist_from_qb_10 = np.sqrt(np.square(rel_x_10 + 1.5)  + np.square(rel_y_10 - 0))
-        dist_from_qb_11 = np.sqrt(np.square(rel_x_11 + 1.5)  + np.square(rel_y_11 - 0))
-        off_data = [["O", official_position_1, 0, 0, 0, 0.4, 'O'], # C 
-            ["O", official_position_2, 0, -1, 0, 0.4, 'O'], # LG
-            ["O", official_position_3, 0, -2, 0, 0.4, 'O'], # LT
-            ["O", official_position_4, 0, 1, 0, 0.4, 'O'], # RG
-            ["O", official_position_4, 0, 2, 0, 0.4, 'O'], # RT
-            ["O", official_position_4, 0, 3, 0, 0.4, 'O'], #TE-iR
-            ["O", official_position_4, -1, 0, 0, 0.4, 'O'], # QB
-            ["O", official_position_4, -6, 0, 0, 0.4, 'O'], # RB-L
-            ["O", official_position_4, -0.75, -20, 0, 0.4, 'O'], # OL-WR
-            ["O", official_position_4, 0, -3, 0, 0.4, 'O'], # TE-L
-            ["O", official_position_4, -0.75, 4, 0, 0.4, 'O'] # TE-oR
-        ]  
-    elif offenseFormation == 'Pistol':
-        empty_form = 0
-        shotgun_form = 0
-        iform_form = 0
-        jumbo_form = 0
-        pistol_form = 1
-        singleback_form = 0
-        other_form = 0
-        qb_dist_from_ball = 5
-        qb_rel_x = 5
-        qb_rel_y = 0
-        dist_from_qb_1 = np.sqrt(np.square(rel_x_1 + 5)  + np.square(rel_y_1 - 0))
-        dist_from_qb_2 = np.sqrt(np.square(rel_x_2 + 5)  + np.square(rel_y_2 - 0))
-        dist_from_qb_3 = np.sqrt(np.square(rel_x_3 + 5)  + np.square(rel_y_3 - 0))
-        dist_from_qb_4 = np.sqrt(np.square(rel_x_4 + 5)  + np.square(rel_y_4 - 0))
-        dist_from_qb_5 = np.sqrt(np.square(rel_x_5 + 5)  + np.square(rel_y_5 - 0))
-        dist_from_qb_6 = np.sqrt(np.square(rel_x_6 + 5)  + np.square(rel_y_6 - 0))
-        dist_from_qb_7 = np.sqrt(np.square(rel_x_7 + 5)  + np.square(rel_y_7 - 0))
-        dist_from_qb_8 = np.sqrt(np.square(rel_x_8 + 5)  + np.square(rel_y_8 - 0))
-        dist_from_qb_9 = np.sqrt(np.square(rel_x_9 + 5)  + np.square(rel_y_9 - 0))
-        dist_from_qb_10 = np.sqrt(np.square(rel_x_10 + 5)  + np.square(rel_y_10 - 0))
-        dist_from_qb_11 = np.sqrt(np.square(rel_x_11 + 5)  + np.square(rel_y_11 - 0))
-        off_data = [["O", official_position_1, 0, 0, 0, 0.4, 'O'], # C 
-            ["O", official_position_2, 0, -1, 0, 0.4, 'O'], # LG
-            ["O", official_position_3, 0, -2, 0, 0.4, 'O'], # LT
-            ["O", official_position_4, 0, 1, 0, 0.4, 'O'], # RG
-            ["O", official_position_4, 0, 2, 0, 0.4, 'O'], # RT
-            ["O", official_position_4, -0.75, 3, 0, 0.4, 'O'], #TE-R
-            ["O", official_position_4, -4, 0, 0, 0.4, 'O'], # QB
-            ["O", official_position_4, -7, 0, 0, 0.4, 'O'], # RB
-            ["O", official_position_4, 0, 20, 0, 0.4, 'O'], # OR-WR
-            ["O", official_position_4, 0, -20, 0, 0.4, 'O'], # OL_WR
-            ["O", official_position_4, -1, -10, 0, 0.4, 'O'] # SL-WR
-        ]
-    elif offenseFormation == 'Singleback':
-        empty_form = 0
-        shotgun_form = 0
-        iform_form = 0
-        jumbo_form = 0
-        pistol_form = 0
-        singleback_form = 1
-        other_form = 0
-        qb_dist_from_ball = 1.5
-        qb_rel_x = -1.5
-        qb_rel_y = 0
-        dist_from_qb_1 = np.sqrt(np.square(rel_x_1 + 1.5)  + np.square(rel_y_1 - 0))
-        dist_from_qb_2 = np.sqrt(np.square(rel_x_2 + 1.5)  + np.square(rel_y_2 - 0))
-        dist_from_qb_3 = np.sqrt(np.square(rel_x_3 + 1.5)  + np.square(rel_y_3 - 0))
-        dist_from_qb_4 = np.sqrt(np.square(rel_x_4 + 1.5)  + np.square(rel_y_4 - 0))
-        dist_from_qb_5 = np.sqrt(np.square(rel_x_5 + 1.5)  + np.square(rel_y_5 - 0))
-        dist_from_qb_6 = np.sqrt(np.square(rel_x_6 + 1.5)  + np.square(rel_y_6 - 0))
-        dist_from_qb_7 = np.sqrt(np.square(rel_x_7 + 1.5)  + np.square(rel_y_7 - 0))
-        dist_from_qb_8 = np.sqrt(np.square(rel_x_8 + 1.5)  + np.square(rel_y_8 - 0))
-        dist_from_qb_9 = np.sqrt(np.square(rel_x_9 + 1.5)  + np.square(rel_y_9 - 0))
-        dist_from_qb_10 = np.sqrt(np.square(rel_x_10 + 1.5)  + np.square(rel_y_10 - 0))
-        dist_from_qb_11 = np.sqrt(np.square(rel_x_11 + 1.5)  + np.square(rel_y_11 - 0))
-        off_data = [["O", official_position_1, 0, 0, 0, 0.4, 'O'], # C 
-            ["O", official_position_2, 0, -1, 0, 0.4, 'O'], # LG
-            ["O", official_position_3, 0, -2, 0, 0.4, 'O'], # LT
-            ["O", official_position_4, 0, 1, 0, 0.4, 'O'], # RG
-            ["O", official_position_4, 0, 2, 0, 0.4, 'O'], # RT
-            ["O", official_position_4, -0.75, 3, 0, 0.4, 'O'], #TE-R
-            ["O", official_position_4, -1, 0, 0, 0.4, 'O'], # QB
-            ["O", official_position_4, -6, 0, 0, 0.4, 'O'], # RB-L
-            ["O", official_position_4, 0, 20, 0, 0.4, 'O'], # OR-WR
-            ["O", official_position_4, 0, -20, 0, 0.4, 'O'], # OL_WR
-            ["O", official_position_4, -1, -10, 0, 0.4, 'O'] # SL-WR
-        ]
-    elif offenseFormation == "Wildcat":
-        empty_form = 0
-        shotgun_form = 0
-        iform_form = 0
-        jumbo_form = 0
-        pistol_form = 0
-        singleback_form = 0
-        other_form = 1
-        qb_dist_from_ball = 5
-        qb_rel_x = 5
-        qb_rel_y = 0
-        dist_from_qb_1 = np.sqrt(np.square(rel_x_1 + 5)  + np.square(rel_y_1 - 0))
-        dist_from_qb_2 = np.sqrt(np.square(rel_x_2 + 5)  + np.square(rel_y_2 - 0))
-        dist_from_qb_3 = np.sqrt(np.square(rel_x_3 + 5)  + np.square(rel_y_3 - 0))
-        dist_from_qb_4 = np.sqrt(np.square(rel_x_4 + 5)  + np.square(rel_y_4 - 0))
-        dist_from_qb_5 = np.sqrt(np.square(rel_x_5 + 5)  + np.square(rel_y_5 - 0))
-        dist_from_qb_6 = np.sqrt(np.square(rel_x_6 + 5)  + np.square(rel_y_6 - 0))
-        dist_from_qb_7 = np.sqrt(np.square(rel_x_7 + 5)  + np.square(rel_y_7 - 0))
-        dist_from_qb_8 = np.sqrt(np.square(rel_x_8 + 5)  + np.square(rel_y_8 - 0))
-        dist_from_qb_9 = np.sqrt(np.square(rel_x_9 + 5)  + np.square(rel_y_9 - 0))
-        dist_from_qb_10 = np.sqrt(np.square(rel_x_10 + 5)  + np.square(rel_y_10 - 0))
-        dist_from_qb_11 = np.sqrt(np.square(rel_x_11 + 5)  + np.square(rel_y_11 - 0))
-        off_data = [["O", official_position_1, 0, 0, 0, 0.4, 'O'], # C 
-            ["O", official_position_2, 0, -1, 0, 0.4, 'O'], # LG
-            ["O", official_position_3, 0, -2, 0, 0.4, 'O'], # LT
-            ["O", official_position_4, 0, 1, 0, 0.4, 'O'], # RG
-            ["O", official_position_4, 0, 2, 0, 0.4, 'O'], # RT
-            ["O", official_position_4, -0.75, 7, 0, 0.4, 'O'], #TE-R
-            ["O", official_position_4, -5, 0, 0, 0.4, 'O'], # QB
-            ["O", official_position_4, -5, -1, 0, 0.4, 'O'], # RB-L
-            ["O", official_position_4, 0, 20, 0, 0.4, 'O'], # OR-WR
-            ["O", official_position_4, 0, -20, 0, 0.4, 'O'], # OL_WR
-            ["O", official_position_4, -1, -10, 0, 0.4, 'O'] # SL-WR
-        ]
-
-    x_1 = np.array([[float(yardsToGo), float(absoluteYardlineNumber), float(defendersInBox),
-    float(num_rb), float(num_te), float(num_wr), float(num_dl), float(num_lb), float(num_db), float(rel_x_1), 
-    float(rel_y_1), float(0.96), float(0.90), float(absoluteYardlineNumber), float(ball_y_array),
-    float(-2.61), float(3.0), float(5.61), float(qb_dist_from_ball), float(qb_rel_x), float(qb_rel_y),
-    float(dist_from_qb_1), float(down_1), float(down_2), float(down_3), float(down_4), float(cb_pos_1), 
-    float(de_pos_1), float(dt_pos_1), float(fs_pos_1), float(ilb_pos_1), float(mlb_pos_1), float(nt_pos_1), 
-    float(olb_pos_1), float(ss_pos_1), float(empty_form), float(iform_form), float(jumbo_form),
-    float(pistol_form), float(shotgun_form), float(singleback_form), float(other_form)]])
-    dtrain_1 = DMatrix(x_1)
-    prediction_1 = round(100*(mod.predict(dtrain_1)[0]), 3)
-
-    x_2 = np.array([[float(yardsToGo), float(absoluteYardlineNumber), float(defendersInBox),
-    float(num_rb), float(num_te), float(num_wr), float(num_dl), float(num_lb), float(num_db), float(rel_x_2),
-    float(rel_y_2), float(0.37), float(2.44), float(absoluteYardlineNumber), float(ball_y_array),
-    float(-2.61), float(3.0), float(5.61), float(qb_dist_from_ball), float(qb_rel_x), float(qb_rel_y),
-    float(dist_from_qb_2), float(down_1), float(down_2), float(down_3), float(down_4), float(cb_pos_2), 
-    float(de_pos_2), float(dt_pos_2), float(fs_pos_2), float(ilb_pos_2), float(mlb_pos_2), float(nt_pos_2), 
-    float(olb_pos_2), float(ss_pos_2), float(empty_form), float(iform_form), float(jumbo_form),
-    float(pistol_form), float(shotgun_form), float(singleback_form), float(other_form)]])
-    dtrain_2 = DMatrix(x_2)
-    prediction_2 = round(100*(mod.predict(dtrain_2)[0]), 3)
-
-    x_3 = np.array([[float(yardsToGo), float(absoluteYardlineNumber), float(defendersInBox),
-    float(num_rb), float(num_te), float(num_wr), float(num_dl), float(num_lb), float(num_db), float(rel_x_3),
-    float(rel_y_3), float(0.39), float(0.24), float(absoluteYardlineNumber), float(ball_y_array),
-    float(-2.61), float(3.0), float(5.61), float(qb_dist_from_ball), float(qb_rel_x), float(qb_rel_y),
-    float(dist_from_qb_3), float(down_1), float(down_2), float(down_3), float(down_4), float(cb_pos_3), 
-    float(de_pos_3), float(dt_pos_3), float(fs_pos_3), float(ilb_pos_3), float(mlb_pos_3), float(nt_pos_3), 
-    float(olb_pos_3), float(ss_pos_3), float(empty_form), float(iform_form), float(jumbo_form),
-    float(pistol_form), float(shotgun_form), float(singleback_form), float(other_form)]])
-    dtrain_3 = DMatrix(x_3)
-    prediction_3 = round(100*(mod.predict(dtrain_3)[0]), 3)
-
-    x_4 = np.array([[float(yardsToGo), float(absoluteYardlineNumber), float(defendersInBox),
-    float(num_rb), float(num_te), float(num_wr), float(num_dl), float(num_lb), float(num_db), float(rel_x_4),
-    float(rel_y_4), float(0.17), float(0.14), float(absoluteYardlineNumber), float(ball_y_array),
-    float(-2.61), float(3.0), float(5.61), float(qb_dist_from_ball), float(qb_rel_x), float(qb_rel_y),
-    float(dist_from_qb_4), float(down_1), float(down_2), float(down_3), float(down_4), float(cb_pos_4), 
-    float(de_pos_4), float(dt_pos_4), float(fs_pos_4), float(ilb_pos_4), float(mlb_pos_4), float(nt_pos_4), 
-    float(olb_pos_4), float(ss_pos_4), float(empty_form), float(iform_form), float(jumbo_form),
-    float(pistol_form), float(shotgun_form), float(singleback_form), float(other_form)]])
-    dtrain_4 = DMatrix(x_4)
-    prediction_4 = round(100*(mod.predict(dtrain_4)[0]), 3)
-
-    x_5 = np.array([[float(yardsToGo), float(absoluteYardlineNumber), float(defendersInBox),
-    float(num_rb), float(num_te), float(num_wr), float(num_dl), float(num_lb), float(num_db), float(rel_x_5),
-    float(rel_y_5), float(2.54), float(1.46), float(absoluteYardlineNumber), float(ball_y_array),
-    float(-2.61), float(3.0), float(5.61), float(qb_dist_from_ball), float(qb_rel_x), float(qb_rel_y),
-    float(dist_from_qb_5), float(down_1), float(down_2), float(down_3), float(down_4), float(cb_pos_5), 
-    float(de_pos_5), float(dt_pos_5), float(fs_pos_5), float(ilb_pos_5), float(mlb_pos_5), float(nt_pos_5), 
-    float(olb_pos_5), float(ss_pos_5), float(empty_form), float(iform_form), float(jumbo_form),
-    float(pistol_form), float(shotgun_form), float(singleback_form), float(other_form)]])
-    dtrain_5 = DMatrix(x_5)
-    prediction_5 = round(100*(mod.predict(dtrain_5)[0]), 3)
-
-    x_6 = np.array([[float(yardsToGo), float(absoluteYardlineNumber), float(defendersInBox),
-    float(num_rb), float(num_te), float(num_wr), float(num_dl), float(num_lb), float(num_db), float(rel_x_6),
-    float(rel_y_6), float(0.56), float(2.42), float(absoluteYardlineNumber), float(ball_y_array),
-    float(-2.61), float(3.0), float(5.61), float(qb_dist_from_ball), float(qb_rel_x), float(qb_rel_y),
-    float(dist_from_qb_6), float(down_1), float(down_2), float(down_3), float(down_4), float(cb_pos_6), 
-    float(de_pos_6), float(dt_pos_6), float(fs_pos_6), float(ilb_pos_6), float(mlb_pos_6), float(nt_pos_6), 
-    float(olb_pos_6), float(ss_pos_6), float(empty_form), float(iform_form), float(jumbo_form),
-    float(pistol_form), float(shotgun_form), float(singleback_form), float(other_form)]])
-    dtrain_6 = DMatrix(x_6)
-    prediction_6 = round(100*(mod.predict(dtrain_6)[0]), 3)
-
-    x_7 = np.array([[float(yardsToGo), float(absoluteYardlineNumber), float(defendersInBox),
-    float(num_rb), float(num_te), float(num_wr), float(num_dl), float(num_lb), float(num_db), float(rel_x_7),
-    float(rel_y_7), float(1.17), float(1.21), float(absoluteYardlineNumber), float(ball_y_array),
-    float(-2.61), float(3.0), float(5.61), float(qb_dist_from_ball), float(qb_rel_x), float(qb_rel_y),
-    float(dist_from_qb_7), float(down_1), float(down_2), float(down_3), float(down_4), float(cb_pos_7), 
-    float(de_pos_7), float(dt_pos_7), float(fs_pos_7), float(ilb_pos_7), float(mlb_pos_7), float(nt_pos_7), 
-    float(olb_pos_7), float(ss_pos_7), float(empty_form), float(iform_form), float(jumbo_form),
-    float(pistol_form), float(shotgun_form), float(singleback_form), float(other_form)]])
-    dtrain_7 = DMatrix(x_7)
-    prediction_7 = round(100*(mod.predict(dtrain_7)[0]), 3)
-
-    x_8 = np.array([[float(yardsToGo), float(absoluteYardlineNumber), float(defendersInBox),
-    float(num_rb), float(num_te), float(num_wr), float(num_dl), float(num_lb), float(num_db), float(rel_x_8),
-    float(rel_y_8), float(1.25), float(1.05), float(absoluteYardlineNumber), float(ball_y_array),
-    float(-2.61), float(3.0), float(5.61), float(qb_dist_from_ball), float(qb_rel_x), float(qb_rel_y),
-    float(dist_from_qb_8), float(down_1), float(down_2), float(down_3), float(down_4), float(cb_pos_8), 
-    float(de_pos_8), float(dt_pos_8), float(fs_pos_8), float(ilb_pos_8), float(mlb_pos_8), float(nt_pos_8), 
-    float(olb_pos_8), float(ss_pos_8), float(empty_form), float(iform_form), float(jumbo_form),
-    float(pistol_form), float(shotgun_form), float(singleback_form), float(other_form)]])
-    dtrain_8 = DMatrix(x_8)
-    prediction_8 = round(100*(mod.predict(dtrain_8)[0]), 3)
-
-    x_9 = np.array([[float(yardsToGo), float(absoluteYardlineNumber), float(defendersInBox),
-    float(num_rb), float(num_te), float(num_wr), float(num_dl), float(num_lb), float(num_db), float(rel_x_9),
-    float(rel_y_9), float(0.90), float(0.18), float(absoluteYardlineNumber), float(ball_y_array),
-    float(-2.61), float(3.0), float(5.61), float(qb_dist_from_ball), float(qb_rel_x), float(qb_rel_y),
-    float(dist_from_qb_9), float(down_1), float(down_2), float(down_3), float(down_4), float(cb_pos_9), 
-    float(de_pos_9), float(dt_pos_9), float(fs_pos_9), float(ilb_pos_9), float(mlb_pos_9), float(nt_pos_9), 
-    float(olb_pos_9), float(ss_pos_9), float(empty_form), float(iform_form), float(jumbo_form),
-    float(pistol_form), float(shotgun_form), float(singleback_form), float(other_form)]])
-    dtrain_9 = DMatrix(x_9)
-    prediction_9 = round(100*(mod.predict(dtrain_9)[0]), 3)
-
-    x_10 = np.array([[float(yardsToGo), float(absoluteYardlineNumber), float(defendersInBox),
-    float(num_rb), float(num_te), float(num_wr), float(num_dl), float(num_lb), float(num_db), float(rel_x_10),
-    float(rel_y_10), float(0.36), float(2.85), float(absoluteYardlineNumber), float(ball_y_array),
-    float(-2.61), float(3.0), float(5.61), float(qb_dist_from_ball), float(qb_rel_x), float(qb_rel_y),
-    float(dist_from_qb_10), float(down_1), float(down_2), float(down_3), float(down_4), float(cb_pos_10), 
-    float(de_pos_10), float(dt_pos_10), float(fs_pos_10), float(ilb_pos_10), float(mlb_pos_10), float(nt_pos_10), 
-    float(olb_pos_10), float(ss_pos_10), float(empty_form), float(iform_form), float(jumbo_form),
-    float(pistol_form), float(shotgun_form), float(singleback_form), float(other_form)]])
-    dtrain_10 = DMatrix(x_10)
-    prediction_10 = round(100*(mod.predict(dtrain_10)[0]), 3)
-
-    x_11 = np.array([[float(yardsToGo), float(absoluteYardlineNumber), float(defendersInBox),
-    float(num_rb), float(num_te), float(num_wr), float(num_dl), float(num_lb), float(num_db), float(rel_x_11),
-    float(rel_y_11), float(0.03), float(0.18), float(absoluteYardlineNumber), float(ball_y_array),
-    float(-2.61), float(3.0), float(5.61), float(qb_dist_from_ball), float(qb_rel_x), float(qb_rel_y),
-    float(dist_from_qb_11), float(down_1), float(down_2), float(down_3), float(down_4), float(cb_pos_11), 
-    float(de_pos_11), float(dt_pos_11), float(fs_pos_11), float(ilb_pos_11), float(mlb_pos_11), float(nt_pos_11), 
-    float(olb_pos_11), float(ss_pos_11), float(empty_form), float(iform_form), float(jumbo_form),
-    float(pistol_form), float(shotgun_form), float(singleback_form), float(other_form)]])
-    dtrain_11 = DMatrix(x_11)
-    prediction_11 = round(100*(mod.predict(dtrain_11)[0]), 3)
-
-    display_dist_1 = round(dist_from_qb_1, 1)
-    display_dist_2 = round(dist_from_qb_2, 1)
-    display_dist_3 = round(dist_from_qb_3, 1)
-    display_dist_4 = round(dist_from_qb_4, 1)
-    display_dist_5 = round(dist_from_qb_5, 1)
-    display_dist_6 = round(dist_from_qb_6, 1)
-    display_dist_7 = round(dist_from_qb_7, 1)
-    display_dist_8 = round(dist_from_qb_8, 1)
-    display_dist_9 = round(dist_from_qb_9, 1)
-    display_dist_10 = round(dist_from_qb_10, 1)
-    display_dist_11 = round(dist_from_qb_11, 1)
-
-    data = [["1", official_position_1, rel_x_1, rel_y_1, display_dist_1, prediction_1], 
-            ["2", official_position_2, rel_x_2, rel_y_2, display_dist_2, prediction_2],
-            ["3", official_position_3, rel_x_3, rel_y_3, display_dist_3, prediction_3],
-            ["4", official_position_4, rel_x_4, rel_y_4, display_dist_4, prediction_4],
-            ["5", official_position_5, rel_x_5, rel_y_5, display_dist_5, prediction_5],
-            ["6", official_position_6, rel_x_6, rel_y_6, display_dist_6, prediction_6],
-            ["7", official_position_7, rel_x_7, rel_y_7, display_dist_7, prediction_7],
-            ["8", official_position_8, rel_x_8, rel_y_8, display_dist_8, prediction_8],
-            ["9", official_position_9, rel_x_9, rel_y_9, display_dist_9, prediction_9],
-            ["10", official_position_10, rel_x_10, rel_y_10, display_dist_10, prediction_10],
-            ["11", official_position_11, rel_x_11, rel_y_11, display_dist_11, prediction_11]]
-    
-    df = pd.DataFrame(data,columns=['Player','Position', 'Rel. x', 'Rel. y', 'Dist. From QB', 'Chance of a Sack (%)'])
-    df_graph = df
-    df_graph['Off_Def'] = ['D','D','D','D','D','D','D','D','D','D','D']
-
-    
-
-    off_df = pd.DataFrame(off_data,columns=['Player','Position', 'Rel. x', 'Rel. y', 'Dist. From QB', 'Chance of a Sack (%)', 'Off_Def'])
-
-    df_graph = df_graph.append(off_df)
-    #diagram = px.scatter(data, x=2, y=3)
-    diagram = px.scatter(df_graph, x='Rel. y', y='Rel. x', size = 'Chance of a Sack (%)', color = 'Off_Def', text='Player',
-    size_max=20)
-    diagram.update_xaxes(range=[-26.65, 26.65])
-    diagram.update_yaxes(range=[-10,20])
-
-    if n_clicks:                            
-        data = df.to_dict('rows')
-        columns =  [{"name": i, "id": i,} for i in (df.columns)]
-        return (dt.DataTable(data=data, columns=columns, sort_action='native', sort_mode='multi', sort_as_null=['', 'No'],
-         sort_by=[{'column_id': 'Chance of a Sack (%)', 'direction': 'desc'}], style_cell={'textAlign': 'center',
-        # all three widths are needed
-        'minWidth': '150px', 'width': '150px', 'maxWidth': '150px',
-        'overflow': 'hidden',
-        'textOverflow': 'ellipsis',
-    }, style_header = {'fontWeight': 'bold'}, editable=True), diagram)
-    else :
-        return('Press submit to view results', diagram)
+                  official_position_11, offenseFormation, explain=None):
+    rel_x = [rel_x_1, rel_x_2, rel_x_3, rel_x_4, rel_x_5, rel_x_6, rel_x_7, rel_x_8, rel_x_9, rel_x_10, rel_x_11]
+    rel_y = [rel_y_1, rel_y_2, rel_y_3, rel_y_4, rel_y_5, rel_y_6, rel_y_7, rel_y_8, rel_y_9, rel_y_10, rel_y_11]
+    positions = [official_position_1, official_position_2, official_position_3, official_position_4,
+                 official_position_5, official_position_6, official_position_7, official_position_8,
+                 official_position_9, official_position_10, official_position_11]
+    return front_outputs(bool(n_clicks), yardsToGo, absoluteYardlineNumber, defendersInBox, o_dropdown, d_dropdown,
+                         the_hash, down, offenseFormation, rel_x, rel_y, positions, size_max=20,
+                         drivers=bool(explain))
 
 
 page_2_layout = html.Div([
@@ -1804,6 +540,7 @@ page_2_layout = html.Div([
      dbc.Row([
         html.Br(),
         dbc.Row([dbc.Button('Submit', id='submit-val', n_clicks=0, color="primary")]),
+        dbc.Row([dcc.Checklist([{'label': ' Show what drives each prediction', 'value': 'drivers'}], [], id='explain')]),
         html.Br(),
         dbc.Row([html.Div(id='prediction output')])
     ]),
@@ -1978,7 +715,8 @@ page_2_layout = html.Div([
     State('LR_8', 'value'),
     State('LR_9', 'value'),
     State('LR_10', 'value'),
-    State('LR_11', 'value'))
+    State('LR_11', 'value'),
+    State('explain', 'value'))
 
 
 def update_output(n_clicks, yardsToGo, absoluteYardlineNumber, defendersInBox, o_dropdown, 
@@ -1990,2321 +728,19 @@ def update_output(n_clicks, yardsToGo, absoluteYardlineNumber, defendersInBox, o
                   official_position_5, official_position_6, official_position_7, 
                   official_position_8, official_position_9, official_position_10,
                   official_position_11, offenseFormation,
-                  LR_1, LR_2, LR_3, LR_4, LR_5, LR_6, LR_7, LR_8, LR_9, LR_10, LR_11):
-    
-    if o_dropdown == '12*':
-        num_rb = float(1)
-        num_te = float(2)
-        num_wr = float(1)
-    elif o_dropdown == '12':
-        num_rb = float(1)
-        num_te = float(2)
-        num_wr = float(2)
-    elif o_dropdown == '21':
-        num_rb = float(2)
-        num_te = float(1)
-        num_wr = float(2)
-    elif o_dropdown == '13':
-        num_rb = float(1)
-        num_te = float(3)
-        num_wr = float(1)        
-    elif o_dropdown == '10':
-        num_rb = float(1)
-        num_te = float(0)
-        num_wr = float(4)       
-    elif o_dropdown == '22':
-        num_rb = float(2)
-        num_te = float(2)
-        num_wr = float(1)
-    elif o_dropdown == '01':
-        num_rb = float(0)
-        num_te = float(1)
-        num_wr = float(4)
-    elif o_dropdown == '20':
-        num_rb = float(2)
-        num_te = float(0)
-        num_wr = float(3)
-    elif o_dropdown == '11*':
-        num_rb = float(1)
-        num_te = float(1)
-        num_wr = float(2)
-    elif o_dropdown == '02':
-        num_rb = float(0)
-        num_te = float(2)
-        num_wr = float(3)
-    else:
-        num_rb = float(1)
-        num_te = float(1)
-        num_wr = float(3)
-        
-    if d_dropdown == '1-5-5':
-        num_dl = float(1)
-        num_lb = float(5)
-        num_db = float(5)
-    elif d_dropdown == '2-4-5':
-        num_dl = float(2)
-        num_lb = float(4)
-        num_db = float(5)
-    elif d_dropdown == '3-3-5':
-        num_dl = float(3)
-        num_lb = float(3)
-        num_db = float(5)
-    elif d_dropdown == '2-3-6':
-        num_dl = float(2)
-        num_lb = float(3)
-        num_db = float(6)
-    elif d_dropdown == '4-3-4':
-        num_dl = float(4)
-        num_lb = float(3)
-        num_db = float(4)
-    elif d_dropdown == '3-4-4':
-        num_dl = float(3)
-        num_lb = float(4)
-        num_db = float(4)
-    elif d_dropdown == '4-1-6':
-        num_dl = float(4)
-        num_lb = float(1)
-        num_db = float(6)
-    elif d_dropdown == '3-2-6':
-        num_dl = float(3)
-        num_lb = float(2)
-        num_db = float(6)
-    elif d_dropdown == '1-4-6':
-        num_dl = float(1)
-        num_lb = float(4)
-        num_db = float(6)
-    else:
-        num_dl = float(4)
-        num_lb = float(2)
-        num_db = float(5)
-        
-    
-    if the_hash == 'Right':
-        ball_y_array = 29.7
-    elif the_hash == 'Left':
-        ball_y_array = 23.6
-    else:
-        ball_y_array = 27.0
-    
-    
-    if float(down) == 4:
-        down_1 = 0
-        down_2 = 0
-        down_3 = 0
-        down_4 = 1
-    elif float(down) == 3:
-        down_1 = 0
-        down_2 = 0
-        down_3 = 1
-        down_4 = 0      
-    elif float(down) == 2:
-        down_1 = 0
-        down_2 = 1
-        down_3 = 0
-        down_4 = 0    
-    else:
-        down_1 = 1
-        down_2 = 0
-        down_3 = 0
-        down_4 = 0    
-    
-    if official_position_1 == 'CB':
-        cb_pos_1 = 1
-        de_pos_1 = 0
-        dt_pos_1 = 0
-        fs_pos_1 = 0
-        ilb_pos_1 = 0
-        mlb_pos_1 = 0
-        nt_pos_1 = 0
-        olb_pos_1 = 0
-        ss_pos_1 = 0
-    elif official_position_1 == 'DE':
-        cb_pos_1 = 0
-        de_pos_1 = 1
-        dt_pos_1 = 0
-        fs_pos_1 = 0
-        ilb_pos_1 = 0
-        mlb_pos_1 = 0
-        nt_pos_1 = 0
-        olb_pos_1 = 0
-        ss_pos_1 = 0
-    elif official_position_1 == 'DT':
-        cb_pos_1 = 0
-        de_pos_1 = 0
-        dt_pos_1 = 1
-        fs_pos_1 = 0
-        ilb_pos_1 = 0
-        mlb_pos_1 = 0
-        nt_pos_1 = 0
-        olb_pos_1 = 0
-        ss_pos_1 = 0
-    elif official_position_1 == 'FS':
-        cb_pos_1 = 0
-        de_pos_1 = 0
-        dt_pos_1 = 0
-        fs_pos_1 = 1
-        ilb_pos_1 = 0
-        mlb_pos_1 = 0
-        nt_pos_1 = 0
-        olb_pos_1 = 0
-        ss_pos_1 = 0
-    elif official_position_1 == 'ILB':
-        cb_pos_1 = 0
-        de_pos_1 = 0
-        dt_pos_1 = 0
-        fs_pos_1 = 0
-        ilb_pos_1 = 1
-        mlb_pos_1 = 0
-        nt_pos_1 = 0
-        olb_pos_1 = 0
-        ss_pos_1 = 0
-    elif official_position_1 == 'MLB':
-        cb_pos_1 = 0
-        de_pos_1 = 0
-        dt_pos_1 = 0
-        fs_pos_1 = 0
-        ilb_pos_1 = 0
-        mlb_pos_1 = 1
-        nt_pos_1 = 0
-        olb_pos_1 = 0
-        ss_pos_1 = 0
-    elif official_position_1 == 'NT':
-        cb_pos_1 = 0
-        de_pos_1 = 0
-        dt_pos_1 = 0
-        fs_pos_1 = 0
-        ilb_pos_1 = 0
-        mlb_pos_1 = 0
-        nt_pos_1 = 1
-        olb_pos_1 = 0
-        ss_pos_1 = 0
-    elif official_position_1 == 'OLB':
-        cb_pos_1 = 0
-        de_pos_1 = 0
-        dt_pos_1 = 0
-        fs_pos_1 = 0
-        ilb_pos_1 = 0
-        mlb_pos_1 = 0
-        nt_pos_1 = 0
-        olb_pos_1 = 1
-        ss_pos_1 = 0
-    elif official_position_1 == 'SS':
-        cb_pos_1 = 0
-        de_pos_1 = 0
-        dt_pos_1 = 0
-        fs_pos_1 = 0
-        ilb_pos_1 = 0
-        mlb_pos_1 = 0
-        nt_pos_1 = 0
-        olb_pos_1 = 0
-        ss_pos_1 = 1
-
-    if official_position_2 == 'CB':
-        cb_pos_2 = 1
-        de_pos_2 = 0
-        dt_pos_2 = 0
-        fs_pos_2 = 0
-        ilb_pos_2 = 0
-        mlb_pos_2 = 0
-        nt_pos_2 = 0
-        olb_pos_2 = 0
-        ss_pos_2 = 0
-    elif official_position_2 == 'DE':
-        cb_pos_2 = 0
-        de_pos_2 = 1
-        dt_pos_2 = 0
-        fs_pos_2 = 0
-        ilb_pos_2 = 0
-        mlb_pos_2 = 0
-        nt_pos_2 = 0
-        olb_pos_2 = 0
-        ss_pos_2 = 0
-    elif official_position_2 == 'DT':
-        cb_pos_2 = 0
-        de_pos_2 = 0
-        dt_pos_2 = 1
-        fs_pos_2 = 0
-        ilb_pos_2 = 0
-        mlb_pos_2 = 0
-        nt_pos_2 = 0
-        olb_pos_2 = 0
-        ss_pos_2 = 0
-    elif official_position_2 == 'FS':
-        cb_pos_2 = 0
-        de_pos_2 = 0
-        dt_pos_2 = 0
-        fs_pos_2 = 1
-        ilb_pos_2 = 0
-        mlb_pos_2 = 0
-        nt_pos_2 = 0
-        olb_pos_2 = 0
-        ss_pos_2 = 0
-    elif official_position_2 == 'ILB':
-        cb_pos_2 = 0
-        de_pos_2 = 0
-        dt_pos_2 = 0
-        fs_pos_2 = 0
-        ilb_pos_2 = 1
-        mlb_pos_2 = 0
-        nt_pos_2 = 0
-        olb_pos_2 = 0
-        ss_pos_2 = 0
-    elif official_position_2 == 'MLB':
-        cb_pos_2 = 0
-        de_pos_2 = 0
-        dt_pos_2 = 0
-        fs_pos_2 = 0
-        ilb_pos_2 = 0
-        mlb_pos_2 = 1
-        nt_pos_2 = 0
-        olb_pos_2 = 0
-        ss_pos_2 = 0
-    elif official_position_2 == 'NT':
-        cb_pos_2 = 0
-        de_pos_2 = 0
-        dt_pos_2 = 0
-        fs_pos_2 = 0
-        ilb_pos_2 = 0
-        mlb_pos_2 = 0
-        nt_pos_2 = 1
-        olb_pos_2 = 0
-        ss_pos_2 = 0
-    elif official_position_2 == 'OLB':
-        cb_pos_2 = 0
-        de_pos_2 = 0
-        dt_pos_2 = 0
-        fs_pos_2 = 0
-        ilb_pos_2 = 0
-        mlb_pos_2 = 0
-        nt_pos_2 = 0
-        olb_pos_2 = 1
-        ss_pos_2 = 0
-    elif official_position_2 == 'SS':
-        cb_pos_2 = 0
-        de_pos_2 = 0
-        dt_pos_2 = 0
-        fs_pos_2 = 0
-        ilb_pos_2 = 0
-        mlb_pos_2 = 0
-        nt_pos_2 = 0
-        olb_pos_2 = 0
-        ss_pos_2 = 1
-        
-    if official_position_3 == 'CB':
-        cb_pos_3 = 1
-        de_pos_3 = 0
-        dt_pos_3 = 0
-        fs_pos_3 = 0
-        ilb_pos_3 = 0
-        mlb_pos_3 = 0
-        nt_pos_3 = 0
-        olb_pos_3 = 0
-        ss_pos_3 = 0
-    elif official_position_3 == 'DE':
-        cb_pos_3 = 0
-        de_pos_3 = 1
-        dt_pos_3 = 0
-        fs_pos_3 = 0
-        ilb_pos_3 = 0
-        mlb_pos_3 = 0
-        nt_pos_3 = 0
-        olb_pos_3 = 0
-        ss_pos_3 = 0
-    elif official_position_3 == 'DT':
-        cb_pos_3 = 0
-        de_pos_3 = 0
-        dt_pos_3 = 1
-        fs_pos_3 = 0
-        ilb_pos_3 = 0
-        mlb_pos_3 = 0
-        nt_pos_3 = 0
-        olb_pos_3 = 0
-        ss_pos_3 = 0
-    elif official_position_3 == 'FS':
-        cb_pos_3 = 0
-        de_pos_3 = 0
-        dt_pos_3 = 0
-        fs_pos_3 = 1
-        ilb_pos_3 = 0
-        mlb_pos_3 = 0
-        nt_pos_3 = 0
-        olb_pos_3 = 0
-        ss_pos_3 = 0
-    elif official_position_3 == 'ILB':
-        cb_pos_3 = 0
-        de_pos_3 = 0
-        dt_pos_3 = 0
-        fs_pos_3 = 0
-        ilb_pos_3 = 1
-        mlb_pos_3 = 0
-        nt_pos_3 = 0
-        olb_pos_3 = 0
-        ss_pos_3 = 0
-    elif official_position_3 == 'MLB':
-        cb_pos_3 = 0
-        de_pos_3 = 0
-        dt_pos_3 = 0
-        fs_pos_3 = 0
-        ilb_pos_3 = 0
-        mlb_pos_3 = 1
-        nt_pos_3 = 0
-        olb_pos_3 = 0
-        ss_pos_3 = 0
-    elif official_position_3 == 'NT':
-        cb_pos_3 = 0
-        de_pos_3 = 0
-        dt_pos_3 = 0
-        fs_pos_3 = 0
-        ilb_pos_3 = 0
-        mlb_pos_3 = 0
-        nt_pos_3 = 1
-        olb_pos_3 = 0
-        ss_pos_3 = 0
-    elif official_position_3 == 'OLB':
-        cb_pos_3 = 0
-        de_pos_3 = 0
-        dt_pos_3 = 0
-        fs_pos_3 = 0
-        ilb_pos_3 = 0
-        mlb_pos_3 = 0
-        nt_pos_3 = 0
-        olb_pos_3 = 1
-        ss_pos_3 = 0
-    elif official_position_3 == 'SS':
-        cb_pos_3 = 0
-        de_pos_3 = 0
-        dt_pos_3 = 0
-        fs_pos_3 = 0
-        ilb_pos_3 = 0
-        mlb_pos_3 = 0
-        nt_pos_3 = 0
-        olb_pos_3 = 0
-        ss_pos_3 = 1
-    
-    if official_position_4 == 'CB':
-        cb_pos_4 = 1
-        de_pos_4 = 0
-        dt_pos_4 = 0
-        fs_pos_4 = 0
-        ilb_pos_4 = 0
-        mlb_pos_4 = 0
-        nt_pos_4 = 0
-        olb_pos_4 = 0
-        ss_pos_4 = 0
-    elif official_position_4 == 'DE':
-        cb_pos_4 = 0
-        de_pos_4 = 1
-        dt_pos_4 = 0
-        fs_pos_4 = 0
-        ilb_pos_4 = 0
-        mlb_pos_4 = 0
-        nt_pos_4 = 0
-        olb_pos_4 = 0
-        ss_pos_4 = 0
-    elif official_position_4 == 'DT':
-        cb_pos_4 = 0
-        de_pos_4 = 0
-        dt_pos_4 = 1
-        fs_pos_4 = 0
-        ilb_pos_4 = 0
-        mlb_pos_4 = 0
-        nt_pos_4 = 0
-        olb_pos_4 = 0
-        ss_pos_4 = 0
-    elif official_position_4 == 'FS':
-        cb_pos_4 = 0
-        de_pos_4 = 0
-        dt_pos_4 = 0
-        fs_pos_4 = 1
-        ilb_pos_4 = 0
-        mlb_pos_4 = 0
-        nt_pos_4 = 0
-        olb_pos_4 = 0
-        ss_pos_4 = 0
-    elif official_position_4 == 'ILB':
-        cb_pos_4 = 0
-        de_pos_4 = 0
-        dt_pos_4 = 0
-        fs_pos_4 = 0
-        ilb_pos_4 = 1
-        mlb_pos_4 = 0
-        nt_pos_4 = 0
-        olb_pos_4 = 0
-        ss_pos_4 = 0
-    elif official_position_4 == 'MLB':
-        cb_pos_4 = 0
-        de_pos_4 = 0
-        dt_pos_4 = 0
-        fs_pos_4 = 0
-        ilb_pos_4 = 0
-        mlb_pos_4 = 1
-        nt_pos_4 = 0
-        olb_pos_4 = 0
-        ss_pos_4 = 0
-    elif official_position_4 == 'NT':
-        cb_pos_4 = 0
-        de_pos_4 = 0
-        dt_pos_4 = 0
-        fs_pos_4 = 0
-        ilb_pos_4 = 0
-        mlb_pos_4 = 0
-        nt_pos_4 = 1
-        olb_pos_4 = 0
-        ss_pos_4 = 0
-    elif official_position_4 == 'OLB':
-        cb_pos_4 = 0
-        de_pos_4 = 0
-        dt_pos_4 = 0
-        fs_pos_4 = 0
-        ilb_pos_4 = 0
-        mlb_pos_4 = 0
-        nt_pos_4 = 0
-        olb_pos_4 = 1
-        ss_pos_4 = 0
-    elif official_position_4 == 'SS':
-        cb_pos_4 = 0
-        de_pos_4 = 0
-        dt_pos_4 = 0
-        fs_pos_4 = 0
-        ilb_pos_4 = 0
-        mlb_pos_4 = 0
-        nt_pos_4 = 0
-        olb_pos_4 = 0
-        ss_pos_4 = 1
-    
-    if official_position_5 == 'CB':
-        cb_pos_5 = 1
-        de_pos_5 = 0
-        dt_pos_5 = 0
-        fs_pos_5 = 0
-        ilb_pos_5 = 0
-        mlb_pos_5 = 0
-        nt_pos_5 = 0
-        olb_pos_5 = 0
-        ss_pos_5 = 0
-    elif official_position_5 == 'DE':
-        cb_pos_5 = 0
-        de_pos_5 = 1
-        dt_pos_5 = 0
-        fs_pos_5 = 0
-        ilb_pos_5 = 0
-        mlb_pos_5 = 0
-        nt_pos_5 = 0
-        olb_pos_5 = 0
-        ss_pos_5 = 0
-    elif official_position_5 == 'DT':
-        cb_pos_5 = 0
-        de_pos_5 = 0
-        dt_pos_5 = 1
-        fs_pos_5 = 0
-        ilb_pos_5 = 0
-        mlb_pos_5 = 0
-        nt_pos_5 = 0
-        olb_pos_5 = 0
-        ss_pos_5 = 0
-    elif official_position_5 == 'FS':
-        cb_pos_5 = 0
-        de_pos_5 = 0
-        dt_pos_5 = 0
-        fs_pos_5 = 1
-        ilb_pos_5 = 0
-        mlb_pos_5 = 0
-        nt_pos_5 = 0
-        olb_pos_5 = 0
-        ss_pos_5 = 0
-    elif official_position_5 == 'ILB':
-        cb_pos_5 = 0
-        de_pos_5 = 0
-        dt_pos_5 = 0
-        fs_pos_5 = 0
-        ilb_pos_5 = 1
-        mlb_pos_5 = 0
-        nt_pos_5 = 0
-        olb_pos_5 = 0
-        ss_pos_5 = 0
-    elif official_position_5 == 'MLB':
-        cb_pos_5 = 0
-        de_pos_5 = 0
-        dt_pos_5 = 0
-        fs_pos_5 = 0
-        ilb_pos_5 = 0
-        mlb_pos_5 = 1
-        nt_pos_5 = 0
-        olb_pos_5 = 0
-        ss_pos_5 = 0
-    elif official_position_5 == 'NT':
-        cb_pos_5 = 0
-        de_pos_5 = 0
-        dt_pos_5 = 0
-        fs_pos_5 = 0
-        ilb_pos_5 = 0
-        mlb_pos_5 = 0
-        nt_pos_5 = 1
-        olb_pos_5 = 0
-        ss_pos_5 = 0
-    elif official_position_5 == 'OLB':
-        cb_pos_5 = 0
-        de_pos_5 = 0
-        dt_pos_5 = 0
-        fs_pos_5 = 0
-        ilb_pos_5 = 0
-        mlb_pos_5 = 0
-        nt_pos_5 = 0
-        olb_pos_5 = 1
-        ss_pos_5 = 0
-    elif official_position_5 == 'SS':
-        cb_pos_5 = 0
-        de_pos_5 = 0
-        dt_pos_5 = 0
-        fs_pos_5 = 0
-        ilb_pos_5 = 0
-        mlb_pos_5 = 0
-        nt_pos_5 = 0
-        olb_pos_5 = 0
-        ss_pos_5 = 1
-
-    if official_position_6 == 'CB':
-        cb_pos_6 = 1
-        de_pos_6 = 0
-        dt_pos_6 = 0
-        fs_pos_6 = 0
-        ilb_pos_6 = 0
-        mlb_pos_6 = 0
-        nt_pos_6 = 0
-        olb_pos_6 = 0
-        ss_pos_6 = 0
-    elif official_position_6 == 'DE':
-        cb_pos_6 = 0
-        de_pos_6 = 1
-        dt_pos_6 = 0
-        fs_pos_6 = 0
-        ilb_pos_6 = 0
-        mlb_pos_6 = 0
-        nt_pos_6 = 0
-        olb_pos_6 = 0
-        ss_pos_6 = 0
-    elif official_position_6 == 'DT':
-        cb_pos_6 = 0
-        de_pos_6 = 0
-        dt_pos_6 = 1
-        fs_pos_6 = 0
-        ilb_pos_6 = 0
-        mlb_pos_6 = 0
-        nt_pos_6 = 0
-        olb_pos_6 = 0
-        ss_pos_6 = 0
-    elif official_position_6 == 'FS':
-        cb_pos_6 = 0
-        de_pos_6 = 0
-        dt_pos_6 = 0
-        fs_pos_6 = 1
-        ilb_pos_6 = 0
-        mlb_pos_6 = 0
-        nt_pos_6 = 0
-        olb_pos_6 = 0
-        ss_pos_6 = 0
-    elif official_position_6 == 'ILB':
-        cb_pos_6 = 0
-        de_pos_6 = 0
-        dt_pos_6 = 0
-        fs_pos_6 = 0
-        ilb_pos_6 = 1
-        mlb_pos_6 = 0
-        nt_pos_6 = 0
-        olb_pos_6 = 0
-        ss_pos_6 = 0
-    elif official_position_6 == 'MLB':
-        cb_pos_6 = 0
-        de_pos_6 = 0
-        dt_pos_6 = 0
-        fs_pos_6 = 0
-        ilb_pos_6 = 0
-        mlb_pos_6 = 1
-        nt_pos_6 = 0
-        olb_pos_6 = 0
-        ss_pos_6 = 0
-    elif official_position_6 == 'NT':
-        cb_pos_6 = 0
-        de_pos_6 = 0
-        dt_pos_6 = 0
-        fs_pos_6 = 0
-        ilb_pos_6 = 0
-        mlb_pos_6 = 0
-        nt_pos_6 = 1
-        olb_pos_6 = 0
-        ss_pos_6 = 0
-    elif official_position_6 == 'OLB':
-        cb_pos_6 = 0
-        de_pos_6 = 0
-        dt_pos_6 = 0
-        fs_pos_6 = 0
-        ilb_pos_6 = 0
-        mlb_pos_6 = 0
-        nt_pos_6 = 0
-        olb_pos_6 = 1
-        ss_pos_6 = 0
-    elif official_position_6 == 'SS':
-        cb_pos_6 = 0
-        de_pos_6 = 0
-        dt_pos_6 = 0
-        fs_pos_6 = 0
-        ilb_pos_6 = 0
-        mlb_pos_6 = 0
-        nt_pos_6 = 0
-        olb_pos_6 = 0
-        ss_pos_6 = 1
-
-    if official_position_7 == 'CB':
-        cb_pos_7 = 1
-        de_pos_7 = 0
-        dt_pos_7 = 0
-        fs_pos_7 = 0
-        ilb_pos_7 = 0
-        mlb_pos_7 = 0
-        nt_pos_7 = 0
-        olb_pos_7 = 0
-        ss_pos_7 = 0
-    elif official_position_7 == 'DE':
-        cb_pos_7 = 0
-        de_pos_7 = 1
-        dt_pos_7 = 0
-        fs_pos_7 = 0
-        ilb_pos_7 = 0
-        mlb_pos_7 = 0
-        nt_pos_7 = 0
-        olb_pos_7 = 0
-        ss_pos_7 = 0
-    elif official_position_7 == 'DT':
-        cb_pos_7 = 0
-        de_pos_7 = 0
-        dt_pos_7 = 1
-        fs_pos_7 = 0
-        ilb_pos_7 = 0
-        mlb_pos_7 = 0
-        nt_pos_7 = 0
-        olb_pos_7 = 0
-        ss_pos_7 = 0
-    elif official_position_7 == 'FS':
-        cb_pos_7 = 0
-        de_pos_7 = 0
-        dt_pos_7 = 0
-        fs_pos_7 = 1
-        ilb_pos_7 = 0
-        mlb_pos_7 = 0
-        nt_pos_7 = 0
-        olb_pos_7 = 0
-        ss_pos_7 = 0
-    elif official_position_7 == 'ILB':
-        cb_pos_7 = 0
-        de_pos_7 = 0
-        dt_pos_7 = 0
-        fs_pos_7 = 0
-        ilb_pos_7 = 1
-        mlb_pos_7 = 0
-        nt_pos_7 = 0
-        olb_pos_7 = 0
-        ss_pos_7 = 0
-    elif official_position_7 == 'MLB':
-        cb_pos_7 = 0
-        de_pos_7 = 0
-        dt_pos_7 = 0
-        fs_pos_7 = 0
-        ilb_pos_7 = 0
-        mlb_pos_7 = 1
-        nt_pos_7 = 0
-        olb_pos_7 = 0
-        ss_pos_7 = 0
-    elif official_position_7 == 'NT':
-        cb_pos_7 = 0
-        de_pos_7 = 0
-        dt_pos_7 = 0
-        fs_pos_7 = 0
-        ilb_pos_7 = 0
-        mlb_pos_7 = 0
-        nt_pos_7 = 1
-        olb_pos_7 = 0
-        ss_pos_7 = 0
-    elif official_position_7 == 'OLB':
-        cb_pos_7 = 0
-        de_pos_7 = 0
-        dt_pos_7 = 0
-        fs_pos_7 = 0
-        ilb_pos_7 = 0
-        mlb_pos_7 = 0
-        nt_pos_7 = 0
-        olb_pos_7 = 1
-        ss_pos_7 = 0
-    elif official_position_7 == 'SS':
-        cb_pos_7 = 0
-        de_pos_7 = 0
-        dt_pos_7 = 0
-        fs_pos_7 = 0
-        ilb_pos_7 = 0
-        mlb_pos_7 = 0
-        nt_pos_7 = 0
-        olb_pos_7 = 0
-        ss_pos_7 = 1
-
-    if official_position_8 == 'CB':
-        cb_pos_8 = 1
-        de_pos_8 = 0
-        dt_pos_8 = 0
-        fs_pos_8 = 0
-        ilb_pos_8 = 0
-        mlb_pos_8 = 0
-        nt_pos_8 = 0
-        olb_pos_8 = 0
-        ss_pos_8 = 0
-    elif official_position_8 == 'DE':
-        cb_pos_8 = 0
-        de_pos_8 = 1
-        dt_pos_8 = 0
-        fs_pos_8 = 0
-        ilb_pos_8 = 0
-        mlb_pos_8 = 0
-        nt_pos_8 = 0
-        olb_pos_8 = 0
-        ss_pos_8 = 0
-    elif official_position_8 == 'DT':
-        cb_pos_8 = 0
-        de_pos_8 = 0
-        dt_pos_8 = 1
-        fs_pos_8 = 0
-        ilb_pos_8 = 0
-        mlb_pos_8 = 0
-        nt_pos_8 = 0
-        olb_pos_8 = 0
-        ss_pos_8 = 0
-    elif official_position_8 == 'FS':
-        cb_pos_8 = 0
-        de_pos_8 = 0
-        dt_pos_8 = 0
-        fs_pos_8 = 1
-        ilb_pos_8 = 0
-        mlb_pos_8 = 0
-        nt_pos_8 = 0
-        olb_pos_8 = 0
-        ss_pos_8 = 0
-    elif official_position_8 == 'ILB':
-        cb_pos_8 = 0
-        de_pos_8 = 0
-        dt_pos_8 = 0
-        fs_pos_8 = 0
-        ilb_pos_8 = 1
-        mlb_pos_8 = 0
-        nt_pos_8 = 0
-        olb_pos_8 = 0
-        ss_pos_8 = 0
-    elif official_position_8 == 'MLB':
-        cb_pos_8 = 0
-        de_pos_8 = 0
-        dt_pos_8 = 0
-        fs_pos_8 = 0
-        ilb_pos_8 = 0
-        mlb_pos_8 = 1
-        nt_pos_8 = 0
-        olb_pos_8 = 0
-        ss_pos_8 = 0
-    elif official_position_8 == 'NT':
-        cb_pos_8 = 0
-        de_pos_8 = 0
-        dt_pos_8 = 0
-        fs_pos_8 = 0
-        ilb_pos_8 = 0
-        mlb_pos_8 = 0
-        nt_pos_8 = 1
-        olb_pos_8 = 0
-        ss_pos_8 = 0
-    elif official_position_8 == 'OLB':
-        cb_pos_8 = 0
-        de_pos_8 = 0
-        dt_pos_8 = 0
-        fs_pos_8 = 0
-        ilb_pos_8 = 0
-        mlb_pos_8 = 0
-        nt_pos_8 = 0
-        olb_pos_8 = 1
-        ss_pos_8 = 0
-    elif official_position_8 == 'SS':
-        cb_pos_8 = 0
-        de_pos_8 = 0
-        dt_pos_8 = 0
-        fs_pos_8 = 0
-        ilb_pos_8 = 0
-        mlb_pos_8 = 0
-        nt_pos_8 = 0
-        olb_pos_8 = 0
-        ss_pos_8 = 1
-
-    if official_position_9 == 'CB':
-        cb_pos_9 = 1
-        de_pos_9 = 0
-        dt_pos_9 = 0
-        fs_pos_9 = 0
-        ilb_pos_9 = 0
-        mlb_pos_9 = 0
-        nt_pos_9 = 0
-        olb_pos_9 = 0
-        ss_pos_9 = 0
-    elif official_position_9 == 'DE':
-        cb_pos_9 = 0
-        de_pos_9 = 1
-        dt_pos_9 = 0
-        fs_pos_9 = 0
-        ilb_pos_9 = 0
-        mlb_pos_9 = 0
-        nt_pos_9 = 0
-        olb_pos_9 = 0
-        ss_pos_9 = 0
-    elif official_position_9 == 'DT':
-        cb_pos_9 = 0
-        de_pos_9 = 0
-        dt_pos_9 = 1
-        fs_pos_9 = 0
-        ilb_pos_9 = 0
-        mlb_pos_9 = 0
-        nt_pos_9 = 0
-        olb_pos_9 = 0
-        ss_pos_9 = 0
-    elif official_position_9 == 'FS':
-        cb_pos_9 = 0
-        de_pos_9 = 0
-        dt_pos_9 = 0
-        fs_pos_9 = 1
-        ilb_pos_9 = 0
-        mlb_pos_9 = 0
-        nt_pos_9 = 0
-        olb_pos_9 = 0
-        ss_pos_9 = 0
-    elif official_position_9 == 'ILB':
-        cb_pos_9 = 0
-        de_pos_9 = 0
-        dt_pos_9 = 0
-        fs_pos_9 = 0
-        ilb_pos_9 = 1
-        mlb_pos_9 = 0
-        nt_pos_9 = 0
-        olb_pos_9 = 0
-        ss_pos_9 = 0
-    elif official_position_9 == 'MLB':
-        cb_pos_9 = 0
-        de_pos_9 = 0
-        dt_pos_9 = 0
-        fs_pos_9 = 0
-        ilb_pos_9 = 0
-        mlb_pos_9 = 1
-        nt_pos_9 = 0
-        olb_pos_9 = 0
-        ss_pos_9 = 0
-    elif official_position_9 == 'NT':
-        cb_pos_9 = 0
-        de_pos_9 = 0
-        dt_pos_9 = 0
-        fs_pos_9 = 0
-        ilb_pos_9 = 0
-        mlb_pos_9 = 0
-        nt_pos_9 = 1
-        olb_pos_9 = 0
-        ss_pos_9 = 0
-    elif official_position_9 == 'OLB':
-        cb_pos_9 = 0
-        de_pos_9 = 0
-        dt_pos_9 = 0
-        fs_pos_9 = 0
-        ilb_pos_9 = 0
-        mlb_pos_9 = 0
-        nt_pos_9 = 0
-        olb_pos_9 = 1
-        ss_pos_9 = 0
-    elif official_position_9 == 'SS':
-        cb_pos_9 = 0
-        de_pos_9 = 0
-        dt_pos_9 = 0
-        fs_pos_9 = 0
-        ilb_pos_9 = 0
-        mlb_pos_9 = 0
-        nt_pos_9 = 0
-        olb_pos_9 = 0
-        ss_pos_9 = 1
-
-    if official_position_10 == 'CB':
-        cb_pos_10 = 1
-        de_pos_10 = 0
-        dt_pos_10 = 0
-        fs_pos_10 = 0
-        ilb_pos_10 = 0
-        mlb_pos_10 = 0
-        nt_pos_10 = 0
-        olb_pos_10 = 0
-        ss_pos_10 = 0
-    elif official_position_10 == 'DE':
-        cb_pos_10 = 0
-        de_pos_10 = 1
-        dt_pos_10 = 0
-        fs_pos_10 = 0
-        ilb_pos_10 = 0
-        mlb_pos_10 = 0
-        nt_pos_10 = 0
-        olb_pos_10 = 0
-        ss_pos_10 = 0
-    elif official_position_10 == 'DT':
-        cb_pos_10 = 0
-        de_pos_10 = 0
-        dt_pos_10 = 1
-        fs_pos_10 = 0
-        ilb_pos_10 = 0
-        mlb_pos_10 = 0
-        nt_pos_10 = 0
-        olb_pos_10 = 0
-        ss_pos_10 = 0
-    elif official_position_10 == 'FS':
-        cb_pos_10 = 0
-        de_pos_10 = 0
-        dt_pos_10 = 0
-        fs_pos_10 = 1
-        ilb_pos_10 = 0
-        mlb_pos_10 = 0
-        nt_pos_10 = 0
-        olb_pos_10 = 0
-        ss_pos_10 = 0
-    elif official_position_10 == 'ILB':
-        cb_pos_10 = 0
-        de_pos_10 = 0
-        dt_pos_10 = 0
-        fs_pos_10 = 0
-        ilb_pos_10 = 1
-        mlb_pos_10 = 0
-        nt_pos_10 = 0
-        olb_pos_10 = 0
-        ss_pos_10 = 0
-    elif official_position_10 == 'MLB':
-        cb_pos_10 = 0
-        de_pos_10 = 0
-        dt_pos_10 = 0
-        fs_pos_10 = 0
-        ilb_pos_10 = 0
-        mlb_pos_10 = 1
-        nt_pos_10 = 0
-        olb_pos_10 = 0
-        ss_pos_10 = 0
-    elif official_position_10 == 'NT':
-        cb_pos_10 = 0
-        de_pos_10 = 0
-        dt_pos_10 = 0
-        fs_pos_10 = 0
-        ilb_pos_10 = 0
-        mlb_pos_10 = 0
-        nt_pos_10 = 1
-        olb_pos_10 = 0
-        ss_pos_10 = 0
-    elif official_position_10 == 'OLB':
-        cb_pos_10 = 0
-        de_pos_10 = 0
-        dt_pos_10 = 0
-        fs_pos_10 = 0
-        ilb_pos_10 = 0
-        mlb_pos_10 = 0
-        nt_pos_10 = 0
-        olb_pos_10 = 1
-        ss_pos_10 = 0
-    elif official_position_10 == 'SS':
-        cb_pos_10 = 0
-        de_pos_10 = 0
-        dt_pos_10 = 0
-        fs_pos_10 = 0
-        ilb_pos_10 = 0
-        mlb_pos_10 = 0
-        nt_pos_10 = 0
-        olb_pos_10 = 0
-        ss_pos_10 = 1
-
-    if official_position_11 == 'CB':
-        cb_pos_11 = 1
-        de_pos_11 = 0
-        dt_pos_11 = 0
-        fs_pos_11 = 0
-        ilb_pos_11 = 0
-        mlb_pos_11 = 0
-        nt_pos_11 = 0
-        olb_pos_11 = 0
-        ss_pos_11 = 0
-    elif official_position_11 == 'DE':
-        cb_pos_11 = 0
-        de_pos_11 = 1
-        dt_pos_11 = 0
-        fs_pos_11 = 0
-        ilb_pos_11 = 0
-        mlb_pos_11 = 0
-        nt_pos_11 = 0
-        olb_pos_11 = 0
-        ss_pos_11 = 0
-    elif official_position_11 == 'DT':
-        cb_pos_11 = 0
-        de_pos_11 = 0
-        dt_pos_11 = 1
-        fs_pos_11 = 0
-        ilb_pos_11 = 0
-        mlb_pos_11 = 0
-        nt_pos_11 = 0
-        olb_pos_11 = 0
-        ss_pos_11 = 0
-    elif official_position_11 == 'FS':
-        cb_pos_11 = 0
-        de_pos_11 = 0
-        dt_pos_11 = 0
-        fs_pos_11 = 1
-        ilb_pos_11 = 0
-        mlb_pos_11 = 0
-        nt_pos_11 = 0
-        olb_pos_11 = 0
-        ss_pos_11 = 0
-    elif official_position_11 == 'ILB':
-        cb_pos_11 = 0
-        de_pos_11 = 0
-        dt_pos_11 = 0
-        fs_pos_11 = 0
-        ilb_pos_11 = 1
-        mlb_pos_11 = 0
-        nt_pos_11 = 0
-        olb_pos_11 = 0
-        ss_pos_11 = 0
-    elif official_position_11 == 'MLB':
-        cb_pos_11 = 0
-        de_pos_11 = 0
-        dt_pos_11 = 0
-        fs_pos_11 = 0
-        ilb_pos_11 = 0
-        mlb_pos_11 = 1
-        nt_pos_11 = 0
-        olb_pos_11 = 0
-        ss_pos_11 = 0
-    elif official_position_11 == 'NT':
-        cb_pos_11 = 0
-        de_pos_11 = 0
-        dt_pos_11 = 0
-        fs_pos_11 = 0
-        ilb_pos_11 = 0
-        mlb_pos_11 = 0
-        nt_pos_11 = 1
-        olb_pos_11 = 0
-        ss_pos_11 = 0
-    elif official_position_11 == 'OLB':
-        cb_pos_11 = 0
-        de_pos_11 = 0
-        dt_pos_11 = 0
-        fs_pos_11 = 0
-        ilb_pos_11 = 0
-        mlb_pos_11 = 0
-        nt_pos_11 = 0
-        olb_pos_11 = 1
-        ss_pos_11 = 0
-    elif official_position_11 == 'SS':
-        cb_pos_11 = 0
-        de_pos_11 = 0
-        dt_pos_11 = 0
-        fs_pos_11 = 0
-        ilb_pos_11 = 0
-        mlb_pos_11 = 0
-        nt_pos_11 = 0
-        olb_pos_11 = 0
-        ss_pos_11 = 1
-    
-
-# DEFENSIVE TECHNIQUE to REL Y CONVERSION 
-# '1', '2i', '2', '3', '4i', '4', '5', '6i', '6', '7/9', 'Wide 7/9' ,'Slot', 'Wide'
-
-    if tech_1 == '0':
-        rel_y_1 = 0
-    elif tech_1 == '1':
-        if LR_1 == 'L':
-            rel_y_1 = 0.2
-        else:
-            rel_y_1 = -0.2
-    elif tech_1 == '2i':
-        if LR_1 == 'L':
-            rel_y_1 = 0.8
-        else:
-            rel_y_1 = -0.8
-    elif tech_1 == '2':
-        if LR_1 == 'L':
-            rel_y_1 = 1
-        else:
-            rel_y_1 = -1
-    elif tech_1 == '3':
-        if LR_1 == 'L':
-            rel_y_1 = 1.2
-        else:
-            rel_y_1 = -1.2
-    elif tech_1 == '4i':
-        if LR_1 == 'L':
-            rel_y_1 = 1.8
-        else:
-            rel_y_1 = -1.8
-    elif tech_1 == '4':
-        if LR_1 == 'L':
-            rel_y_1 = 2
-        else:
-            rel_y_1 = -2
-    elif tech_1 == '5':
-        if LR_1 == 'L':
-            rel_y_1 = 2.2
-        else:
-            rel_y_1 = -2.2
-    elif tech_1 == '6i':
-        if LR_1 == 'L':
-            rel_y_1 = 2.8
-        else:
-            rel_y_1 = -2.8
-    elif tech_1 == '6':
-        if LR_1 == 'L':
-            rel_y_1 = 3
-        else:
-            rel_y_1 = -3
-    elif tech_1 == '7/9':
-        if LR_1 == 'L':
-            rel_y_1 = 3.2
-        else:
-            rel_y_1 = -3.2
-    elif tech_1 == 'Wide 7/9':
-        if LR_1 == 'L':
-            rel_y_1 = 4
-        else:
-            rel_y_1 = -4
-    elif tech_1 == 'Slot':
-        if LR_1 == 'L':
-            rel_y_1 = 10
-        else:
-            rel_y_1 = -10
-    elif tech_1 == 'Wide':
-        if LR_1 == 'L':
-            rel_y_1 = 20
-        else:
-            rel_y_1 = -20
-    else:
-        rel_y_1 = 26
-
-# Player 2    
-    if tech_2 == '0':
-        rel_y_2 = 0
-    elif tech_2 == '1':
-        if LR_2 == 'L':
-            rel_y_2 = 0.2
-        else:
-            rel_y_2 = -0.2
-    elif tech_2 == '2i':
-        if LR_2 == 'L':
-            rel_y_2 = 0.8
-        else:
-            rel_y_2 = -0.8
-    elif tech_2 == '2':
-        if LR_2 == 'L':
-            rel_y_2 = 1
-        else:
-            rel_y_2 = -1
-    elif tech_2 == '3':
-        if LR_2 == 'L':
-            rel_y_2 = 1.2
-        else:
-            rel_y_2 = -1.2
-    elif tech_2 == '4i':
-        if LR_2 == 'L':
-            rel_y_2 = 1.8
-        else:
-            rel_y_2 = -1.8
-    elif tech_2 == '4':
-        if LR_2 == 'L':
-            rel_y_2 = 2
-        else:
-            rel_y_2 = -2
-    elif tech_2 == '5':
-        if LR_2 == 'L':
-            rel_y_2 = 2.2
-        else:
-            rel_y_2 = -2.2
-    elif tech_2 == '6i':
-        if LR_2 == 'L':
-            rel_y_2 = 2.8
-        else:
-            rel_y_2 = -2.8
-    elif tech_2 == '6':
-        if LR_2 == 'L':
-            rel_y_2 = 3
-        else:
-            rel_y_2 = -3
-    elif tech_2 == '7/9':
-        if LR_2 == 'L':
-            rel_y_2 = 3.2
-        else:
-            rel_y_2 = -3.2
-    elif tech_2 == 'Wide 7/9':
-        if LR_2 == 'L':
-            rel_y_2 = 4
-        else:
-            rel_y_2 = -4
-    elif tech_2 == 'Slot':
-        if LR_2 == 'L':
-            rel_y_2 = 10
-        else:
-            rel_y_2 = -10
-    elif tech_2 == 'Wide':
-        if LR_2 == 'L':
-            rel_y_2 = 20
-        else:
-            rel_y_2 = -20
-    else:
-        rel_y_2 = 26
-
-# Player 3    
-    if tech_3 == '0':
-        rel_y_3 = 0
-    elif tech_3 == '1':
-        if LR_3 == 'L':
-            rel_y_3 = 0.2
-        else:
-            rel_y_3 = -0.2
-    elif tech_3 == '2i':
-        if LR_3 == 'L':
-            rel_y_3 = 0.8
-        else:
-            rel_y_3 = -0.8
-    elif tech_3 == '2':
-        if LR_3 == 'L':
-            rel_y_3 = 1
-        else:
-            rel_y_3 = -1
-    elif tech_3 == '3':
-        if LR_3 == 'L':
-            rel_y_3 = 1.2
-        else:
-            rel_y_3 = -1.2
-    elif tech_3 == '4i':
-        if LR_3 == 'L':
-            rel_y_3 = 1.8
-        else:
-            rel_y_3 = -1.8
-    elif tech_3 == '4':
-        if LR_3 == 'L':
-            rel_y_3 = 2
-        else:
-            rel_y_3 = -2
-    elif tech_3 == '5':
-        if LR_3 == 'L':
-            rel_y_3 = 2.2
-        else:
-            rel_y_3 = -2.2
-    elif tech_3 == '6i':
-        if LR_3 == 'L':
-            rel_y_3 = 2.8
-        else:
-            rel_y_3 = -2.8
-    elif tech_3 == '6':
-        if LR_3 == 'L':
-            rel_y_3 = 3
-        else:
-            rel_y_3 = -3
-    elif tech_3 == '7/9':
-        if LR_3 == 'L':
-            rel_y_3 = 3.2
-        else:
-            rel_y_3 = -3.2
-    elif tech_3 == 'Wide 7/9':
-        if LR_3 == 'L':
-            rel_y_3 = 4
-        else:
-            rel_y_3 = -4
-    elif tech_3 == 'Slot':
-        if LR_3 == 'L':
-            rel_y_3 = 10
-        else:
-            rel_y_3 = -10
-    elif tech_3 == 'Wide':
-        if LR_3 == 'L':
-            rel_y_3 = 20
-        else:
-            rel_y_3 = -20
-    else:
-        rel_y_3 = 26
-
-
-# Player 4    
-    if tech_4 == '0':
-        rel_y_4 = 0
-    elif tech_4 == '1':
-        if LR_4 == 'L':
-            rel_y_4 = 0.2
-        else:
-            rel_y_4 = -0.2
-    elif tech_4 == '2i':
-        if LR_4 == 'L':
-            rel_y_4 = 0.8
-        else:
-            rel_y_4 = -0.8
-    elif tech_4 == '2':
-        if LR_4 == 'L':
-            rel_y_4 = 1
-        else:
-            rel_y_4 = -1
-    elif tech_4 == '3':
-        if LR_4 == 'L':
-            rel_y_4 = 1.2
-        else:
-            rel_y_4 = -1.2
-    elif tech_4 == '4i':
-        if LR_4 == 'L':
-            rel_y_4 = 1.8
-        else:
-            rel_y_4 = -1.8
-    elif tech_4 == '4':
-        if LR_4 == 'L':
-            rel_y_4 = 2
-        else:
-            rel_y_4 = -2
-    elif tech_4 == '5':
-        if LR_4 == 'L':
-            rel_y_4 = 2.2
-        else:
-            rel_y_4 = -2.2
-    elif tech_4 == '6i':
-        if LR_4 == 'L':
-            rel_y_4 = 2.8
-        else:
-            rel_y_4 = -2.8
-    elif tech_4 == '6':
-        if LR_4 == 'L':
-            rel_y_4 = 3
-        else:
-            rel_y_4 = -3
-    elif tech_4 == '7/9':
-        if LR_4 == 'L':
-            rel_y_4 = 3.2
-        else:
-            rel_y_4 = -3.2
-    elif tech_4 == 'Wide 7/9':
-        if LR_4 == 'L':
-            rel_y_4 = 4
-        else:
-            rel_y_4 = -4
-    elif tech_4 == 'Slot':
-        if LR_4 == 'L':
-            rel_y_4 = 10
-        else:
-            rel_y_4 = -10
-    elif tech_4 == 'Wide':
-        if LR_4 == 'L':
-            rel_y_4 = 20
-        else:
-            rel_y_4 = -20
-    else:
-        rel_y_4 = 26
-
-
-# Player 5    
-    if tech_5 == '0':
-        rel_y_5 = 0
-    elif tech_5 == '1':
-        if LR_5 == 'L':
-            rel_y_5 = 0.2
-        else:
-            rel_y_5 = -0.2
-    elif tech_5 == '2i':
-        if LR_5 == 'L':
-            rel_y_5 = 0.8
-        else:
-            rel_y_5 = -0.8
-    elif tech_5 == '2':
-        if LR_5 == 'L':
-            rel_y_5 = 1
-        else:
-            rel_y_5 = -1
-    elif tech_5 == '3':
-        if LR_5 == 'L':
-            rel_y_5 = 1.2
-        else:
-            rel_y_5 = -1.2
-    elif tech_5 == '4i':
-        if LR_5 == 'L':
-            rel_y_5 = 1.8
-        else:
-            rel_y_5 = -1.8
-    elif tech_5 == '4':
-        if LR_5 == 'L':
-            rel_y_5 = 2
-        else:
-            rel_y_5 = -2
-    elif tech_5 == '5':
-        if LR_5 == 'L':
-            rel_y_5 = 2.2
-        else:
-            rel_y_5 = -2.2
-    elif tech_5 == '6i':
-        if LR_5 == 'L':
-            rel_y_5 = 2.8
-        else:
-            rel_y_5 = -2.8
-    elif tech_5 == '6':
-        if LR_5 == 'L':
-            rel_y_5 = 3
-        else:
-            rel_y_5 = -3
-    elif tech_5 == '7/9':
-        if LR_5 == 'L':
-            rel_y_5 = 3.2
-        else:
-            rel_y_5 = -3.2
-    elif tech_5 == 'Wide 7/9':
-        if LR_5 == 'L':
-            rel_y_5 = 4
-        else:
-            rel_y_5 = -4
-    elif tech_5 == 'Slot':
-        if LR_5 == 'L':
-            rel_y_5 = 10
-        else:
-            rel_y_5 = -10
-    elif tech_5 == 'Wide':
-        if LR_5 == 'L':
-            rel_y_5 = 20
-        else:
-            rel_y_5 = -20
-    else:
-        rel_y_5 = 26
-
-
-# Player 6    
-    if tech_6 == '0':
-        rel_y_6 = 0
-    elif tech_6 == '1':
-        if LR_6 == 'L':
-            rel_y_6 = 0.2
-        else:
-            rel_y_6 = -0.2
-    elif tech_6 == '2i':
-        if LR_6 == 'L':
-            rel_y_6 = 0.8
-        else:
-            rel_y_6 = -0.8
-    elif tech_6 == '2':
-        if LR_6 == 'L':
-            rel_y_6 = 1
-        else:
-            rel_y_6 = -1
-    elif tech_6 == '3':
-        if LR_6 == 'L':
-            rel_y_6 = 1.2
-        else:
-            rel_y_6 = -1.2
-    elif tech_6 == '4i':
-        if LR_6 == 'L':
-            rel_y_6 = 1.8
-        else:
-            rel_y_6 = -1.8
-    elif tech_6 == '4':
-        if LR_6 == 'L':
-            rel_y_6 = 2
-        else:
-            rel_y_6 = -2
-    elif tech_6 == '5':
-        if LR_6 == 'L':
-            rel_y_6 = 2.2
-        else:
-            rel_y_6 = -2.2
-    elif tech_6 == '6i':
-        if LR_6 == 'L':
-            rel_y_6 = 2.8
-        else:
-            rel_y_6 = -2.8
-    elif tech_6 == '6':
-        if LR_6 == 'L':
-            rel_y_6 = 3
-        else:
-            rel_y_6 = -3
-    elif tech_6 == '7/9':
-        if LR_6 == 'L':
-            rel_y_6 = 3.2
-        else:
-            rel_y_6 = -3.2
-    elif tech_6 == 'Wide 7/9':
-        if LR_6 == 'L':
-            rel_y_6 = 4
-        else:
-            rel_y_6 = -4
-    elif tech_6 == 'Slot':
-        if LR_6 == 'L':
-            rel_y_6 = 10
-        else:
-            rel_y_6 = -10
-    elif tech_6 == 'Wide':
-        if LR_6 == 'L':
-            rel_y_6 = 20
-        else:
-            rel_y_6 = -20
-    else:
-        rel_y_6 = 26
-
-# Player 7    
-    if tech_7 == '0':
-        rel_y_7 = 0
-    elif tech_7 == '1':
-        if LR_7 == 'L':
-            rel_y_7 = 0.2
-        else:
-            rel_y_7 = -0.2
-    elif tech_7 == '2i':
-        if LR_7 == 'L':
-            rel_y_7 = 0.8
-        else:
-            rel_y_7 = -0.8
-    elif tech_7 == '2':
-        if LR_7 == 'L':
-            rel_y_7 = 1
-        else:
-            rel_y_7 = -1
-    elif tech_7 == '3':
-        if LR_7 == 'L':
-            rel_y_7 = 1.2
-        else:
-            rel_y_7 = -1.2
-    elif tech_7 == '4i':
-        if LR_7 == 'L':
-            rel_y_7 = 1.8
-        else:
-            rel_y_7 = -1.8
-    elif tech_7 == '4':
-        if LR_7 == 'L':
-            rel_y_7 = 2
-        else:
-            rel_y_7 = -2
-    elif tech_7 == '5':
-        if LR_7 == 'L':
-            rel_y_7 = 2.2
-        else:
-            rel_y_7 = -2.2
-    elif tech_7 == '6i':
-        if LR_7 == 'L':
-            rel_y_7 = 2.8
-        else:
-            rel_y_7 = -2.8
-    elif tech_7 == '6':
-        if LR_7 == 'L':
-            rel_y_7 = 3
-        else:
-            rel_y_7 = -3
-    elif tech_7 == '7/9':
-        if LR_7 == 'L':
-            rel_y_7 = 3.2
-        else:
-            rel_y_7 = -3.2
-    elif tech_7 == 'Wide 7/9':
-        if LR_7 == 'L':
-            rel_y_7 = 4
-        else:
-            rel_y_7 = -4
-    elif tech_7 == 'Slot':
-        if LR_7 == 'L':
-            rel_y_7 = 10
-        else:
-            rel_y_7 = -10
-    elif tech_7 == 'Wide':
-        if LR_7 == 'L':
-            rel_y_7 = 20
-        else:
-            rel_y_7 = -20
-    else:
-        rel_y_7 = 26
-
-# Player 8    
-    if tech_8 == '0':
-        rel_y_8 = 0
-    elif tech_8 == '1':
-        if LR_8 == 'L':
-            rel_y_8 = 0.2
-        else:
-            rel_y_8 = -0.2
-    elif tech_8 == '2i':
-        if LR_8 == 'L':
-            rel_y_8 = 0.8
-        else:
-            rel_y_8 = -0.8
-    elif tech_8 == '2':
-        if LR_8 == 'L':
-            rel_y_8 = 1
-        else:
-            rel_y_8 = -1
-    elif tech_8 == '3':
-        if LR_8 == 'L':
-            rel_y_8 = 1.2
-        else:
-            rel_y_8 = -1.2
-    elif tech_8 == '4i':
-        if LR_8 == 'L':
-            rel_y_8 = 1.8
-        else:
-            rel_y_8 = -1.8
-    elif tech_8 == '4':
-        if LR_8 == 'L':
-            rel_y_8 = 2
-        else:
-            rel_y_8 = -2
-    elif tech_8 == '5':
-        if LR_8 == 'L':
-            rel_y_8 = 2.2
-        else:
-            rel_y_8 = -2.2
-    elif tech_8 == '6i':
-        if LR_8 == 'L':
-            rel_y_8 = 2.8
-        else:
-            rel_y_8 = -2.8
-    elif tech_8 == '6':
-        if LR_8 == 'L':
-            rel_y_8 = 3
-        else:
-            rel_y_8 = -3
-    elif tech_8 == '7/9':
-        if LR_8 == 'L':
-            rel_y_8 = 3.2
-        else:
-            rel_y_8 = -3.2
-    elif tech_8 == 'Wide 7/9':
-        if LR_8 == 'L':
-            rel_y_8 = 4
-        else:
-            rel_y_8 = -4
-    elif tech_8 == 'Slot':
-        if LR_8 == 'L':
-            rel_y_8 = 10
-        else:
-            rel_y_8 = -10
-    elif tech_8 == 'Wide':
-        if LR_8 == 'L':
-            rel_y_8 = 20
-        else:
-            rel_y_8 = -20
-    else:
-        rel_y_8 = 26
-
-# Player 9    
-    if tech_9 == '0':
-        rel_y_9 = 0
-    elif tech_9 == '1':
-        if LR_9 == 'L':
-            rel_y_9 = 0.2
-        else:
-            rel_y_9 = -0.2
-    elif tech_9 == '2i':
-        if LR_9 == 'L':
-            rel_y_9 = 0.8
-        else:
-            rel_y_9 = -0.8
-    elif tech_9 == '2':
-        if LR_9 == 'L':
-            rel_y_9 = 1
-        else:
-            rel_y_9 = -1
-    elif tech_9 == '3':
-        if LR_9 == 'L':
-            rel_y_9 = 1.2
-        else:
-            rel_y_9 = -1.2
-    elif tech_9 == '4i':
-        if LR_9 == 'L':
-            rel_y_9 = 1.8
-        else:
-            rel_y_9 = -1.8
-    elif tech_9 == '4':
-        if LR_9 == 'L':
-            rel_y_9 = 2
-        else:
-            rel_y_9 = -2
-    elif tech_9 == '5':
-        if LR_9 == 'L':
-            rel_y_9 = 2.2
-        else:
-            rel_y_9 = -2.2
-    elif tech_9 == '6i':
-        if LR_9 == 'L':
-            rel_y_9 = 2.8
-        else:
-            rel_y_9 = -2.8
-    elif tech_9 == '6':
-        if LR_9 == 'L':
-            rel_y_9 = 3
-        else:
-            rel_y_9 = -3
-    elif tech_9 == '7/9':
-        if LR_9 == 'L':
-            rel_y_9 = 3.2
-        else:
-            rel_y_9 = -3.2
-    elif tech_9 == 'Wide 7/9':
-        if LR_9 == 'L':
-            rel_y_9 = 4
-        else:
-            rel_y_9 = -4
-    elif tech_9 == 'Slot':
-        if LR_9 == 'L':
-            rel_y_9 = 10
-        else:
-            rel_y_9 = -10
-    elif tech_9 == 'Wide':
-        if LR_9 == 'L':
-            rel_y_9 = 20
-        else:
-            rel_y_9 = -20
-    else:
-        rel_y_9 = 26
-
-# Player 10    
-    if tech_10 == '0':
-        rel_y_10 = 0
-    elif tech_10 == '1':
-        if LR_10 == 'L':
-            rel_y_10 = 0.2
-        else:
-            rel_y_10 = -0.2
-    elif tech_10 == '2i':
-        if LR_10 == 'L':
-            rel_y_10 = 0.8
-        else:
-            rel_y_10 = -0.8
-    elif tech_10 == '2':
-        if LR_10 == 'L':
-            rel_y_10 = 1
-        else:
-            rel_y_10 = -1
-    elif tech_10 == '3':
-        if LR_10 == 'L':
-            rel_y_10 = 1.2
-        else:
-            rel_y_10 = -1.2
-    elif tech_10 == '4i':
-        if LR_10 == 'L':
-            rel_y_10 = 1.8
-        else:
-            rel_y_10 = -1.8
-    elif tech_10 == '4':
-        if LR_10 == 'L':
-            rel_y_10 = 2
-        else:
-            rel_y_10 = -2
-    elif tech_10 == '5':
-        if LR_10 == 'L':
-            rel_y_10 = 2.2
-        else:
-            rel_y_10 = -2.2
-    elif tech_10 == '6i':
-        if LR_10 == 'L':
-            rel_y_10 = 2.8
-        else:
-            rel_y_10 = -2.8
-    elif tech_10 == '6':
-        if LR_10 == 'L':
-            rel_y_10 = 3
-        else:
-            rel_y_10 = -3
-    elif tech_10 == '7/9':
-        if LR_10 == 'L':
-            rel_y_10 = 3.2
-        else:
-            rel_y_10 = -3.2
-    elif tech_10 == 'Wide 7/9':
-        if LR_10 == 'L':
-            rel_y_10 = 4
-        else:
-            rel_y_10 = -4
-    elif tech_10 == 'Slot':
-        if LR_10 == 'L':
-            rel_y_10 = 10
-        else:
-            rel_y_10 = -10
-    elif tech_10 == 'Wide':
-        if LR_10 == 'L':
-            rel_y_10 = 20
-        else:
-            rel_y_10 = -20
-    else:
-        rel_y_10 = 26
-
-# Player 11    
-    if tech_11 == '0':
-        rel_y_11 = 0
-    elif tech_11 == '1':
-        if LR_11 == 'L':
-            rel_y_11 = 0.2
-        else:
-            rel_y_11 = -0.2
-    elif tech_11 == '2i':
-        if LR_11 == 'L':
-            rel_y_11 = 0.8
-        else:
-            rel_y_11 = -0.8
-    elif tech_11 == '2':
-        if LR_11 == 'L':
-            rel_y_11 = 1
-        else:
-            rel_y_11 = -1
-    elif tech_11 == '3':
-        if LR_11 == 'L':
-            rel_y_11 = 1.2
-        else:
-            rel_y_11 = -1.2
-    elif tech_11 == '4i':
-        if LR_11 == 'L':
-            rel_y_11 = 1.8
-        else:
-            rel_y_11 = -1.8
-    elif tech_11 == '4':
-        if LR_11 == 'L':
-            rel_y_11 = 2
-        else:
-            rel_y_11 = -2
-    elif tech_11 == '5':
-        if LR_11 == 'L':
-            rel_y_11 = 2.2
-        else:
-            rel_y_11 = -2.2
-    elif tech_11 == '6i':
-        if LR_11 == 'L':
-            rel_y_11 = 2.8
-        else:
-            rel_y_11 = -2.8
-    elif tech_11 == '6':
-        if LR_11 == 'L':
-            rel_y_11 = 3
-        else:
-            rel_y_11 = -3
-    elif tech_11 == '7/9':
-        if LR_11 == 'L':
-            rel_y_11 = 3.2
-        else:
-            rel_y_11 = -3.2
-    elif tech_11 == 'Wide 7/9':
-        if LR_11 == 'L':
-            rel_y_11 = 4
-        else:
-            rel_y_11 = -4
-    elif tech_11 == 'Slot':
-        if LR_11 == 'L':
-            rel_y_11 = 10
-        else:
-            rel_y_11 = -10
-    elif tech_11 == 'Wide':
-        if LR_11 == 'L':
-            rel_y_11 = 20
-        else:
-            rel_y_11 = -20
-    else:
-        rel_y_11 = 26
-
-    if offenseFormation == "Empty":
-        empty_form = 1
-        shotgun_form = 0
-        iform_form = 0
-        jumbo_form = 0
-        pistol_form = 0
-        singleback_form = 0
-        other_form = 0
-        qb_dist_from_ball = 5
-        qb_rel_x = -5
-        qb_rel_y = 0
-        dist_from_qb_1 = np.sqrt(np.square(rel_x_1 + 5)  + np.square(rel_y_1 - 0))
-        dist_from_qb_2 = np.sqrt(np.square(rel_x_2 + 5)  + np.square(rel_y_2 - 0))
-        dist_from_qb_3 = np.sqrt(np.square(rel_x_3 + 5)  + np.square(rel_y_3 - 0))
-        dist_from_qb_4 = np.sqrt(np.square(rel_x_4 + 5)  + np.square(rel_y_4 - 0))
-        dist_from_qb_5 = np.sqrt(np.square(rel_x_5 + 5)  + np.square(rel_y_5 - 0))
-        dist_from_qb_6 = np.sqrt(np.square(rel_x_6 + 5)  + np.square(rel_y_6 - 0))
-        dist_from_qb_7 = np.sqrt(np.square(rel_x_7 + 5)  + np.square(rel_y_7 - 0))
-        dist_from_qb_8 = np.sqrt(np.square(rel_x_8 + 5)  + np.square(rel_y_8 - 0))
-        dist_from_qb_9 = np.sqrt(np.square(rel_x_9 + 5)  + np.square(rel_y_9 - 0))
-        dist_from_qb_10 = np.sqrt(np.square(rel_x_10 + 5)  + np.square(rel_y_10 - 0))
-        dist_from_qb_11 = np.sqrt(np.square(rel_x_11 + 5)  + np.square(rel_y_11 - 0))
-        off_data = [["O", official_position_1, 0, 0, 0, 0.4, 'O'], # C 
-            ["O", official_position_2, 0, -1, 0, 0.4, 'O'], # LG
-            ["O", official_position_3, 0, -2, 0, 0.4, 'O'], # LT
-            ["O", official_position_4, 0, 1, 0, 0.4, 'O'], # RG
-            ["O", official_position_4, 0, 2, 0, 0.4, 'O'], # RT
-            ["O", official_position_4, -0.75, 3, 0, 0.4, 'O'], #TE-R
-            ["O", official_position_4, -5, 0, 0, 0.4, 'O'], # QB
-            ["O", official_position_4, -1, -7, 0, 0.4, 'O'], # RB-L / SLiWR
-            ["O", official_position_4, 0, 20, 0, 0.4, 'O'], # OR-WR
-            ["O", official_position_4, 0, -20, 0, 0.4, 'O'], # OL_WR
-            ["O", official_position_4, -1, -10, 0, 0.4, 'O'] # SL-WR
-        ]
-    elif offenseFormation == 'Shotgun':
-        empty_form = 0
-        shotgun_form = 1
-        iform_form = 0
-        jumbo_form = 0
-        pistol_form = 0
-        singleback_form = 0
-        other_form = 0
-        qb_dist_from_ball = 5 
-        qb_rel_x = -5
-        qb_rel_y = 0
-        dist_from_qb_1 = np.sqrt(np.square(rel_x_1 + 5)  + np.square(rel_y_1 - 0))
-        dist_from_qb_2 = np.sqrt(np.square(rel_x_2 + 5)  + np.square(rel_y_2 - 0))
-        dist_from_qb_3 = np.sqrt(np.square(rel_x_3 + 5)  + np.square(rel_y_3 - 0))
-        dist_from_qb_4 = np.sqrt(np.square(rel_x_4 + 5)  + np.square(rel_y_4 - 0))
-        dist_from_qb_5 = np.sqrt(np.square(rel_x_5 + 5)  + np.square(rel_y_5 - 0))
-        dist_from_qb_6 = np.sqrt(np.square(rel_x_6 + 5)  + np.square(rel_y_6 - 0))
-        dist_from_qb_7 = np.sqrt(np.square(rel_x_7 + 5)  + np.square(rel_y_7 - 0))
-        dist_from_qb_8 = np.sqrt(np.square(rel_x_8 + 5)  + np.square(rel_y_8 - 0))
-        dist_from_qb_9 = np.sqrt(np.square(rel_x_9 + 5)  + np.square(rel_y_9 - 0))
-        dist_from_qb_10 = np.sqrt(np.square(rel_x_10 + 5)  + np.square(rel_y_10 - 0))
-        dist_from_qb_11 = np.sqrt(np.square(rel_x_11 + 5)  + np.square(rel_y_11 - 0))
-        off_data = [["O", official_position_1, 0, 0, 0, 0.4, 'O'], # C 
-            ["O", official_position_2, 0, -1, 0, 0.4, 'O'], # LG
-            ["O", official_position_3, 0, -2, 0, 0.4, 'O'], # LT
-            ["O", official_position_4, 0, 1, 0, 0.4, 'O'], # RG
-            ["O", official_position_4, 0, 2, 0, 0.4, 'O'], # RT
-            ["O", official_position_4, -0.75, 3, 0, 0.4, 'O'], #TE-R
-            ["O", official_position_4, -5, 0, 0, 0.4, 'O'], # QB
-            ["O", official_position_4, -5, -1, 0, 0.4, 'O'], # RB-L
-            ["O", official_position_4, 0, 20, 0, 0.4, 'O'], # OR-WR
-            ["O", official_position_4, 0, -20, 0, 0.4, 'O'], # OL_WR
-            ["O", official_position_4, -1, -10, 0, 0.4, 'O'] # SL-WR
-        ]
-    elif offenseFormation == 'I Formation':
-        empty_form = 0
-        shotgun_form = 0
-        iform_form = 1
-        jumbo_form = 0
-        pistol_form = 0
-        singleback_form = 0
-        other_form = 0
-        qb_dist_from_ball = 1.5
-        qb_rel_x = -1.5
-        qb_rel_y = 0
-        dist_from_qb_1 = np.sqrt(np.square(rel_x_1 + 1.5)  + np.square(rel_y_1 - 0))
-        dist_from_qb_2 = np.sqrt(np.square(rel_x_2 + 1.5)  + np.square(rel_y_2 - 0))
-        dist_from_qb_3 = np.sqrt(np.square(rel_x_3 + 1.5)  + np.square(rel_y_3 - 0))
-        dist_from_qb_4 = np.sqrt(np.square(rel_x_4 + 1.5)  + np.square(rel_y_4 - 0))
-        dist_from_qb_5 = np.sqrt(np.square(rel_x_5 + 1.5)  + np.square(rel_y_5 - 0))
-        dist_from_qb_6 = np.sqrt(np.square(rel_x_6 + 1.5)  + np.square(rel_y_6 - 0))
-        dist_from_qb_7 = np.sqrt(np.square(rel_x_7 + 1.5)  + np.square(rel_y_7 - 0))
-        dist_from_qb_8 = np.sqrt(np.square(rel_x_8 + 1.5)  + np.square(rel_y_8 - 0))
-        dist_from_qb_9 = np.sqrt(np.square(rel_x_9 + 1.5)  + np.square(rel_y_9 - 0))
-        dist_from_qb_10 = np.sqrt(np.square(rel_x_10 + 1.5)  + np.square(rel_y_10 - 0))
-        dist_from_qb_11 = np.sqrt(np.square(rel_x_11 + 1.5)  + np.square(rel_y_11 - 0))
-        off_data = [["O", official_position_1, 0, 0, 0, 0.4, 'O'], # C 
-            ["O", official_position_2, 0, -1, 0, 0.4, 'O'], # LG
-            ["O", official_position_3, 0, -2, 0, 0.4, 'O'], # LT
-            ["O", official_position_4, 0, 1, 0, 0.4, 'O'], # RG
-            ["O", official_position_4, 0, 2, 0, 0.4, 'O'], # RT
-            ["O", official_position_4, -0.75, 3, 0, 0.4, 'O'], #TE-R
-            ["O", official_position_4, -1, 0, 0, 0.4, 'O'], # QB
-            ["O", official_position_4, -7, 0, 0, 0.4, 'O'], # RB
-            ["O", official_position_4, 0, 20, 0, 0.4, 'O'], # OR-WR
-            ["O", official_position_4, 0, -20, 0, 0.4, 'O'], # OL_WR
-            ["O", official_position_4, -3, 0, 0, 0.4, 'O'] # FB
-        ]
-    elif offenseFormation == 'Jumbo':
-        empty_form = 0
-        shotgun_form = 0
-        iform_form = 0
-        jumbo_form = 1
-        pistol_form = 0
-        singleback_form = 0
-        other_form = 0
-        qb_dist_from_ball = 1.5
-        qb_rel_x = -1.5
-        qb_rel_y = 0
-        dist_from_qb_1 = np.sqrt(np.square(rel_x_1 + 1.5)  + np.square(rel_y_1 - 0))
-        dist_from_qb_2 = np.sqrt(np.square(rel_x_2 + 1.5)  + np.square(rel_y_2 - 0))
-        dist_from_qb_3 = np.sqrt(np.square(rel_x_3 + 1.5)  + np.square(rel_y_3 - 0))
-        dist_from_qb_4 = np.sqrt(np.square(rel_x_4 + 1.5)  + np.square(rel_y_4 - 0))
-        dist_from_qb_5 = np.sqrt(np.square(rel_x_5 + 1.5)  + np.square(rel_y_5 - 0))
-        dist_from_qb_6 = np.sqrt(np.square(rel_x_6 + 1.5)  + np.square(rel_y_6 - 0))
-        dist_from_qb_7 = np.sqrt(np.square(rel_x_7 + 1.5)  + np.square(rel_y_7 - 0))
-        dist_from_qb_8 = np.sqrt(np.square(rel_x_8 + 1.5)  + np.square(rel_y_8 - 0))
-        dist_from_qb_9 = np.sqrt(np.square(rel_x_9 + 1.5)  + np.square(rel_y_9 - 0))
-        dist_from_qb_10 = np.sqrt(np.square(rel_x_10 + 1.5)  + np.square(rel_y_10 - 0))
-        dist_from_qb_11 = np.sqrt(np.square(rel_x_11 + 1.5)  + np.square(rel_y_11 - 0))
-        off_data = [["O", official_position_1, 0, 0, 0, 0.4, 'O'], # C 
-            ["O", official_position_2, 0, -1, 0, 0.4, 'O'], # LG
-            ["O", official_position_3, 0, -2, 0, 0.4, 'O'], # LT
-            ["O", official_position_4, 0, 1, 0, 0.4, 'O'], # RG
-            ["O", official_position_4, 0, 2, 0, 0.4, 'O'], # RT
-            ["O", official_position_4, 0, 3, 0, 0.4, 'O'], #TE-iR
-            ["O", official_position_4, -1, 0, 0, 0.4, 'O'], # QB
-            ["O", official_position_4, -6, 0, 0, 0.4, 'O'], # RB-L
-            ["O", official_position_4, -0.75, -20, 0, 0.4, 'O'], # OL-WR
-            ["O", official_position_4, 0, -3, 0, 0.4, 'O'], # TE-L
-            ["O", official_position_4, -0.75, 4, 0, 0.4, 'O'] # TE-oR
-        ]  
-    elif offenseFormation == 'Pistol':
-        empty_form = 0
-        shotgun_form = 0
-        iform_form = 0
-        jumbo_form = 0
-        pistol_form = 1
-        singleback_form = 0
-        other_form = 0
-        qb_dist_from_ball = 5
-        qb_rel_x = 5
-        qb_rel_y = 0
-        dist_from_qb_1 = np.sqrt(np.square(rel_x_1 + 5)  + np.square(rel_y_1 - 0))
-        dist_from_qb_2 = np.sqrt(np.square(rel_x_2 + 5)  + np.square(rel_y_2 - 0))
-        dist_from_qb_3 = np.sqrt(np.square(rel_x_3 + 5)  + np.square(rel_y_3 - 0))
-        dist_from_qb_4 = np.sqrt(np.square(rel_x_4 + 5)  + np.square(rel_y_4 - 0))
-        dist_from_qb_5 = np.sqrt(np.square(rel_x_5 + 5)  + np.square(rel_y_5 - 0))
-        dist_from_qb_6 = np.sqrt(np.square(rel_x_6 + 5)  + np.square(rel_y_6 - 0))
-        dist_from_qb_7 = np.sqrt(np.square(rel_x_7 + 5)  + np.square(rel_y_7 - 0))
-        dist_from_qb_8 = np.sqrt(np.square(rel_x_8 + 5)  + np.square(rel_y_8 - 0))
-        dist_from_qb_9 = np.sqrt(np.square(rel_x_9 + 5)  + np.square(rel_y_9 - 0))
-        dist_from_qb_10 = np.sqrt(np.square(rel_x_10 + 5)  + np.square(rel_y_10 - 0))
-        dist_from_qb_11 = np.sqrt(np.square(rel_x_11 + 5)  + np.square(rel_y_11 - 0))
-        off_data = [["O", official_position_1, 0, 0, 0, 0.4, 'O'], # C 
-            ["O", official_position_2, 0, -1, 0, 0.4, 'O'], # LG
-            ["O", official_position_3, 0, -2, 0, 0.4, 'O'], # LT
-            ["O", official_position_4, 0, 1, 0, 0.4, 'O'], # RG
-            ["O", official_position_4, 0, 2, 0, 0.4, 'O'], # RT
-            ["O", official_position_4, -0.75, 3, 0, 0.4, 'O'], #TE-R
-            ["O", official_position_4, -4, 0, 0, 0.4, 'O'], # QB
-            ["O", official_position_4, -7, 0, 0, 0.4, 'O'], # RB
-            ["O", official_position_4, 0, 20, 0, 0.4, 'O'], # OR-WR
-            ["O", official_position_4, 0, -20, 0, 0.4, 'O'], # OL_WR
-            ["O", official_position_4, -1, -10, 0, 0.4, 'O'] # SL-WR
-        ]
-    elif offenseFormation == 'Singleback':
-        empty_form = 0
-        shotgun_form = 0
-        iform_form = 0
-        jumbo_form = 0
-        pistol_form = 0
-        singleback_form = 1
-        other_form = 0
-        qb_dist_from_ball = 1.5
-        qb_rel_x = -1.5
-        qb_rel_y = 0
-        dist_from_qb_1 = np.sqrt(np.square(rel_x_1 + 1.5)  + np.square(rel_y_1 - 0))
-        dist_from_qb_2 = np.sqrt(np.square(rel_x_2 + 1.5)  + np.square(rel_y_2 - 0))
-        dist_from_qb_3 = np.sqrt(np.square(rel_x_3 + 1.5)  + np.square(rel_y_3 - 0))
-        dist_from_qb_4 = np.sqrt(np.square(rel_x_4 + 1.5)  + np.square(rel_y_4 - 0))
-        dist_from_qb_5 = np.sqrt(np.square(rel_x_5 + 1.5)  + np.square(rel_y_5 - 0))
-        dist_from_qb_6 = np.sqrt(np.square(rel_x_6 + 1.5)  + np.square(rel_y_6 - 0))
-        dist_from_qb_7 = np.sqrt(np.square(rel_x_7 + 1.5)  + np.square(rel_y_7 - 0))
-        dist_from_qb_8 = np.sqrt(np.square(rel_x_8 + 1.5)  + np.square(rel_y_8 - 0))
-        dist_from_qb_9 = np.sqrt(np.square(rel_x_9 + 1.5)  + np.square(rel_y_9 - 0))
-        dist_from_qb_10 = np.sqrt(np.square(rel_x_10 + 1.5)  + np.square(rel_y_10 - 0))
-        dist_from_qb_11 = np.sqrt(np.square(rel_x_11 + 1.5)  + np.square(rel_y_11 - 0))
-        off_data = [["O", official_position_1, 0, 0, 0, 0.4, 'O'], # C 
-            ["O", official_position_2, 0, -1, 0, 0.4, 'O'], # LG
-            ["O", official_position_3, 0, -2, 0, 0.4, 'O'], # LT
-            ["O", official_position_4, 0, 1, 0, 0.4, 'O'], # RG
-            ["O", official_position_4, 0, 2, 0, 0.4, 'O'], # RT
-            ["O", official_position_4, -0.75, 3, 0, 0.4, 'O'], #TE-R
-            ["O", official_position_4, -1, 0, 0, 0.4, 'O'], # QB
-            ["O", official_position_4, -6, 0, 0, 0.4, 'O'], # RB-L
-            ["O", official_position_4, 0, 20, 0, 0.4, 'O'], # OR-WR
-            ["O", official_position_4, 0, -20, 0, 0.4, 'O'], # OL_WR
-            ["O", official_position_4, -1, -10, 0, 0.4, 'O'] # SL-WR
-        ]
-    elif offenseFormation == "Wildcat":
-        empty_form = 0
-        shotgun_form = 0
-        iform_form = 0
-        jumbo_form = 0
-        pistol_form = 0
-        singleback_form = 0
-        other_form = 1
-        qb_dist_from_ball = 5
-        qb_rel_x = 5
-        qb_rel_y = 0
-        dist_from_qb_1 = np.sqrt(np.square(rel_x_1 + 5)  + np.square(rel_y_1 - 0))
-        dist_from_qb_2 = np.sqrt(np.square(rel_x_2 + 5)  + np.square(rel_y_2 - 0))
-        dist_from_qb_3 = np.sqrt(np.square(rel_x_3 + 5)  + np.square(rel_y_3 - 0))
-        dist_from_qb_4 = np.sqrt(np.square(rel_x_4 + 5)  + np.square(rel_y_4 - 0))
-        dist_from_qb_5 = np.sqrt(np.square(rel_x_5 + 5)  + np.square(rel_y_5 - 0))
-        dist_from_qb_6 = np.sqrt(np.square(rel_x_6 + 5)  + np.square(rel_y_6 - 0))
-        dist_from_qb_7 = np.sqrt(np.square(rel_x_7 + 5)  + np.square(rel_y_7 - 0))
-        dist_from_qb_8 = np.sqrt(np.square(rel_x_8 + 5)  + np.square(rel_y_8 - 0))
-        dist_from_qb_9 = np.sqrt(np.square(rel_x_9 + 5)  + np.square(rel_y_9 - 0))
-        dist_from_qb_10 = np.sqrt(np.square(rel_x_10 + 5)  + np.square(rel_y_10 - 0))
-        dist_from_qb_11 = np.sqrt(np.square(rel_x_11 + 5)  + np.square(rel_y_11 - 0))
-        off_data = [["O", official_position_1, 0, 0, 0, 0.4, 'O'], # C 
-            ["O", official_position_2, 0, -1, 0, 0.4, 'O'], # LG
-            ["O", official_position_3, 0, -2, 0, 0.4, 'O'], # LT
-            ["O", official_position_4, 0, 1, 0, 0.4, 'O'], # RG
-            ["O", official_position_4, 0, 2, 0, 0.4, 'O'], # RT
-            ["O", official_position_4, -0.75, 7, 0, 0.4, 'O'], #TE-R
-            ["O", official_position_4, -5, 0, 0, 0.4, 'O'], # QB
-            ["O", official_position_4, -5, -1, 0, 0.4, 'O'], # RB-L
-            ["O", official_position_4, 0, 20, 0, 0.4, 'O'], # OR-WR
-            ["O", official_position_4, 0, -20, 0, 0.4, 'O'], # OL_WR
-            ["O", official_position_4, -1, -10, 0, 0.4, 'O'] # SL-WR
-        ]
-    
-    x_1 = np.array([[float(yardsToGo), float(absoluteYardlineNumber), float(defendersInBox),
-    float(num_rb), float(num_te), float(num_wr), float(num_dl), float(num_lb), float(num_db), float(rel_x_1), 
-    float(rel_y_1), float(0.96), float(0.90), float(absoluteYardlineNumber), float(ball_y_array),
-    float(-2.61), float(3.0), float(5.61), float(qb_dist_from_ball), float(qb_rel_x), float(qb_rel_y),
-    float(dist_from_qb_1), float(down_1), float(down_2), float(down_3), float(down_4), float(cb_pos_1), 
-    float(de_pos_1), float(dt_pos_1), float(fs_pos_1), float(ilb_pos_1), float(mlb_pos_1), float(nt_pos_1), 
-    float(olb_pos_1), float(ss_pos_1), float(empty_form), float(iform_form), float(jumbo_form),
-    float(pistol_form), float(shotgun_form), float(singleback_form), float(other_form)]])
-    dtrain_1 = DMatrix(x_1)
-    prediction_1 = round(100*(mod.predict(dtrain_1)[0]), 3)
-
-    x_2 = np.array([[float(yardsToGo), float(absoluteYardlineNumber), float(defendersInBox),
-    float(num_rb), float(num_te), float(num_wr), float(num_dl), float(num_lb), float(num_db), float(rel_x_2),
-    float(rel_y_2), float(0.37), float(2.44), float(absoluteYardlineNumber), float(ball_y_array),
-    float(-2.61), float(3.0), float(5.61), float(qb_dist_from_ball), float(qb_rel_x), float(qb_rel_y),
-    float(dist_from_qb_2), float(down_1), float(down_2), float(down_3), float(down_4), float(cb_pos_2), 
-    float(de_pos_2), float(dt_pos_2), float(fs_pos_2), float(ilb_pos_2), float(mlb_pos_2), float(nt_pos_2), 
-    float(olb_pos_2), float(ss_pos_2), float(empty_form), float(iform_form), float(jumbo_form),
-    float(pistol_form), float(shotgun_form), float(singleback_form), float(other_form)]])
-    dtrain_2 = DMatrix(x_2)
-    prediction_2 = round(100*(mod.predict(dtrain_2)[0]), 3)
-
-    x_3 = np.array([[float(yardsToGo), float(absoluteYardlineNumber), float(defendersInBox),
-    float(num_rb), float(num_te), float(num_wr), float(num_dl), float(num_lb), float(num_db), float(rel_x_3),
-    float(rel_y_3), float(0.39), float(0.24), float(absoluteYardlineNumber), float(ball_y_array),
-    float(-2.61), float(3.0), float(5.61), float(qb_dist_from_ball), float(qb_rel_x), float(qb_rel_y),
-    float(dist_from_qb_3), float(down_1), float(down_2), float(down_3), float(down_4), float(cb_pos_3), 
-    float(de_pos_3), float(dt_pos_3), float(fs_pos_3), float(ilb_pos_3), float(mlb_pos_3), float(nt_pos_3), 
-    float(olb_pos_3), float(ss_pos_3), float(empty_form), float(iform_form), float(jumbo_form),
-    float(pistol_form), float(shotgun_form), float(singleback_form), float(other_form)]])
-    dtrain_3 = DMatrix(x_3)
-    prediction_3 = round(100*(mod.predict(dtrain_3)[0]), 3)
-
-    x_4 = np.array([[float(yardsToGo), float(absoluteYardlineNumber), float(defendersInBox),
-    float(num_rb), float(num_te), float(num_wr), float(num_dl), float(num_lb), float(num_db), float(rel_x_4),
-    float(rel_y_4), float(0.17), float(0.14), float(absoluteYardlineNumber), float(ball_y_array),
-    float(-2.61), float(3.0), float(5.61), float(qb_dist_from_ball), float(qb_rel_x), float(qb_rel_y),
-    float(dist_from_qb_4), float(down_1), float(down_2), float(down_3), float(down_4), float(cb_pos_4), 
-    float(de_pos_4), float(dt_pos_4), float(fs_pos_4), float(ilb_pos_4), float(mlb_pos_4), float(nt_pos_4), 
-    float(olb_pos_4), float(ss_pos_4), float(empty_form), float(iform_form), float(jumbo_form),
-    float(pistol_form), float(shotgun_form), float(singleback_form), float(other_form)]])
-    dtrain_4 = DMatrix(x_4)
-    prediction_4 = round(100*(mod.predict(dtrain_4)[0]), 3)
-
-    x_5 = np.array([[float(yardsToGo), float(absoluteYardlineNumber), float(defendersInBox),
-    float(num_rb), float(num_te), float(num_wr), float(num_dl), float(num_lb), float(num_db), float(rel_x_5),
-    float(rel_y_5), float(2.54), float(1.46), float(absoluteYardlineNumber), float(ball_y_array),
-    float(-2.61), float(3.0), float(5.61), float(qb_dist_from_ball), float(qb_rel_x), float(qb_rel_y),
-    float(dist_from_qb_5), float(down_1), float(down_2), float(down_3), float(down_4), float(cb_pos_5), 
-    float(de_pos_5), float(dt_pos_5), float(fs_pos_5), float(ilb_pos_5), float(mlb_pos_5), float(nt_pos_5), 
-    float(olb_pos_5), float(ss_pos_5), float(empty_form), float(iform_form), float(jumbo_form),
-    float(pistol_form), float(shotgun_form), float(singleback_form), float(other_form)]])
-    dtrain_5 = DMatrix(x_5)
-    prediction_5 = round(100*(mod.predict(dtrain_5)[0]), 3)
-
-    x_6 = np.array([[float(yardsToGo), float(absoluteYardlineNumber), float(defendersInBox),
-    float(num_rb), float(num_te), float(num_wr), float(num_dl), float(num_lb), float(num_db), float(rel_x_6),
-    float(rel_y_6), float(0.56), float(2.42), float(absoluteYardlineNumber), float(ball_y_array),
-    float(-2.61), float(3.0), float(5.61), float(qb_dist_from_ball), float(qb_rel_x), float(qb_rel_y),
-    float(dist_from_qb_6), float(down_1), float(down_2), float(down_3), float(down_4), float(cb_pos_6), 
-    float(de_pos_6), float(dt_pos_6), float(fs_pos_6), float(ilb_pos_6), float(mlb_pos_6), float(nt_pos_6), 
-    float(olb_pos_6), float(ss_pos_6), float(empty_form), float(iform_form), float(jumbo_form),
-    float(pistol_form), float(shotgun_form), float(singleback_form), float(other_form)]])
-    dtrain_6 = DMatrix(x_6)
-    prediction_6 = round(100*(mod.predict(dtrain_6)[0]), 3)
-
-    x_7 = np.array([[float(yardsToGo), float(absoluteYardlineNumber), float(defendersInBox),
-    float(num_rb), float(num_te), float(num_wr), float(num_dl), float(num_lb), float(num_db), float(rel_x_7),
-    float(rel_y_7), float(1.17), float(1.21), float(absoluteYardlineNumber), float(ball_y_array),
-    float(-2.61), float(3.0), float(5.61), float(qb_dist_from_ball), float(qb_rel_x), float(qb_rel_y),
-    float(dist_from_qb_7), float(down_1), float(down_2), float(down_3), float(down_4), float(cb_pos_7), 
-    float(de_pos_7), float(dt_pos_7), float(fs_pos_7), float(ilb_pos_7), float(mlb_pos_7), float(nt_pos_7), 
-    float(olb_pos_7), float(ss_pos_7), float(empty_form), float(iform_form), float(jumbo_form),
-    float(pistol_form), float(shotgun_form), float(singleback_form), float(other_form)]])
-    dtrain_7 = DMatrix(x_7)
-    prediction_7 = round(100*(mod.predict(dtrain_7)[0]), 3)
-
-    x_8 = np.array([[float(yardsToGo), float(absoluteYardlineNumber), float(defendersInBox),
-    float(num_rb), float(num_te), float(num_wr), float(num_dl), float(num_lb), float(num_db), float(rel_x_8),
-    float(rel_y_8), float(1.25), float(1.05), float(absoluteYardlineNumber), float(ball_y_array),
-    float(-2.61), float(3.0), float(5.61), float(qb_dist_from_ball), float(qb_rel_x), float(qb_rel_y),
-    float(dist_from_qb_8), float(down_1), float(down_2), float(down_3), float(down_4), float(cb_pos_8), 
-    float(de_pos_8), float(dt_pos_8), float(fs_pos_8), float(ilb_pos_8), float(mlb_pos_8), float(nt_pos_8), 
-    float(olb_pos_8), float(ss_pos_8), float(empty_form), float(iform_form), float(jumbo_form),
-    float(pistol_form), float(shotgun_form), float(singleback_form), float(other_form)]])
-    dtrain_8 = DMatrix(x_8)
-    prediction_8 = round(100*(mod.predict(dtrain_8)[0]), 3)
-
-    x_9 = np.array([[float(yardsToGo), float(absoluteYardlineNumber), float(defendersInBox),
-    float(num_rb), float(num_te), float(num_wr), float(num_dl), float(num_lb), float(num_db), float(rel_x_9),
-    float(rel_y_9), float(0.90), float(0.18), float(absoluteYardlineNumber), float(ball_y_array),
-    float(-2.61), float(3.0), float(5.61), float(qb_dist_from_ball), float(qb_rel_x), float(qb_rel_y),
-    float(dist_from_qb_9), float(down_1), float(down_2), float(down_3), float(down_4), float(cb_pos_9), 
-    float(de_pos_9), float(dt_pos_9), float(fs_pos_9), float(ilb_pos_9), float(mlb_pos_9), float(nt_pos_9), 
-    float(olb_pos_9), float(ss_pos_9), float(empty_form), float(iform_form), float(jumbo_form),
-    float(pistol_form), float(shotgun_form), float(singleback_form), float(other_form)]])
-    dtrain_9 = DMatrix(x_9)
-    prediction_9 = round(100*(mod.predict(dtrain_9)[0]), 3)
-
-    x_10 = np.array([[float(yardsToGo), float(absoluteYardlineNumber), float(defendersInBox),
-    float(num_rb), float(num_te), float(num_wr), float(num_dl), float(num_lb), float(num_db), float(rel_x_10),
-    float(rel_y_10), float(0.36), float(2.85), float(absoluteYardlineNumber), float(ball_y_array),
-    float(-2.61), float(3.0), float(5.61), float(qb_dist_from_ball), float(qb_rel_x), float(qb_rel_y),
-    float(dist_from_qb_10), float(down_1), float(down_2), float(down_3), float(down_4), float(cb_pos_10), 
-    float(de_pos_10), float(dt_pos_10), float(fs_pos_10), float(ilb_pos_10), float(mlb_pos_10), float(nt_pos_10), 
-    float(olb_pos_10), float(ss_pos_10), float(empty_form), float(iform_form), float(jumbo_form),
-    float(pistol_form), float(shotgun_form), float(singleback_form), float(other_form)]])
-    dtrain_10 = DMatrix(x_10)
-    prediction_10 = round(100*(mod.predict(dtrain_10)[0]), 3)
-
-    x_11 = np.array([[float(yardsToGo), float(absoluteYardlineNumber), float(defendersInBox),
-    float(num_rb), float(num_te), float(num_wr), float(num_dl), float(num_lb), float(num_db), float(rel_x_11),
-    float(rel_y_11), float(0.03), float(0.18), float(absoluteYardlineNumber), float(ball_y_array),
-    float(-2.61), float(3.0), float(5.61), float(qb_dist_from_ball), float(qb_rel_x), float(qb_rel_y),
-    float(dist_from_qb_11), float(down_1), float(down_2), float(down_3), float(down_4), float(cb_pos_11), 
-    float(de_pos_11), float(dt_pos_11), float(fs_pos_11), float(ilb_pos_11), float(mlb_pos_11), float(nt_pos_11), 
-    float(olb_pos_11), float(ss_pos_11), float(empty_form), float(iform_form), float(jumbo_form),
-    float(pistol_form), float(shotgun_form), float(singleback_form), float(other_form)]])
-    dtrain_11 = DMatrix(x_11)
-    prediction_11 = round(100*(mod.predict(dtrain_11)[0]), 3)
-
-    display_dist_1 = round(dist_from_qb_1, 1)
-    display_dist_2 = round(dist_from_qb_2, 1)
-    display_dist_3 = round(dist_from_qb_3, 1)
-    display_dist_4 = round(dist_from_qb_4, 1)
-    display_dist_5 = round(dist_from_qb_5, 1)
-    display_dist_6 = round(dist_from_qb_6, 1)
-    display_dist_7 = round(dist_from_qb_7, 1)
-    display_dist_8 = round(dist_from_qb_8, 1)
-    display_dist_9 = round(dist_from_qb_9, 1)
-    display_dist_10 = round(dist_from_qb_10, 1)
-    display_dist_11 = round(dist_from_qb_11, 1)
-
-    data = [["1", official_position_1, rel_x_1, rel_y_1, display_dist_1, prediction_1], 
-            ["2", official_position_2, rel_x_2, rel_y_2, display_dist_2, prediction_2],
-            ["3", official_position_3, rel_x_3, rel_y_3, display_dist_3, prediction_3],
-            ["4", official_position_4, rel_x_4, rel_y_4, display_dist_4, prediction_4],
-            ["5", official_position_5, rel_x_5, rel_y_5, display_dist_5, prediction_5],
-            ["6", official_position_6, rel_x_6, rel_y_6, display_dist_6, prediction_6],
-            ["7", official_position_7, rel_x_7, rel_y_7, display_dist_7, prediction_7],
-            ["8", official_position_8, rel_x_8, rel_y_8, display_dist_8, prediction_8],
-            ["9", official_position_9, rel_x_9, rel_y_9, display_dist_9, prediction_9],
-            ["10", official_position_10, rel_x_10, rel_y_10, display_dist_10, prediction_10],
-            ["11", official_position_11, rel_x_11, rel_y_11, display_dist_11, prediction_11]]
-    
-    df = pd.DataFrame(data,columns=['Player','Position', 'Rel. x', 'Rel. y', 'Dist. From QB', 'Chance of a Sack (%)'])
-    df_graph = df
-    df_graph['Off_Def'] = ['D','D','D','D','D','D','D','D','D','D','D']
-
-
-    off_df = pd.DataFrame(off_data,columns=['Player','Position', 'Rel. x', 'Rel. y', 'Dist. From QB', 'Chance of a Sack (%)', 'Off_Def'])
-
-    df_graph = df_graph.append(off_df)
-    #diagram = px.scatter(data, x=2, y=3)
-    diagram = px.scatter(df_graph, x='Rel. y', y='Rel. x', size = 'Chance of a Sack (%)', color = 'Off_Def', text='Player',
-    size_max=14)
-    diagram.update_xaxes(range=[-26.65, 26.65])
-    diagram.update_yaxes(range=[-10,20])
-
-    if n_clicks:                            
-        data = df.to_dict('rows')
-        columns =  [{"name": i, "id": i,} for i in (df.columns)]
-        return (dt.DataTable(data=data, columns=columns, sort_action='native', sort_mode='multi', sort_as_null=['', 'No'],
-         sort_by=[{'column_id': 'Chance of a Sack (%)', 'direction': 'desc'}], style_cell={'textAlign': 'center',
-         'minWidth': '150px', 'width': '150px', 'maxWidth': '150px',
-         'overflow': 'hidden',
-         'textOverflow': 'ellipsis',
-         }, style_header = {'fontWeight': 'bold'}, editable=True), diagram)
-    else :
-        return('Press submit to view results', diagram)
+                  LR_1, LR_2, LR_3, LR_4, LR_5, LR_6, LR_7, LR_8, LR_9, LR_10, LR_11, explain=None):
+    rel_x = [rel_x_1, rel_x_2, rel_x_3, rel_x_4, rel_x_5, rel_x_6, rel_x_7, rel_x_8, rel_x_9, rel_x_10, rel_x_11]
+    techs = [tech_1, tech_2, tech_3, tech_4, tech_5, tech_6, tech_7, tech_8, tech_9, tech_10, tech_11]
+    LRs = [LR_1, LR_2, LR_3, LR_4, LR_5, LR_6, LR_7, LR_8, LR_9, LR_10, LR_11]
+    positions = [official_position_1, official_position_2, official_position_3, official_position_4,
+                 official_position_5, official_position_6, official_position_7, official_position_8,
+                 official_position_9, official_position_10, official_position_11]
+    # DEFENSIVE TECHNIQUE to REL Y CONVERSION
+    from hackasack import encoders
+    rel_y = list(encoders.technique_rel_y(techs, LRs))
+    return front_outputs(bool(n_clicks), yardsToGo, absoluteYardlineNumber, defendersInBox, o_dropdown, d_dropdown,
+                         the_hash, down, offenseFormation, rel_x, rel_y, positions, size_max=14,
+                         drivers=bool(explain))
 
 
 @app.callback(Output('page-content', 'children'),
@@ -4318,5 +754,7 @@ def display_page(pathname):
         return index_page
     # You could also return a 404 "URL not found" page here
 
+startup_mark('layout and callbacks')
+
 if __name__ == '__main__':
     app.run_server(debug=False)
\ No newline at end of file
@@ -0,0 +1,40 @@
+import argparse
+import os
+import time
+
+import pandas as pd
+
+from hackasack import bootstrap, stability
+
+parser = argparse.ArgumentParser(description='Uncertainty of expected vs actual sacks from sacks_preds.parquet')
+parser.add_argument('--preds', default='datasets/sacks_preds.parquet', help='written by build.py --score')
+parser.add_argument('--out-dir', default='datasets')
+parser.add_argument('--workers', type=int, default=os.cpu_count())
+parser.add_argument('--seed', type=int, default=42)
+subparsers = parser.add_subparsers(dest='command', required=True)
+
+boot = subparsers.add_parser('bootstrap', help='play-level bootstrap intervals per player and team')
+boot.add_argument('--resamples', type=int, default=10000)
+boot.add_argument('--level', type=float, default=0.95)
+
+split = subparsers.add_parser('stability', help='split-half reliability over random week or game partitions')
+split.add_argument('--by', choices=['week', 'game'], default='week')
+split.add_argument('--splits', type=int, default=5000)
+split.add_argument('--min-snaps', type=int, default=200)
+
+args = parser.parse_args()
+preds = pd.read_parquet(args.preds)
+os.makedirs(args.out_dir, exist_ok=True)
+t = time.perf_counter()
+
+if args.command == 'bootstrap':
+    intervals = bootstrap.bootstrap(preds, args.resamples, args.workers, args.seed, args.level)
+    for level, frame in intervals.items():
+        frame.to_csv(f'{args.out_dir}/sacks_oe_{level}_ci.csv', index=False)
+    print(f'{args.resamples} resamples of {len(preds)} rows in {time.perf_counter() - t:.1f}s')
+
+if args.command == 'stability':
+    correlations = stability.split_half(preds, args.by, args.splits, args.workers, args.seed, args.min_snaps)
+    correlations.to_csv(f'{args.out_dir}/sacks_oe_stability_{args.by}.csv', index=False)
+    print(stability.summarize(correlations).to_string(index=False))
+    print(f'{args.splits} {args.by} splits of {len(preds)} rows in {time.perf_counter() - t:.1f}s')
@@ -0,0 +1,111 @@
+import numpy as np
+
+# The if/elif chains main.py used before the encoders, one function per chain, kept to
+# check the table-driven versions against
+
+
+def o_personnel(o_dropdown):
+    if o_dropdown == '12*':
+        return 1, 2, 1
+    elif o_dropdown == '12':
+        return 1, 2, 2
+    elif o_dropdown == '21':
+        return 2, 1, 2
+    elif o_dropdown == '13':
+        return 1, 3, 1
+    elif o_dropdown == '10':
+        return 1, 0, 4
+    elif o_dropdown == '22':
+        return 2, 2, 1
+    elif o_dropdown == '01':
+        return 0, 1, 4
+    elif o_dropdown == '20':
+        return 2, 0, 3
+    elif o_dropdown == '11*':
+        return 1, 1, 2
+    elif o_dropdown == '02':
+        return 0, 2, 3
+    else:
+        return 1, 1, 3
+
+
+def d_personnel(d_dropdown):
+    if d_dropdown == '1-5-5':
+        return 1, 5, 5
+    elif d_dropdown == '2-4-5':
+        return 2, 4, 5
+    elif d_dropdown == '3-3-5':
+        return 3, 3, 5
+    elif d_dropdown == '2-3-6':
+        return 2, 3, 6
+    elif d_dropdown == '4-3-4':
+        return 4, 3, 4
+    elif d_dropdown == '3-4-4':
+        return 3, 4, 4
+    elif d_dropdown == '4-1-6':
+        return 4, 1, 6
+    elif d_dropdown == '3-2-6':
+        return 3, 2, 6
+    elif d_dropdown == '1-4-6':
+        return 1, 4, 6
+    else:
+        return 4, 2, 5
+
+
+def ball_y(the_hash):
+    if the_hash == 'Right':
+        return 29.7
+    elif the_hash == 'Left':
+        return 23.6
+    else:
+        return 27.0
+
+
+def downs(down):
+    if float(down) == 4:
+        return 0, 0, 0, 1
+    elif float(down) == 3:
+        return 0, 0, 1, 0
+    elif float(down) == 2:
+        return 0, 1, 0, 0
+    else:
+        return 1, 0, 0, 0
+
+
+def positions(official_position):
+    # cb, de, dt, fs, ilb, mlb, nt, olb, ss
+    return tuple(int(official_position == position)
+                 for position in ['CB', 'DE', 'DT', 'FS', 'ILB', 'MLB', 'NT', 'OLB', 'SS'])
+
+
+def formation(offenseFormation, rel_x, rel_y):
+    # (empty, iform, jumbo, pistol, shotgun, singleback, other), qb_dist_from_ball, qb_rel_x,
+    # qb_rel_y, dist_from_qb
+    if offenseFormation == "Empty":
+        return (1, 0, 0, 0, 0, 0, 0), 5, -5, 0, np.sqrt(np.square(rel_x + 5)  + np.square(rel_y - 0))
+    elif offenseFormation == 'Shotgun':
+        return (0, 0, 0, 0, 1, 0, 0), 5, -5, 0, np.sqrt(np.square(rel_x + 5)  + np.square(rel_y - 0))
+    elif offenseFormation == 'I Formation':
+        return (0, 1, 0, 0, 0, 0, 0), 1.5, -1.5, 0, np.sqrt(np.square(rel_x + 1.5)  + np.square(rel_y - 0))
+    elif offenseFormation == 'Jumbo':
+        return (0, 0, 1, 0, 0, 0, 0), 1.5, -1.5, 0, np.sqrt(np.square(rel_x + 1.5)  + np.square(rel_y - 0))
+    elif offenseFormation == 'Pistol':
+        return (0, 0, 0, 1, 0, 0, 0), 5, 5, 0, np.sqrt(np.square(rel_x + 5)  + np.square(rel_y - 0))
+    elif offenseFormation == 'Singleback':
+        return (0, 0, 0, 0, 0, 1, 0), 1.5, -1.5, 0, np.sqrt(np.square(rel_x + 1.5)  + np.square(rel_y - 0))
+    elif offenseFormation == "Wildcat":
+        return (0, 0, 0, 0, 0, 0, 1), 5, 5, 0, np.sqrt(np.square(rel_x + 5)  + np.square(rel_y - 0))
+
+
+def technique_rel_y(tech, LR):
+    values = {'1': 0.2, '2i': 0.8, '2': 1, '3': 1.2, '4i': 1.8, '4': 2, '5': 2.2, '6i': 2.8, '6': 3,
+              '7/9': 3.2, 'Wide 7/9': 4, 'Slot': 10, 'Wide': 20}
+    if tech == '0':
+        return 0
+    elif tech in values:
+        if LR == 'L':
+            return values[tech]
+        else:
+            return -values[tech]
+    else:
+        return 26
@@ -0,0 +1,70 @@
+import numpy as np
+import pandas as pd
+
+from hackasack import aggregates
+
+
+def season_preds(weeks=(1, 2, 3), seed=0):
+    rng = np.random.default_rng(seed)
+    players = pd.DataFrame({'nflId': [11, 12, 13, 14], 'displayName': ['A', 'B', 'C', 'D'],
+                            'officialPosition': ['DE', 'OLB', 'DT', 'CB']})
+    rows = []
+    for week in weeks:
+        n = 40
+        pick = rng.integers(0, len(players), n)
+        rows.append(players.iloc[pick].assign(week=week, defensiveTeam=rng.choice(['KC', 'BUF'], n),
+                                              pff_sack=(rng.random(n) < 0.1).astype('float32'),
+                                              sack_pred=rng.random(n).astype('float32') / 5))
+    return pd.concat(rows, ignore_index=True)
+
+
+def full_totals(preds, level):
+    # The season aggregated from scratch, without partials
+    keys = aggregates.LEVELS[level]
+    totals = preds.groupby(keys).agg(snaps=('week', 'size'), sacks=('pff_sack', 'sum'),
+                                     exp_sacks=('sack_pred', 'sum')).reset_index()
+    return totals.sort_values(keys).reset_index(drop=True)
+
+
+def assert_matches(season, preds):
+    for level, keys in aggregates.LEVELS.items():
+        got = season.totals(level).sort_values(keys).reset_index(drop=True)
+        expected = full_totals(preds, level)
+        np.testing.assert_array_equal(got[keys].to_numpy(), expected[keys].to_numpy())
+        for column in aggregates.SUMS:
+            np.testing.assert_allclose(got[column].to_numpy(dtype='float64'),
+                                       expected[column].to_numpy(dtype='float64'), rtol=1e-6)
+        np.testing.assert_allclose(got['sacks_oe'], got['sacks'] - got['exp_sacks'])
+
+
+def test_update_matches_full_aggregation(tmp_path):
+    preds = season_preds()
+    season = aggregates.SackAggregates(str(tmp_path))
+    assert season.update(preds) == [1, 2, 3]
+    assert_matches(season, preds)
+    season.save()
+    # Unchanged weeks are skipped, a changed week replaces its own partial
+    season = aggregates.SackAggregates(str(tmp_path))
+    preds.loc[preds['week'] == 2, 'sack_pred'] *= 0.5
+    assert season.update(preds) == [2]
+    assert_matches(season, preds)
+
+
+def test_update_drops_weeks_no_longer_scored(tmp_path):
+    season = aggregates.SackAggregates(str(tmp_path))
+    season.update(season_preds())
+    fewer = season_preds(weeks=(1, 2))
+    assert season.update(fewer) == []
+    assert_matches(season, fewer)
+    assert sorted(season.weeks) == ['1', '2']
+
+
+def test_rescore_matches_full_aggregation(tmp_path):
+    preds = season_preds()
+    season = aggregates.SackAggregates(str(tmp_path))
+    season.update(preds)
+    rows = preds.index[::7]
+    old_rows = preds.loc[rows].copy()
+    preds.loc[rows, 'sack_pred'] = 0.5
+    season.rescore(old_rows, preds.loc[rows])
+    assert_matches(season, preds)
@@ -0,0 +1,100 @@
+import copy
+
+import pyarrow as pa
+import pytest
+from flask import Flask
+
+from hackasack import api, arrow_export, fronts, scoring
+
+FRONT = {
+    'yardsToGo': 10, 'absoluteYardlineNumber': 75, 'defendersInBox': 6, 'personnelO': '11', 'personnelD': '4-2-5',
+    'hash': 'Middle', 'down': 1, 'offenseFormation': 'Shotgun',
+    'defenders': [{'officialPosition': position, 'rel_x': 1.0 + slot, 'rel_y': -5.0 + slot}
+                  for slot, position in enumerate(['DE', 'DT', 'NT', 'DE', 'OLB', 'MLB', 'ILB', 'CB', 'CB', 'FS', 'SS'])],
+}
+
+
+def make_client(max_fronts=api.MAX_FRONTS):
+    app = Flask(__name__)
+    app.register_blueprint(api.create_blueprint(lambda: scoring.load_model(scoring.DEFAULT_MODEL, 1), max_fronts))
+    return app.test_client()
+
+
+@pytest.fixture(scope='module')
+def client():
+    return make_client()
+
+
+def edited(situation=None, defender=None):
+    front = copy.deepcopy(FRONT)
+    front.update(situation or {})
+    if defender is not None:
+        front['defenders'][3] = defender
+    return {'fronts': [front]}
+
+
+def test_score(client):
+    response = client.post('/api/v1/score', json=edited())
+    assert response.status_code == 200
+    assert b'NaN' not in response.data
+    assert len(response.get_json()['fronts'][0]['sack_prob']) == 11
+
+
+@pytest.mark.parametrize('body, field', [
+    (edited({'offenseFormation': 'Spread'}), 'offenseFormation'),
+    (edited({'personnelO': '33'}), 'personnelO'),
+    (edited({'personnelD': '6-1-4'}), 'personnelD'),
+    (edited({'hash': 'Sideline'}), 'hash'),
+    (edited({'down': 5}), 'down'),
+    (edited({'down': '3'}), 'down'),
+    (edited({'defendersInBox': None}), 'defendersInBox'),
+    (edited({'yardsToGo': 'ten'}), 'yardsToGo'),
+    (edited(defender={'officialPosition': 'LB', 'rel_x': 1.0, 'rel_y': 2.0}), 'officialPosition'),
+    (edited(defender={'officialPosition': 'DE', 'rel_x': None, 'rel_y': 2.0}), 'rel_x'),
+    (edited(defender={'officialPosition': 'DE', 'rel_x': 1.0, 'rel_y': True}), 'rel_y'),
+    (edited(defender={'officialPosition': 'DE', 'depth': 1.0, 'technique': '5'}), 'side'),
+    (edited(defender={'officialPosition': 'DE', 'depth': 1.0, 'technique': '8', 'side': 'L'}), 'technique'),
+])
+def test_score_rejects_unknown_values(client, body, field):
+    response = client.post('/api/v1/score', json=body)
+    assert response.status_code == 400
+    assert field in response.get_json()['error']
+
+
+def arrow_body(rows):
+    sink = pa.BufferOutputStream()
+    table = pa.Table.from_pandas(rows, preserve_index=False)
+    with pa.ipc.new_stream(sink, table.schema) as writer:
+        writer.write_table(table, max_chunksize=11)
+    return sink.getvalue().to_pybytes()
+
+
+def post_arrow(client, rows):
+    return client.post('/api/v1/score.arrow', data=arrow_body(rows), content_type=arrow_export.MIME_TYPE)
+
+
+def test_score_arrow(client):
+    rows = fronts.from_records(edited()['fronts']).drop(columns=['technique', 'side'])
+    response = post_arrow(client, rows)
+    assert response.status_code == 200
+    assert pa.ipc.open_stream(response.data).read_all().num_rows == 11
+
+
+def test_score_arrow_checks_rows(client):
+    rows = fronts.from_records(edited()['fronts']).drop(columns=['side'])
+    rows['technique'] = '5'
+    response = post_arrow(client, rows)
+    assert response.status_code == 400
+    assert 'side' in response.get_json()['error']
+    rows = fronts.from_records(edited()['fronts']).drop(columns=['technique', 'side'])
+    response = post_arrow(client, rows.assign(offenseFormation='Spread'))
+    assert response.status_code == 400
+    assert 'offenseFormation' in response.get_json()['error']
+
+
+def test_score_arrow_row_limit():
+    client = make_client(max_fronts=2)
+    body = {'fronts': edited()['fronts'] * 3}
+    rows = fronts.from_records(body['fronts']).drop(columns=['technique', 'side'])
+    assert post_arrow(client, rows).status_code == 413
+    assert client.post('/api/v1/score.arrow', json=body).status_code == 413
@@ -0,0 +1,64 @@
+import numpy as np
+import pandas as pd
+
+from hackasack import bootstrap
+
+
+def season_preds(n_plays=60, seed=0):
+    # Five defenders a play from one of two defenses
+    rng = np.random.default_rng(seed)
+    rosters = {'KC': [11, 12, 13, 14, 15, 16], 'BUF': [21, 22, 23, 24, 25, 26]}
+    rows = []
+    for play in range(n_plays):
+        team = ['KC', 'BUF'][play % 2]
+        for nfl_id in rng.choice(rosters[team], 5, replace=False):
+            rows.append({'gameId': 2021090900 + play // 20, 'playId': 50 + play, 'nflId': nfl_id,
+                         'displayName': f'P{nfl_id}', 'officialPosition': 'DE' if nfl_id % 2 else 'OLB',
+                         'defensiveTeam': team, 'pff_sack': float(rng.random() < 0.05),
+                         'sack_pred': rng.random() / 10})
+    return pd.DataFrame(rows)
+
+
+def plain_totals(preds):
+    players = preds.groupby('nflId')[['pff_sack', 'sack_pred']].sum().sort_index()
+    teams = preds.groupby('defensiveTeam')[['pff_sack', 'sack_pred']].sum().sort_index()
+    return players, teams
+
+
+def test_point_estimate_is_the_plain_aggregate():
+    preds = season_preds()
+    out = bootstrap.bootstrap(preds, resamples=20)
+    players, teams = plain_totals(preds)
+    for frame, expected, key in [(out['players'], players, 'nflId'), (out['teams'], teams, 'defensiveTeam')]:
+        frame = frame.set_index(key).sort_index()
+        assert frame.index.tolist() == expected.index.tolist()
+        np.testing.assert_allclose(frame['sacks'], expected['pff_sack'])
+        np.testing.assert_allclose(frame['exp_sacks'], expected['sack_pred'])
+        np.testing.assert_allclose(frame['sacks_oe'], expected['pff_sack'] - expected['sack_pred'])
+
+
+def test_weighted_replicate_is_the_resampled_aggregate():
+    # A draw-count weighted bincount equals aggregating the plays drawn, repeats included
+    preds = season_preds()
+    snaps = bootstrap.snap_table(preds)
+    plays = preds[['gameId', 'playId']].drop_duplicates().sort_values(['gameId', 'playId']).reset_index(drop=True)
+    drawn = np.random.default_rng(3).integers(0, len(plays), len(plays))
+    counts = np.bincount(drawn, minlength=len(plays)).astype('float64')
+    resampled = pd.concat([preds.merge(plays.iloc[[i]], on=['gameId', 'playId']) for i in drawn])
+    players, teams = bootstrap.totals(counts, snaps)
+    expected_players, expected_teams = plain_totals(resampled)
+    expected_players = expected_players.reindex(snaps['keys']['players']['nflId'], fill_value=0.0)
+    np.testing.assert_allclose(players.T, expected_players.to_numpy())
+    np.testing.assert_allclose(teams.T, expected_teams.reindex(snaps['keys']['teams']['defensiveTeam']).to_numpy())
+
+
+def test_intervals_are_reproducible():
+    preds = season_preds()
+    first = bootstrap.bootstrap(preds, resamples=600, seed=7)
+    again = bootstrap.bootstrap(preds, resamples=600, seed=7)
+    pooled = bootstrap.bootstrap(preds, resamples=600, seed=7, workers=2)
+    for level in bootstrap.LEVELS:
+        pd.testing.assert_frame_equal(first[level], again[level])
+        pd.testing.assert_frame_equal(first[level], pooled[level])
+    other = bootstrap.bootstrap(preds, resamples=600, seed=8)
+    assert not np.allclose(first['players']['sacks_oe_lo'], other['players']['sacks_oe_lo'])
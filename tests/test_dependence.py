@@ -0,0 +1,36 @@
+import threading
+
+import numpy as np
+
+from hackasack import dependence
+
+
+class Booster:
+    # Stands in for an xgboost booster: the row sum, recording the size of every predict
+    def __init__(self):
+        self.calls = []
+        self.lock = threading.Lock()
+
+    def inplace_predict(self, X):
+        with self.lock:
+            self.calls.append(len(X))
+        return X.sum(axis=1)
+
+
+def test_ice_splits_the_grid_across_threads():
+    X = np.random.default_rng(0).random((20, 5)).astype('float32')
+    values = np.linspace(0, 1, 50, dtype='float32')
+    booster = Booster()
+    curve = dependence.ice(booster, X, 2, values, chunk_rows=1 << 18, threads=4)
+    assert len(booster.calls) == 4
+    assert sum(booster.calls) == 20 * 50
+    expected = X.sum(axis=1)[:, None] - X[:, [2]] + values[None]
+    np.testing.assert_allclose(curve, expected, rtol=1e-6)
+
+
+def test_ice_caps_chunks_at_chunk_rows():
+    X = np.ones((20, 5), dtype='float32')
+    booster = Booster()
+    dependence.ice(booster, X, 0, np.arange(50, dtype='float32'), chunk_rows=200, threads=1)
+    assert max(booster.calls) <= 200
+    assert len(booster.calls) == 5
@@ -0,0 +1,34 @@
+import numpy as np
+
+from hackasack import encoders
+
+import old_main
+
+O = ['11', '12', '21', '13', '10', '22', '01', '20', '11*', '02', '12*', '99', None]
+D = ['4-2-5', '2-4-5', '3-3-5', '2-3-6', '4-3-4', '3-4-4', '4-1-6', '3-2-6', '1-4-6', '1-5-5', '5-5-1', None]
+HASHES = ['Left Hash', 'Middle', 'Right Hash', 'Left', 'Right', None]
+TECHNIQUES = ['0', '1', '2i', '2', '3', '4i', '4', '5', '6i', '6', '7/9', 'Wide 7/9', 'Slot', 'Wide', 'zz', None]
+
+
+def test_personnel_and_hash():
+    np.testing.assert_array_equal(encoders.o_personnel(O), [old_main.o_personnel(value) for value in O])
+    np.testing.assert_array_equal(encoders.d_personnel(D), [old_main.d_personnel(value) for value in D])
+    np.testing.assert_array_equal(encoders.ball_y(HASHES), [old_main.ball_y(value) for value in HASHES])
+
+
+def test_downs_positions_formations():
+    downs = ['1', '2', '3', '4', 1, 4.0]
+    np.testing.assert_array_equal(encoders.one_hot_downs(downs), [old_main.downs(value) for value in downs])
+    positions = encoders.POSITIONS + ['Other']
+    np.testing.assert_array_equal(encoders.one_hot_positions(positions),
+                                  [old_main.positions(value) for value in positions])
+    formations = list(encoders.OFFENSE_FORMATIONS)
+    expected = [old_main.formation(value, 0.0, 0.0)[0] for value in formations]
+    np.testing.assert_array_equal(encoders.one_hot_formations(formations), expected)
+
+
+def test_technique_rel_y():
+    techniques = [tech for tech in TECHNIQUES for _ in 'LR']
+    sides = ['L', 'R'] * len(TECHNIQUES)
+    np.testing.assert_array_equal(encoders.technique_rel_y(techniques, sides),
+                                  [old_main.technique_rel_y(tech, side) for tech, side in zip(techniques, sides)])
@@ -0,0 +1,150 @@
+import warnings
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from hackasack import kernels, schema
+from hackasack.features import DEFENSE_COLUMNS, snap_features
+
+OFFENSE = ['T', 'G', 'C', 'G', 'T', 'WR', 'RB']
+DEFENSE = ['DE', 'DT', 'DT', 'DE', 'OLB', 'MLB', 'CB', 'CB', 'SS', 'FS']
+
+
+def synthetic_week(seed=0):
+    # A dozen plays covering both directions, one to three QBs (with a lateral tie between
+    # two), a play without offensive linemen and a play without a ball row
+    rng = np.random.default_rng(seed)
+    snaps, balls, players = [], [], []
+    nfl_id = 1000
+    for i in range(12):
+        game, play = 2022090800 + i // 4, 50 + i
+        direction = 'left' if i % 2 else 'right'
+        ball_x, ball_y = rng.uniform(30, 90), rng.uniform(20, 33)
+        offense = OFFENSE + ['QB'] * [1, 2, 3, 2][i % 4]
+        if i == 5:
+            offense = [position for position in offense if position not in ('T', 'G', 'C')]
+        qbs = 0
+        for team, positions in [('HOM', offense), ('AWY', DEFENSE)]:
+            for position in positions:
+                nfl_id += 1
+                y = rng.uniform(0, 53.3)
+                if position == 'QB':
+                    # the two QBs of play 3 are equally far from the ball laterally
+                    y = ball_y + (2.0 if qbs % 2 else -2.0) if i == 3 else y
+                    qbs += 1
+                snaps.append({'gameId': game, 'playId': play, 'nflId': nfl_id, 'team': team,
+                              'playDirection': direction, 'x': rng.uniform(20, 100), 'y': y,
+                              's': rng.uniform(0, 5), 'a': rng.uniform(0, 5), 'dir': rng.uniform(0, 360),
+                              'o': rng.uniform(0, 360), 'event': 'ball_snap'})
+                players.append({'nflId': nfl_id, 'officialPosition': position})
+        if i != 7:
+            balls.append({'gameId': game, 'playId': play, 'x': ball_x, 'y': ball_y})
+    ball_snaps = schema.apply_dtypes(pd.DataFrame(snaps), 'tracking')
+    ball_loc = schema.apply_dtypes(pd.DataFrame(balls), 'tracking')
+    return ball_snaps, ball_loc, pd.DataFrame(players)
+
+
+def reference_snap_features(ball_snaps, ball_loc, players_select):
+    # The groupby / merge chain snap_features replaced
+    ball_loc = ball_loc.rename(columns = {'x': 'ball_x', 'y': 'ball_y'})
+    ball_snaps = pd.merge(ball_snaps, ball_loc, on = ['gameId', 'playId'])
+
+    ball_snaps_right = ball_snaps[(ball_snaps['playDirection'] == 'right')].copy()
+    ball_snaps_right['rel_x'] = ball_snaps_right['x'] - ball_snaps_right['ball_x']
+    ball_snaps_right['rel_y'] = (ball_snaps_right['y'] - ball_snaps_right['ball_y'])
+
+    ball_snaps_left = ball_snaps[(ball_snaps['playDirection'] == 'left')].copy()
+    ball_snaps_left['rel_x'] = (120 - ball_snaps_left['x']) - (120 - ball_snaps_left['ball_x'])
+    ball_snaps_left['rel_y'] = (53.33 - ball_snaps_left['y']) - (53.33 - ball_snaps_left['ball_y'])
+
+    ball_snaps_rel = pd.merge(pd.concat([ball_snaps_right, ball_snaps_left], axis=0), players_select, on = 'nflId')
+
+    oline = ball_snaps_rel[(ball_snaps_rel['officialPosition'].isin(['T', 'G', 'C']))]
+    def maxmin(x):
+        mx = x.rel_y.max()
+        mn = x.rel_y.min()
+        return pd.Series({'oline_min': mn, 'oline_max': mx})
+    oline_min_max = oline.groupby(['gameId', 'playId']).apply(maxmin).reset_index()
+    oline_min_max['oline_width'] = oline_min_max['oline_max'] - oline_min_max['oline_min']
+
+    ball_snaps_rel = pd.merge(ball_snaps_rel, oline_min_max, on = ['gameId', 'playId'])
+
+    qbs = ball_snaps_rel[(ball_snaps_rel['officialPosition'] == 'QB')]
+    qb_x_y = qbs.rename(columns = {'rel_x' : 'qb_rel_x', 'rel_y': 'qb_rel_y'})[
+        ['gameId', 'playId', 'x', 'y', 'ball_x', 'ball_y', 'team', 'qb_rel_x', 'qb_rel_y']]
+    num_qbs = qbs.groupby(['gameId', 'playId']).count().reset_index().rename(columns = {'officialPosition' : 'num_qbs'})[
+        ['gameId', 'playId', 'num_qbs']]
+    qb_x_y = pd.merge(qb_x_y, num_qbs, on = ['gameId', 'playId'])
+
+    qb_x_y_one_qb = qb_x_y[(qb_x_y['num_qbs'] == 1)].drop('num_qbs', axis = 1)
+    qb_x_y_two_qbs = qb_x_y[(qb_x_y['num_qbs'] == 2)].copy()
+    qb_x_y_two_qbs['y_diff'] = abs(qb_x_y_two_qbs['y'] - qb_x_y_two_qbs['ball_y'])
+    two_qbs_keep = qb_x_y_two_qbs.loc[qb_x_y_two_qbs.groupby(['gameId', 'playId']).y_diff.idxmin()].drop(
+        ['y_diff', 'num_qbs'], axis = 1)
+
+    qb_x_y = pd.concat([qb_x_y_one_qb, two_qbs_keep])
+    qb_x_y['qb_dist_from_ball'] = np.sqrt(np.square(qb_x_y['x'] - qb_x_y['ball_x'])  + np.square(qb_x_y['y'] - qb_x_y['ball_y']))
+    qb_x_y = qb_x_y.rename(columns = {'x': 'qb_x', 'y': 'qb_y', 'team': 'qb_team'})[
+        ['gameId', 'playId', 'qb_x', 'qb_y', 'qb_dist_from_ball', 'qb_team', 'qb_rel_x', 'qb_rel_y']]
+
+    all_dist_prep = pd.merge(ball_snaps_rel, qb_x_y, on = ['gameId', 'playId'])
+    defense_x_y = all_dist_prep[(all_dist_prep['team'].astype(str) != all_dist_prep['qb_team'].astype(str))].copy()
+    defense_x_y['dist_from_qb'] = np.sqrt(np.square(defense_x_y['x'] - defense_x_y['qb_x'])  + np.square(defense_x_y['y'] - defense_x_y['qb_y']))
+    return defense_x_y[DEFENSE_COLUMNS]
+
+
+def by_key(df):
+    return df.sort_values(['gameId', 'playId', 'nflId']).reset_index(drop=True)
+
+
+def test_snap_features_matches_groupby_chain():
+    ball_snaps, ball_loc, players = synthetic_week()
+    with warnings.catch_warnings():
+        warnings.simplefilter('ignore')
+        expected = by_key(reference_snap_features(ball_snaps, ball_loc, players))
+    got = by_key(snap_features(ball_snaps, ball_loc, players))
+    # the plays without a ball row, without linemen or with three QBs are dropped
+    assert set(zip(got['gameId'], got['playId'])) == set(zip(expected['gameId'], expected['playId']))
+    assert len(set(got['playId'])) == 7
+    assert list(got.columns) == DEFENSE_COLUMNS
+    for column in ['gameId', 'playId', 'nflId']:
+        np.testing.assert_array_equal(got[column].to_numpy(dtype='int64'), expected[column].to_numpy(dtype='int64'))
+    assert (got['officialPosition'].astype(str) == expected['officialPosition'].astype(str)).all()
+    for column in DEFENSE_COLUMNS[3:]:
+        if column == 'officialPosition':
+            continue
+        np.testing.assert_allclose(got[column].to_numpy(dtype='float64'), expected[column].to_numpy(dtype='float64'),
+                                   rtol=1e-5, atol=1e-4, err_msg=column)
+
+
+@pytest.fixture
+def groups():
+    rng = np.random.default_rng(1)
+    codes = rng.integers(0, 40, 500)
+    # group 7 never occurs; ties between equal values
+    codes[codes == 7] = 8
+    values = np.round(rng.uniform(-10, 10, 500), 1).astype('float32')
+    return codes, values, 41
+
+
+def test_group_min_max(groups):
+    codes, values, n = groups
+    mn, mx = kernels.group_min_max(codes, values, n)
+    expected = pd.Series(values).groupby(codes).agg(['min', 'max']).reindex(range(n))
+    np.testing.assert_array_equal(mn, expected['min'].to_numpy(dtype='float32'))
+    np.testing.assert_array_equal(mx, expected['max'].to_numpy(dtype='float32'))
+
+
+def test_group_argmin(groups):
+    codes, values, n = groups
+    best = kernels.group_argmin(codes, values, n)
+    expected = pd.Series(values).groupby(codes).idxmin().reindex(range(n), fill_value=-1)
+    np.testing.assert_array_equal(best, expected.to_numpy())
+
+
+def test_group_first(groups):
+    codes, _, n = groups
+    first = kernels.group_first(codes, n)
+    expected = pd.Series(np.arange(len(codes))).groupby(codes).first().reindex(range(n), fill_value=-1)
+    np.testing.assert_array_equal(first, expected.to_numpy())
@@ -0,0 +1,38 @@
+import os
+
+import numpy as np
+import pandas as pd
+
+from hackasack import frame_store
+
+
+def tracking(plays):
+    rows = []
+    for play in range(1, plays + 1):
+        for frame in range(1, 4):
+            for nfl_id in [101, 102, None]:
+                rows.append({'gameId': 1, 'playId': play, 'nflId': nfl_id, 'frameId': frame, 'time': '',
+                             'jerseyNumber': 9.0, 'team': 'football' if nfl_id is None else 'KC',
+                             'playDirection': 'left', 'x': 10.0 + frame, 'y': 20.0, 's': 1.0, 'a': 0.5,
+                             'dis': 0.1, 'o': 90.0, 'dir': 180.0, 'event': 'ball_snap' if frame == 2 else 'None'})
+    return pd.DataFrame(rows)
+
+
+def test_convert_week_follows_its_csv(tmp_path):
+    csv_path = str(tmp_path / 'week3.csv')
+    store_dir = str(tmp_path / 'frames')
+    tracking(4).to_csv(csv_path, index=False)
+    root = frame_store.convert_week(csv_path, store_dir, 3, chunksize=10)
+    assert len(frame_store.FrameStore(root)) == 36
+    # An unchanged csv reuses the store
+    built = os.stat(os.path.join(root, 'meta.json')).st_mtime_ns
+    frame_store.convert_week(csv_path, store_dir, 3, chunksize=10)
+    assert os.stat(os.path.join(root, 'meta.json')).st_mtime_ns == built
+
+    # A corrected csv is converted again
+    tracking(3).to_csv(csv_path, index=False)
+    os.utime(csv_path, ns=(built + 10**9, built + 10**9))
+    store = frame_store.FrameStore(frame_store.convert_week(csv_path, store_dir, 3, chunksize=10))
+    assert len(store) == 27
+    assert store.index['playId'].tolist() == [1, 2, 3]
+    np.testing.assert_array_equal(store.play(1, 3)['frameId'], [1, 1, 1, 2, 2, 2, 3, 3, 3])
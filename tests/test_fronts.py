@@ -0,0 +1,64 @@
+import os
+
+import numpy as np
+import pandas as pd
+
+from hackasack import feature_schema, fronts
+
+import old_main
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+POSITIONS = ['DE', 'DT', 'NT', 'DE', 'OLB', 'MLB', 'ILB', 'CB', 'CB', 'FS', 'SS']
+
+# yardsToGo, absoluteYardlineNumber, defendersInBox, personnelO, personnelD, hash, down, offenseFormation
+SITUATIONS = [
+    (10, 35, 6, '11', '4-2-5', 'Middle', '1', 'Shotgun'),
+    (3, 80, 7, '12*', '3-4-4', 'Left', '3', 'I Formation'),
+    (1, 99, 8, '22', '1-5-5', 'Right', '4', 'Jumbo'),
+    (7, 50, 6, '10', '2-3-6', 'Left Hash', '2', 'Empty'),
+    (15, 20, 5, '01', '4-1-6', 'Right Hash', 2.0, 'Pistol'),
+    (4, 60, 7, '99', '5-5-1', 'Middle', 1, 'Singleback'),
+    (2, 95, 9, '13', '4-3-4', 'Left', 4, 'Wildcat'),
+]
+
+
+def reference_row(yardsToGo, absoluteYardlineNumber, defendersInBox, o_dropdown, d_dropdown, the_hash, down,
+                  offenseFormation, rel_x, rel_y, position, slot):
+    # One defender's x_i as main.py put it together before fronts.py
+    num_rb, num_te, num_wr = old_main.o_personnel(o_dropdown)
+    num_dl, num_lb, num_db = old_main.d_personnel(d_dropdown)
+    formations, qb_dist_from_ball, qb_rel_x, qb_rel_y, dist_from_qb = old_main.formation(
+        offenseFormation, rel_x, rel_y)
+    s, a = fronts.SLOT_MOTION[slot]
+    return ([yardsToGo, absoluteYardlineNumber, defendersInBox, num_rb, num_te, num_wr, num_dl, num_lb, num_db,
+             rel_x, rel_y, s, a, absoluteYardlineNumber, old_main.ball_y(the_hash), -2.61, 3.0, 5.61,
+             qb_dist_from_ball, qb_rel_x, qb_rel_y, dist_from_qb]
+            + list(old_main.downs(down)) + list(old_main.positions(position))
+            + list(formations))
+
+
+def test_feature_matrix_matches_main_rows():
+    schema = feature_schema.load(feature_schema.schema_path(os.path.join(ROOT, 'xgb_sack')))
+    rng = np.random.default_rng(7)
+    stack, expected = [], []
+    for situation in SITUATIONS:
+        rel_x = np.round(rng.uniform(0, 15, 11), 1)
+        rel_y = np.round(rng.uniform(-20, 20, 11), 1)
+        stack.append(fronts.front(*situation, rel_x, rel_y, POSITIONS))
+        expected += [reference_row(*situation, rel_x[slot], rel_y[slot], POSITIONS[slot], slot)
+                     for slot in range(11)]
+    X = fronts.feature_matrix(fronts.model_columns(pd.concat(stack, ignore_index=True)), schema)
+    np.testing.assert_allclose(X, np.array(expected, dtype='float32'), rtol=1e-6)
+
+
+def test_technique_fronts_match_page_two():
+    # Page 2 places defenders by technique and side; from_records does the same for the API
+    techniques = ['0', '1', '2i', '3', '4i', '5', '6', '7/9', 'Wide 7/9', 'Slot', 'Wide']
+    sides = ['L', 'R', 'L', 'R', 'L', 'R', 'L', 'R', 'L', 'R', 'L']
+    record = dict(zip(fronts.SITUATION_COLUMNS, SITUATIONS[0]), down=1)
+    record['defenders'] = [{'officialPosition': position, 'depth': 1.0, 'technique': tech, 'side': side}
+                           for position, tech, side in zip(POSITIONS, techniques, sides)]
+    rel_y = fronts.from_records([record])['rel_y'].to_numpy()
+    np.testing.assert_array_equal(rel_y, [old_main.technique_rel_y(tech, side)
+                                          for tech, side in zip(techniques, sides)])
@@ -0,0 +1,49 @@
+import os
+
+from hackasack import memo
+from hackasack.memo import CallbackMemo
+
+
+def counted(cache):
+    calls = []
+
+    @cache
+    def square(x):
+        calls.append(x)
+        return x * x
+    return square, calls
+
+
+def test_ttl_and_lru(monkeypatch):
+    now = [100.0]
+    monkeypatch.setattr(memo.time, 'monotonic', lambda: now[0])
+    cache = CallbackMemo(max_entries=2, ttl=10)
+    square, calls = counted(cache)
+    assert [square(2), square(2), square(3)] == [4, 4, 9]
+    assert calls == [2, 3]
+    now[0] += 11
+    square(2)
+    assert calls == [2, 3, 2]
+    # 3 expired too; 4 pushes out the least recently used entry (3)
+    square(4)
+    assert cache.stats()['evictions'] == 1 and cache.stats()['entries'] == 2
+    square(2)
+    assert calls == [2, 3, 2, 4]
+
+
+def test_watched_file_change_clears(tmp_path):
+    model = tmp_path / 'xgb_sack'
+    model.write_bytes(b'one')
+    cache = CallbackMemo(watch=[str(model)])
+    square, calls = counted(cache)
+    square(2)
+    square(2)
+    assert calls == [2]
+    model.write_bytes(b'two!')
+    stat = os.stat(model)
+    os.utime(model, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+    square(2)
+    assert calls == [2, 2] and cache.stats()['invalidations'] == 1
+    model.unlink()
+    square(2)
+    assert calls == [2, 2, 2] and cache.stats()['invalidations'] == 2
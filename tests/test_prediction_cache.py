@@ -0,0 +1,89 @@
+import numpy as np
+
+from hackasack import prediction_cache
+from hackasack.prediction_cache import PredictionCache, RedisPredictionCache
+
+
+class Booster:
+    # Row sums, counting the rows it was asked for
+    def __init__(self):
+        self.rows = 0
+
+    def inplace_predict(self, X):
+        self.rows += len(X)
+        return X.sum(axis=1)
+
+
+def rows(*values):
+    return np.array(values, dtype='float32')[:, None]
+
+
+def test_lru_eviction():
+    entry = 8 + prediction_cache.ENTRY_OVERHEAD
+    cache = PredictionCache(5 * entry)
+    booster = Booster()
+    cache.predict(booster, rows(0, 1, 2, 3, 4))
+    # Row 0 is used again, so rows 1 and 2 are the oldest when 5 and 6 come in
+    cache.predict(booster, rows(0))
+    cache.predict(booster, rows(5, 6))
+    stats = cache.stats()
+    assert stats['entries'] == 5 and stats['evictions'] == 2 and stats['bytes'] <= 5 * entry
+    booster.rows = 0
+    cache.predict(booster, rows(0, 3, 4, 5, 6))
+    assert booster.rows == 0
+    cache.predict(booster, rows(1))
+    assert booster.rows == 1
+
+
+def redis_cache(**kwargs):
+    import fakeredis
+    server = fakeredis.FakeServer()
+    client = fakeredis.FakeRedis(server=server)
+    return server, client, RedisPredictionCache(client=client, fallback=PredictionCache(1 << 20), **kwargs)
+
+
+def test_redis_round_trip():
+    _, client, cache = redis_cache(namespace=b'a')
+    booster = Booster()
+    X = np.array([[1.0, 2.0], [3.0, 4.0], [5.0, 6.0]], dtype='float32')
+    first = cache.predict(booster, X)
+    assert sorted(client.keys()) == sorted(cache.keys(X))
+    assert all(key.startswith(b'hackasack:a:') for key in client.keys())
+    # Read back with one MGET, within the quantization of the rows
+    second = cache.predict(booster, X + 0.001)
+    np.testing.assert_array_equal(first, second)
+    assert booster.rows == 3
+    assert cache.stats()['hits'] == 3
+    # Vector values (contributions) round-trip too
+    contribs = prediction_cache.cached_rows(cache, X, lambda rows: np.tile(rows, 2), width=4, tag=b'c:')
+    np.testing.assert_array_equal(prediction_cache.cached_rows(cache, X, None, width=4, tag=b'c:'), contribs)
+
+
+def test_redis_namespace_switch():
+    _, client, cache = redis_cache(namespace=b'a')
+    booster = Booster()
+    X = rows(1, 2)
+    cache.predict(booster, X)
+    cache.set_namespace(b'b')
+    cache.predict(booster, X)
+    assert booster.rows == 4
+    assert len(client.keys(b'hackasack:a:*')) == 2 and len(client.keys(b'hackasack:b:*')) == 2
+    cache.set_namespace(b'a')
+    cache.predict(booster, X)
+    assert booster.rows == 4
+
+
+def test_redis_falls_back_while_unreachable():
+    server, client, cache = redis_cache(retry_after=60)
+    booster = Booster()
+    server.connected = False
+    cache.predict(booster, rows(1, 2))
+    assert cache.stats()['errors'] == 1 and not cache.available()
+    # Served by the in-process cache without trying the store again
+    cache.predict(booster, rows(1, 2))
+    assert booster.rows == 2
+    assert cache.stats()['errors'] == 1 and cache.stats()['fallback']['hits'] == 2
+    server.connected = True
+    cache.down_until = 0.0
+    cache.predict(booster, rows(1, 2))
+    assert booster.rows == 4 and len(client.keys()) == 2
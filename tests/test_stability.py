@@ -0,0 +1,19 @@
+import warnings
+
+import numpy as np
+
+from hackasack.stability import masked_corr
+
+
+def test_masked_corr():
+    rng = np.random.default_rng(0)
+    x, y = rng.random((4, 30)), rng.random((4, 30))
+    valid = rng.random((4, 30)) > 0.3
+    valid[2] = False
+    valid[3, 1:] = False
+    with warnings.catch_warnings():
+        warnings.simplefilter('error')
+        r = masked_corr(x, y, valid)
+    for i in range(2):
+        np.testing.assert_allclose(r[i], np.corrcoef(x[i, valid[i]], y[i, valid[i]])[0, 1])
+    assert np.isnan(r[2:]).all()